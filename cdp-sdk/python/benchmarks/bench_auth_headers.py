@@ -0,0 +1,93 @@
+"""Benchmark the per-request cost of building authentication headers.
+
+Compares the public ``get_auth_headers`` path, which validates pydantic option models and
+parses the keys on every call, with the signer-based path used by ``CdpApiClient``.
+
+The ``overhead`` rows replace ES256 signing with a no-op so that only the work around signing
+(option models, key parsing, header assembly) is measured.
+
+Usage:
+    uv run python benchmarks/bench_auth_headers.py [--iterations N]
+"""
+
+import argparse
+import base64
+import timeit
+from contextlib import ExitStack
+from unittest.mock import patch
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+
+from cdp.auth.utils.http import GetAuthHeadersOptions, _get_auth_headers, get_auth_headers
+from cdp.auth.utils.jwt import JwtSigner, WalletJwtSigner
+
+HOST = "api.cdp.coinbase.com"
+PATH = "/platform/v2/evm/accounts"
+BODY = {"name": "benchmark-account", "accountPolicy": "00000000-0000-0000-0000-000000000000"}
+
+
+def _create_keys() -> tuple[str, str]:
+    """Create a PEM API key secret and a base64 DER wallet secret."""
+    api_key = ec.generate_private_key(ec.SECP256R1())
+    api_key_secret = api_key.private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption(),
+    ).decode()
+    wallet_key = ec.generate_private_key(ec.SECP256R1())
+    wallet_secret = base64.b64encode(
+        wallet_key.private_bytes(
+            encoding=serialization.Encoding.DER,
+            format=serialization.PrivateFormat.PKCS8,
+            encryption_algorithm=serialization.NoEncryption(),
+        )
+    ).decode()
+    return api_key_secret, wallet_secret
+
+
+def main() -> None:
+    """Run the benchmark and print the mean time per call."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+
+    api_key_secret, wallet_secret = _create_keys()
+    signer = JwtSigner("benchmark-key-id", api_key_secret)
+    wallet_signer = WalletJwtSigner(wallet_secret)
+
+    def public_path(method: str) -> None:
+        get_auth_headers(
+            GetAuthHeadersOptions(
+                api_key_id="benchmark-key-id",
+                api_key_secret=api_key_secret,
+                request_method=method,
+                request_host=HOST,
+                request_path=PATH,
+                request_body=BODY,
+                wallet_secret=wallet_secret,
+            )
+        )
+
+    def client_path(method: str) -> None:
+        _get_auth_headers(signer, wallet_signer, method, HOST, PATH, BODY)
+
+    print(f"{'mode':<10}{'method':<8}{'get_auth_headers':>20}{'_get_auth_headers':>20}")
+    for mode in ("full", "overhead"):
+        with ExitStack() as stack:
+            if mode == "overhead":
+                stack.enter_context(
+                    patch("cdp.auth.utils.jwt.jwt.encode", return_value="header.claims.signature")
+                )
+            for method in ("GET", "POST"):
+                public = timeit.timeit(lambda m=method: public_path(m), number=args.iterations)
+                client = timeit.timeit(lambda m=method: client_path(m), number=args.iterations)
+                print(
+                    f"{mode:<10}{method:<8}"
+                    f"{public / args.iterations * 1e6:>17.1f} us"
+                    f"{client / args.iterations * 1e6:>17.1f} us"
+                )
+
+
+if __name__ == "__main__":
+    main()
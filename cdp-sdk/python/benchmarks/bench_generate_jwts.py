@@ -0,0 +1,84 @@
+"""Benchmark the throughput of batch JWT generation.
+
+Compares one ``generate_jwt`` call per token with ``generate_jwts`` signing the whole batch
+inline and in a process pool, for ES256 (EC) and EdDSA (Ed25519) API keys.
+
+Usage:
+    uv run python benchmarks/bench_generate_jwts.py [--tokens N] [--workers N]
+"""
+
+import argparse
+import base64
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519
+
+from cdp.auth.utils.jwt import JwtOptions, generate_jwt, generate_jwts
+
+HOST = "api.cdp.coinbase.com"
+
+
+def _create_keys() -> dict[str, str]:
+    """Create a PEM EC API key secret and a base64 Ed25519 API key secret."""
+    ec_secret = (
+        ec.generate_private_key(ec.SECP256R1())
+        .private_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PrivateFormat.PKCS8,
+            encryption_algorithm=serialization.NoEncryption(),
+        )
+        .decode()
+    )
+    ed25519_key = ed25519.Ed25519PrivateKey.generate()
+    seed = ed25519_key.private_bytes(
+        encoding=serialization.Encoding.Raw,
+        format=serialization.PrivateFormat.Raw,
+        encryption_algorithm=serialization.NoEncryption(),
+    )
+    public_key = ed25519_key.public_key().public_bytes(
+        encoding=serialization.Encoding.Raw, format=serialization.PublicFormat.Raw
+    )
+    return {"ES256": ec_secret, "EdDSA": base64.b64encode(seed + public_key).decode()}
+
+
+def main() -> None:
+    """Run the benchmark and print the number of tokens signed per second."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tokens", type=int, default=5000)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        # Start the worker processes before measuring.
+        list(executor.map(abs, range(args.workers)))
+
+        print(f"{'algorithm':<11}{'generate_jwt':>16}{'generate_jwts':>16}{'process pool':>16}")
+        for algorithm, api_key_secret in _create_keys().items():
+            options = [
+                JwtOptions(
+                    api_key_id="benchmark-key-id",
+                    api_key_secret=api_key_secret,
+                    request_method="GET",
+                    request_host=HOST,
+                    request_path=f"/platform/v2/evm/accounts/0x{i:040x}/balances",
+                )
+                for i in range(args.tokens)
+            ]
+            modes = {
+                "generate_jwt": lambda o=options: [generate_jwt(option) for option in o],
+                "generate_jwts": lambda o=options: generate_jwts(o),
+                "process pool": lambda o=options: generate_jwts(o, executor=executor),
+            }
+
+            rates = []
+            for run in modes.values():
+                start = time.perf_counter()
+                run()
+                rates.append(args.tokens / (time.perf_counter() - start))
+            print(f"{algorithm:<11}" + "".join(f"{rate:>12.0f} /s " for rate in rates))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Benchmark the time and memory it takes to import the SDK.
+
+Each import runs in a fresh interpreter, as on a serverless cold start, and the median wall
+time of the import and the median peak RSS of the interpreter are reported. ``--max-ms`` turns
+the benchmark into a regression check: it exits with an error when ``import cdp`` takes longer.
+
+Usage:
+    uv run python benchmarks/bench_import_time.py [--runs N] [--max-ms MS]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+IMPORTS = [
+    "import cdp",
+    "from cdp import RetryPolicy",
+    "from cdp.openapi_client.models.evm_account import EvmAccount",
+    "import cdp.openapi_client",
+    "from cdp import CdpClient",
+]
+
+# Runs in the fresh interpreter: imports the statement and prints its time and peak RSS.
+_CHILD = """
+import json, resource, sys, time
+start = time.perf_counter()
+exec(sys.argv[1])
+elapsed = time.perf_counter() - start
+max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+# ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+scale = 1 if sys.platform == "darwin" else 1024
+print(json.dumps({"ms": elapsed * 1000, "rss": max_rss * scale}))
+"""
+
+
+def _measure(statement: str, runs: int) -> tuple[float, float]:
+    """Get the median import time in milliseconds and peak RSS in megabytes of a statement."""
+    times = []
+    peaks = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", _CHILD, statement],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        result = json.loads(output.splitlines()[-1])
+        times.append(result["ms"])
+        peaks.append(result["rss"] / 2**20)
+    return statistics.median(times), statistics.median(peaks)
+
+
+def main() -> None:
+    """Run the benchmark and print the median time and peak RSS of each import."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--max-ms", type=float, default=None)
+    args = parser.parse_args()
+
+    print(f"{'import':<64}{'time':>12}{'peak RSS':>12}")
+    results = {}
+    for statement in IMPORTS:
+        results[statement] = _measure(statement, args.runs)
+        ms, rss = results[statement]
+        print(f"{statement:<64}{ms:>9.1f} ms{rss:>9.1f} MB")
+
+    if args.max_ms is not None and results["import cdp"][0] > args.max_ms:
+        sys.exit(f"import cdp took {results['import cdp'][0]:.1f} ms, over {args.max_ms} ms")
+
+
+if __name__ == "__main__":
+    main()
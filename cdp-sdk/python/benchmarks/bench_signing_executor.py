@@ -0,0 +1,113 @@
+"""Benchmark event loop lag while many coroutines sign requests concurrently.
+
+Runs bursts of concurrent requests through ``CdpApiClient._get_request_auth_headers`` with a
+simulated network round trip, while a probe coroutine measures how late the event loop wakes
+it up. Compares signing on the loop with signing in a thread pool and in a process pool.
+
+Usage:
+    uv run python benchmarks/bench_signing_executor.py [--concurrency N] [--bursts N]
+"""
+
+import argparse
+import asyncio
+import base64
+import statistics
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+
+from cdp.openapi_client.cdp_api_client import CdpApiClient
+
+PROBE_INTERVAL = 0.001
+HOST = "api.cdp.coinbase.com"
+
+
+def _create_keys() -> tuple[str, str]:
+    """Create a PEM API key secret and a base64 DER wallet secret."""
+    api_key_secret = (
+        ec.generate_private_key(ec.SECP256R1())
+        .private_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PrivateFormat.PKCS8,
+            encryption_algorithm=serialization.NoEncryption(),
+        )
+        .decode()
+    )
+    wallet_secret = base64.b64encode(
+        ec.generate_private_key(ec.SECP256R1()).private_bytes(
+            encoding=serialization.Encoding.DER,
+            format=serialization.PrivateFormat.PKCS8,
+            encryption_algorithm=serialization.NoEncryption(),
+        )
+    ).decode()
+    return api_key_secret, wallet_secret
+
+
+async def _probe(lags: list[float], stop: asyncio.Event) -> None:
+    """Record how much later than requested the event loop resumes a sleeping coroutine."""
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(PROBE_INTERVAL)
+        lags.append(time.perf_counter() - start - PROBE_INTERVAL)
+
+
+async def _run(
+    executor: Executor | None, concurrency: int, bursts: int, keys: tuple[str, str]
+) -> tuple[list[float], float]:
+    """Run the bursts and return the probe lags and the total duration."""
+    client = CdpApiClient("benchmark-key-id", *keys, signing_executor=executor)
+
+    async def request(i: int) -> None:
+        method, path = ("POST", "/platform/v2/evm/accounts") if i % 2 else ("GET", f"/v2/{i}")
+        await client._get_request_auth_headers(method, HOST, path, {"name": f"account-{i}"})
+        await asyncio.sleep(0.005)  # Simulated network round trip
+
+    # Warm up the signers, including the ones in worker processes.
+    await asyncio.gather(*(request(i) for i in range(8)))
+
+    lags: list[float] = []
+    stop = asyncio.Event()
+    probe = asyncio.create_task(_probe(lags, stop))
+    start = time.perf_counter()
+    for _ in range(bursts):
+        await asyncio.gather(*(request(i) for i in range(concurrency)))
+    duration = time.perf_counter() - start
+    stop.set()
+    await probe
+    await client.close()
+    return lags, duration
+
+
+def main() -> None:
+    """Run the benchmark and print loop lag statistics per signing mode."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--concurrency", type=int, default=500)
+    parser.add_argument("--bursts", type=int, default=5)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    keys = _create_keys()
+    modes: dict[str, Executor | None] = {
+        "event loop": None,
+        "thread pool": ThreadPoolExecutor(max_workers=args.workers),
+        "process pool": ProcessPoolExecutor(max_workers=args.workers),
+    }
+
+    print(f"{'mode':<14}{'p50 lag':>12}{'p99 lag':>12}{'max lag':>12}{'duration':>12}")
+    for name, executor in modes.items():
+        lags, duration = asyncio.run(_run(executor, args.concurrency, args.bursts, keys))
+        if executor is not None:
+            executor.shutdown()
+        lags.sort()
+        p50 = statistics.median(lags)
+        p99 = lags[int(len(lags) * 0.99) - 1]
+        print(
+            f"{name:<14}{p50 * 1e3:>9.2f} ms{p99 * 1e3:>9.2f} ms"
+            f"{lags[-1] * 1e3:>9.2f} ms{duration:>10.2f} s"
+        )
+
+
+if __name__ == "__main__":
+    main()
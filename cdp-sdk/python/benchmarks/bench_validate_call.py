@@ -0,0 +1,104 @@
+"""Benchmark the per-call cost of pydantic argument validation on the generated API methods.
+
+Compares generated API methods as decorated with ``validate_call`` with the same methods after
+``skip_call_validation``, as used by ``CdpClient(validate_api_calls=False)``. Requests are not
+sent: the API client answers every call with an empty response, so the rows measure the work
+done before and after the request (argument validation, request serialization, header
+assembly).
+
+Usage:
+    uv run python benchmarks/bench_validate_call.py [--iterations N]
+"""
+
+import argparse
+import asyncio
+import time
+from types import SimpleNamespace
+
+from cdp.api_clients import skip_call_validation
+from cdp.openapi_client.api.evm_accounts_api import EVMAccountsApi
+from cdp.openapi_client.api.evm_smart_accounts_api import EVMSmartAccountsApi
+from cdp.openapi_client.api_client import ApiClient
+from cdp.openapi_client.models.evm_call import EvmCall
+from cdp.openapi_client.models.prepare_user_operation_request import (
+    PrepareUserOperationRequest,
+)
+from cdp.openapi_client.models.sign_evm_transaction_request import SignEvmTransactionRequest
+
+ADDRESS = "0x" + "1" * 40
+IDEMPOTENCY_KEY = "00000000-0000-4000-8000-000000000000"
+
+
+class _Response:
+    """An empty response."""
+
+    async def read(self) -> bytes:
+        return b""
+
+
+class _OfflineApiClient(ApiClient):
+    """An API client that answers every request without sending it."""
+
+    async def call_api(self, *args, **kwargs) -> _Response:
+        return _Response()
+
+    def response_deserialize(self, response_data, response_types_map=None) -> SimpleNamespace:
+        return SimpleNamespace(data=None)
+
+
+async def _time_calls(call, iterations: int) -> float:
+    """Get the mean time of a call, in seconds."""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        await call()
+    return (time.perf_counter() - start) / iterations
+
+
+async def _run(iterations: int) -> None:
+    """Run the benchmark and print the mean time per call."""
+    api_client = _OfflineApiClient()
+    sign_request = SignEvmTransactionRequest(transaction="0x" + "ab" * 100)
+    user_operation_request = PrepareUserOperationRequest(
+        network="base-sepolia",
+        calls=[EvmCall(to=ADDRESS, value=str(i), data="0x") for i in range(10)],
+    )
+
+    def calls(evm_accounts: EVMAccountsApi, smart_accounts: EVMSmartAccountsApi) -> dict:
+        return {
+            "get_evm_account": lambda: evm_accounts.get_evm_account(ADDRESS),
+            "sign_evm_transaction": lambda: evm_accounts.sign_evm_transaction(
+                ADDRESS, "wallet-jwt", IDEMPOTENCY_KEY, sign_request
+            ),
+            "prepare_user_operation": lambda: smart_accounts.prepare_user_operation(
+                ADDRESS, user_operation_request
+            ),
+        }
+
+    validated = calls(EVMAccountsApi(api_client), EVMSmartAccountsApi(api_client))
+    unvalidated = calls(
+        skip_call_validation(EVMAccountsApi(api_client)),
+        skip_call_validation(EVMSmartAccountsApi(api_client)),
+    )
+
+    print(f"{'method':<24}{'validated':>14}{'unvalidated':>14}{'saved':>14}")
+    for name in validated:
+        with_validation = await _time_calls(validated[name], iterations)
+        without_validation = await _time_calls(unvalidated[name], iterations)
+        print(
+            f"{name:<24}"
+            f"{with_validation * 1e6:>11.1f} us"
+            f"{without_validation * 1e6:>11.1f} us"
+            f"{(with_validation - without_validation) * 1e6:>11.1f} us"
+        )
+
+
+def main() -> None:
+    """Parse the arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=5000)
+    args = parser.parse_args()
+    asyncio.run(_run(args.iterations))
+
+
+if __name__ == "__main__":
+    main()
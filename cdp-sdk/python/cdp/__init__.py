@@ -1,22 +1,161 @@
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from cdp.__version__ import __version__
-from cdp.cdp_client import CdpClient
-from cdp.evm_call_types import ContractCall, EncodedCall, FunctionCall
-from cdp.evm_local_account import EvmLocalAccount
-from cdp.evm_server_account import EvmServerAccount
-from cdp.evm_smart_account import EvmSmartAccount
-from cdp.evm_transaction_types import TransactionRequestEIP1559
-from cdp.update_account_types import UpdateAccountOptions
-from cdp.utils import parse_units
+
+# The module of each name exported by the package. Modules are imported on first access, so
+# that `import cdp` does not load web3, eth_account, solana or the generated API client until
+# a feature that needs them is used.
+_LAZY_IMPORTS = {
+    "CacheBackend": "cdp.cache",
+    "DiskCacheBackend": "cdp.cache",
+    "MemoryCacheBackend": "cdp.cache",
+    "ReadCache": "cdp.cache",
+    "CdpClient": "cdp.cdp_client",
+    "ContractCall": "cdp.evm_call_types",
+    "EncodedCall": "cdp.evm_call_types",
+    "FunctionCall": "cdp.evm_call_types",
+    "EvmLocalAccount": "cdp.evm_local_account",
+    "EvmServerAccount": "cdp.evm_server_account",
+    "EvmSmartAccount": "cdp.evm_smart_account",
+    "TransactionRequestEIP1559": "cdp.evm_transaction_types",
+    "CircuitBreaker": "cdp.openapi_client.circuit_breaker",
+    "CircuitBreakerConfig": "cdp.openapi_client.circuit_breaker",
+    "CircuitMetrics": "cdp.openapi_client.circuit_breaker",
+    "CircuitOpenError": "cdp.openapi_client.circuit_breaker",
+    "JsonCodec": "cdp.openapi_client.codec",
+    "OrjsonCodec": "cdp.openapi_client.codec",
+    "get_default_json_codec": "cdp.openapi_client.codec",
+    "Hedger": "cdp.openapi_client.hedging",
+    "HedgingConfig": "cdp.openapi_client.hedging",
+    "HedgingMetrics": "cdp.openapi_client.hedging",
+    "RateLimiter": "cdp.openapi_client.rate_limit",
+    "RateLimitGroup": "cdp.openapi_client.rate_limit",
+    "RetryBudget": "cdp.openapi_client.retry",
+    "RetryPolicy": "cdp.openapi_client.retry",
+    "TimeoutConfig": "cdp.openapi_client.transport",
+    "TransportConfig": "cdp.openapi_client.transport",
+    "TransportRegistry": "cdp.openapi_client.transport",
+    "get_default_transport_registry": "cdp.openapi_client.transport",
+    "UpdateAccountOptions": "cdp.update_account_types",
+    "parse_units": "cdp.utils",
+}
+
+# Submodules that `import cdp` used to load eagerly, so that code reaching them as attributes
+# of the package, e.g. `cdp.auth.get_auth_headers`, keeps working without importing them first.
+_LAZY_IMPORTS.update(
+    {
+        name: f"cdp.{name}"
+        for name in (
+            "actions",
+            "analytics",
+            "api_clients",
+            "auth",
+            "cdp_client",
+            "constants",
+            "evm_call_types",
+            "evm_client",
+            "evm_local_account",
+            "evm_server_account",
+            "evm_smart_account",
+            "evm_token_balances",
+            "evm_transaction_types",
+            "export",
+            "openapi_client",
+            "policies",
+            "policies_client",
+            "solana_account",
+            "solana_client",
+            "update_account_types",
+            "utils",
+        )
+    }
+)
+
+if TYPE_CHECKING:
+    from cdp.cache import CacheBackend, DiskCacheBackend, MemoryCacheBackend, ReadCache
+    from cdp.cdp_client import CdpClient
+    from cdp.evm_call_types import ContractCall, EncodedCall, FunctionCall
+    from cdp.evm_local_account import EvmLocalAccount
+    from cdp.evm_server_account import EvmServerAccount
+    from cdp.evm_smart_account import EvmSmartAccount
+    from cdp.evm_transaction_types import TransactionRequestEIP1559
+    from cdp.openapi_client.circuit_breaker import (
+        CircuitBreaker,
+        CircuitBreakerConfig,
+        CircuitMetrics,
+        CircuitOpenError,
+    )
+    from cdp.openapi_client.codec import JsonCodec, OrjsonCodec, get_default_json_codec
+    from cdp.openapi_client.hedging import Hedger, HedgingConfig, HedgingMetrics
+    from cdp.openapi_client.rate_limit import RateLimiter, RateLimitGroup
+    from cdp.openapi_client.retry import RetryBudget, RetryPolicy
+    from cdp.openapi_client.transport import (
+        TimeoutConfig,
+        TransportConfig,
+        TransportRegistry,
+        get_default_transport_registry,
+    )
+    from cdp.update_account_types import UpdateAccountOptions
+    from cdp.utils import parse_units
+
+
+def __getattr__(name: str) -> Any:
+    """Import an exported name on first access.
+
+    Args:
+        name: The name to import
+
+    Returns:
+        The imported class, function or submodule
+
+    """
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = importlib.import_module(module)
+    if module != f"{__name__}.{name}":
+        value = getattr(value, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the names of the package, including those not imported yet."""
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
 
 __all__ = [
+    "CacheBackend",
     "CdpClient",
+    "CircuitBreaker",
+    "CircuitBreakerConfig",
+    "CircuitMetrics",
+    "CircuitOpenError",
     "ContractCall",
+    "DiskCacheBackend",
     "EncodedCall",
     "EvmServerAccount",
     "EvmSmartAccount",
     "EvmLocalAccount",
     "FunctionCall",
+    "Hedger",
+    "HedgingConfig",
+    "HedgingMetrics",
+    "JsonCodec",
+    "OrjsonCodec",
+    "MemoryCacheBackend",
+    "RateLimiter",
+    "RateLimitGroup",
+    "ReadCache",
+    "RetryBudget",
+    "RetryPolicy",
     "TransactionRequestEIP1559",
+    "TimeoutConfig",
+    "TransportConfig",
+    "TransportRegistry",
+    "get_default_json_codec",
+    "get_default_transport_registry",
     "parse_units",
     "UpdateAccountOptions",
     "__version__",
@@ -1,3 +1,6 @@
+from types import MethodType
+from typing import TypeVar
+
 from cdp.openapi_client.api.evm_accounts_api import EVMAccountsApi
 from cdp.openapi_client.api.evm_smart_accounts_api import EVMSmartAccountsApi
 from cdp.openapi_client.api.evm_swaps_api import EVMSwapsApi
@@ -8,6 +11,29 @@ from cdp.openapi_client.api.policy_engine_api import PolicyEngineApi
 from cdp.openapi_client.api.solana_accounts_api import SolanaAccountsApi
 from cdp.openapi_client.cdp_api_client import CdpApiClient
 
+Api = TypeVar("Api")
+
+
+def skip_call_validation(api: Api) -> Api:
+    """Make the methods of a generated API instance skip their argument validation.
+
+    Every generated API method is wrapped in pydantic's ``validate_call``, which validates its
+    arguments on each call. This binds the undecorated functions to the instance instead, so
+    callers that already pass typed values, such as the SDK's own clients, do not pay for it.
+
+    Args:
+        api: The generated API instance
+
+    Returns:
+        The same API instance
+
+    """
+    for name, attr in vars(type(api)).items():
+        raw_function = getattr(attr, "raw_function", None)
+        if raw_function is not None:
+            setattr(api, name, MethodType(raw_function, api))
+    return api
+
 
 class ApiClients:
     """A container class for all API clients used in the CDP SDK.
@@ -17,6 +43,7 @@ class ApiClients:
 
     Attributes:
         _cdp_client (CdpApiClient): The CDP API client used to initialize individual API clients.
+        _validate_calls (bool): Whether the API methods validate their arguments.
         _evm_accounts (Optional[EVMAccountsApi]): The EVMAccountsApi client instance.
         _evm_smart_accounts (Optional[EVMSmartAccountsApi]): The EVMSmartAccountsApi client instance.
         _evm_swaps (Optional[EVMSwapsApi]): The EVMSwapsApi client instance.
@@ -26,14 +53,17 @@ class ApiClients:
 
     """
 
-    def __init__(self, cdp_client: CdpApiClient) -> None:
+    def __init__(self, cdp_client: CdpApiClient, validate_calls: bool = True) -> None:
         """Initialize the ApiClients instance.
 
         Args:
             cdp_client (CdpApiClient): The CDP API client to use for initializing individual API clients.
+            validate_calls (bool, optional): Whether the API methods validate their arguments
+                with pydantic on every call. Defaults to True.
 
         """
         self._cdp_client: CdpApiClient = cdp_client
+        self._validate_calls = validate_calls
 
         self._evm_accounts: EVMAccountsApi | None = None
         self._evm_smart_accounts: EVMSmartAccountsApi | None = None
@@ -56,7 +86,7 @@ class ApiClients:
 
         """
         if self._evm_accounts is None:
-            self._evm_accounts = EVMAccountsApi(api_client=self._cdp_client)
+            self._evm_accounts = self._create(EVMAccountsApi)
         return self._evm_accounts
 
     @property
@@ -71,7 +101,7 @@ class ApiClients:
 
         """
         if self._evm_smart_accounts is None:
-            self._evm_smart_accounts = EVMSmartAccountsApi(api_client=self._cdp_client)
+            self._evm_smart_accounts = self._create(EVMSmartAccountsApi)
         return self._evm_smart_accounts
 
     @property
@@ -86,7 +116,7 @@ class ApiClients:
 
         """
         if self._evm_swaps is None:
-            self._evm_swaps = EVMSwapsApi(api_client=self._cdp_client)
+            self._evm_swaps = self._create(EVMSwapsApi)
         return self._evm_swaps
 
     @property
@@ -101,7 +131,7 @@ class ApiClients:
 
         """
         if self._evm_token_balances is None:
-            self._evm_token_balances = EVMTokenBalancesApi(api_client=self._cdp_client)
+            self._evm_token_balances = self._create(EVMTokenBalancesApi)
         return self._evm_token_balances
 
     @property
@@ -116,7 +146,7 @@ class ApiClients:
 
         """
         if self._faucets is None:
-            self._faucets = FaucetsApi(api_client=self._cdp_client)
+            self._faucets = self._create(FaucetsApi)
         return self._faucets
 
     @property
@@ -131,7 +161,7 @@ class ApiClients:
 
         """
         if self._solana_accounts is None:
-            self._solana_accounts = SolanaAccountsApi(api_client=self._cdp_client)
+            self._solana_accounts = self._create(SolanaAccountsApi)
         return self._solana_accounts
 
     @property
@@ -146,7 +176,7 @@ class ApiClients:
 
         """
         if self._policies is None:
-            self._policies = PolicyEngineApi(api_client=self._cdp_client)
+            self._policies = self._create(PolicyEngineApi)
         return self._policies
 
     @property
@@ -161,9 +191,16 @@ class ApiClients:
 
         """
         if self._payments is None:
-            self._payments = PaymentsAlphaApi(api_client=self._cdp_client)
+            self._payments = self._create(PaymentsAlphaApi)
         return self._payments
 
+    def _create(self, api_class: type[Api]) -> Api:
+        """Create an API client instance, skipping argument validation if disabled."""
+        api = api_class(api_client=self._cdp_client)
+        if not self._validate_calls:
+            skip_call_validation(api)
+        return api
+
     async def close(self):
         """Close the CDP client asynchronously."""
         await self._cdp_client.close()
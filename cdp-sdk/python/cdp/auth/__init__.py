@@ -3,26 +3,36 @@
 This package provides authentication utilities and JWT token handling functionality.
 """
 
+from .clients.aiohttp.client import AiohttpAuthClient, AiohttpAuthClientOptions
 from .clients.urllib3.client import Urllib3AuthClient, Urllib3AuthClientOptions
 from .utils.http import GetAuthHeadersOptions, get_auth_headers
 from .utils.jwt import (
     JwtOptions,
+    JwtSigner,
     WalletJwtOptions,
+    WalletJwtSigner,
     generate_jwt,
+    generate_jwts,
     generate_wallet_jwt,
 )
 from .utils.ws import (
     GetWebSocketAuthHeadersOptions,
+    WebSocketAuthHeadersProvider,
     get_websocket_auth_headers,
 )
 
 __all__ = [
     # JWT utils exports
     "generate_jwt",
+    "generate_jwts",
     "generate_wallet_jwt",
     "JwtOptions",
+    "JwtSigner",
     "WalletJwtOptions",
+    "WalletJwtSigner",
     # Client exports
+    "AiohttpAuthClient",
+    "AiohttpAuthClientOptions",
     "Urllib3AuthClient",
     "Urllib3AuthClientOptions",
     # HTTP utils exports
@@ -31,6 +41,7 @@ __all__ = [
     # WebSocket utils exports
     "get_websocket_auth_headers",
     "GetWebSocketAuthHeadersOptions",
+    "WebSocketAuthHeadersProvider",
 ]
 
 """CDP SDK Auth package."""
@@ -4,9 +4,12 @@ This module exports concrete HTTP client implementations for making authenticate
 requests to CDP services.
 """
 
+from cdp.auth.clients.aiohttp.client import AiohttpAuthClient, AiohttpAuthClientOptions
 from cdp.auth.clients.urllib3.client import Urllib3AuthClient, Urllib3AuthClientOptions
 
 __all__ = [
+    "AiohttpAuthClient",
+    "AiohttpAuthClientOptions",
     "Urllib3AuthClient",
     "Urllib3AuthClientOptions",
 ]
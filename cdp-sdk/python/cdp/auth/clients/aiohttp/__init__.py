@@ -0,0 +1,5 @@
+"""Authenticated asyncio HTTP client."""
+
+from .client import AiohttpAuthClient, AiohttpAuthClientOptions
+
+__all__ = ["AiohttpAuthClient", "AiohttpAuthClientOptions"]
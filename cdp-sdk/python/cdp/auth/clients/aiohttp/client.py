@@ -0,0 +1,193 @@
+import json
+import logging
+from typing import Any
+from urllib.parse import urlparse
+
+import aiohttp
+import aiohttp_retry
+
+from cdp.auth.clients.urllib3.client import Urllib3AuthClientOptions, _truncate_body
+from cdp.auth.utils.http import _get_auth_headers, _get_correlation_data
+from cdp.auth.utils.jwt import JwtSigner, WalletJwtSigner
+
+# Add logger
+logger = logging.getLogger(__name__)
+
+# Only safe methods are retried: writes carry single-use Wallet Auth JWTs and are not idempotent.
+RETRY_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+RETRY_STATUSES = frozenset({500, 502, 503, 504})
+
+
+class AiohttpAuthClientOptions(Urllib3AuthClientOptions):
+    """Configuration options for the authenticated asyncio HTTP client.
+
+    Accepts the same fields as Urllib3AuthClientOptions.
+    """
+
+
+class AiohttpAuthClient:
+    """Asynchronous HTTP client that automatically adds authentication headers.
+
+    The asyncio counterpart of Urllib3AuthClient. All requests share one aiohttp session with
+    a pool of keep-alive connections, and the API key and wallet secret are parsed once and
+    reused for signing every request. The session is created on the first request, so the
+    client can be constructed outside of a running event loop. Close the client when done, or
+    use it as an async context manager.
+    """
+
+    def __init__(
+        self,
+        options: AiohttpAuthClientOptions,
+        base_url: str,
+        debug: bool = False,
+        limit: int = 100,
+        limit_per_host: int = 0,
+        max_retries: int = 3,
+    ):
+        """Initialize the authenticated HTTP client.
+
+        Args:
+            options: The authentication configuration options
+            base_url: The base URL for all requests
+            debug: Whether to enable debug logging
+            limit: The maximum number of simultaneous connections
+            limit_per_host: The maximum number of simultaneous connections to one host, or 0
+                for no per-host limit
+            max_retries: The maximum number of retries of GET, HEAD and OPTIONS requests on
+                connection errors and 5xx responses. Set to 0 to disable retries.
+
+        """
+        self.options = options
+        self.base_url = base_url.rstrip("/")
+        self.debug = debug
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.max_retries = max_retries
+
+        self._signer = JwtSigner(options.api_key_id, options.api_key_secret)
+        self._wallet_signer = WalletJwtSigner(options.wallet_secret)
+        self._correlation_context = _get_correlation_data(options.source, options.source_version)
+
+        self._session: aiohttp.ClientSession | None = None
+        self._retry_client: aiohttp_retry.RetryClient | None = None
+
+    async def __aenter__(self) -> "AiohttpAuthClient":
+        """Enter the async context manager."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Close the client when exiting the async context manager."""
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the underlying session and its pooled connections."""
+        if self._retry_client is not None:
+            await self._retry_client.close()
+        elif self._session is not None:
+            await self._session.close()
+        self._session = None
+        self._retry_client = None
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str] | None = None,
+        body: dict[str, Any] | bytes | None = None,
+        **kwargs: Any,
+    ) -> aiohttp.ClientResponse:
+        """Make an authenticated HTTP request.
+
+        The response body is read before returning, so the connection is already back in the
+        pool and ``await response.read()``, ``text()`` or ``json()`` return immediately.
+
+        Args:
+            method: The HTTP method
+            url: The URL to request (relative or absolute)
+            headers: Optional additional headers
+            body: Optional request body (can be a dict for JSON or bytes)
+            **kwargs: Additional arguments passed to aiohttp.ClientSession.request()
+
+        Returns:
+            aiohttp.ClientResponse
+
+        """
+        method = method.upper()
+
+        # Handle relative URLs
+        if not url.startswith("http"):
+            url = f"{self.base_url}/{url.lstrip('/')}"
+
+        # Initialize request headers and body
+        request_headers = dict(headers or {})
+        body_dict = body if isinstance(body, dict) else {}
+        body_bytes = json.dumps(body).encode("utf-8") if isinstance(body, dict) else body
+
+        # Get auth headers
+        parsed_url = urlparse(url)
+        auth_headers = _get_auth_headers(
+            self._signer,
+            self._wallet_signer,
+            method,
+            parsed_url.netloc,
+            parsed_url.path,
+            body_dict,
+            self._correlation_context,
+            expires_in=self.options.expires_in,
+        )
+
+        # Merge headers
+        request_headers.update(auth_headers)
+
+        if self.debug and logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "HTTP Request: %s %s\nHeaders: %s\nBody: %s",
+                method,
+                url,
+                request_headers,
+                _truncate_body(body_bytes),
+            )
+
+        response = await self._get_client().request(
+            method, url, headers=request_headers, data=body_bytes, **kwargs
+        )
+        data = await response.read()
+
+        if self.debug and logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "HTTP Response: %s\nHeaders: %s\nBody: %s",
+                response.status,
+                response.headers,
+                _truncate_body(data),
+            )
+
+        return response
+
+    def _get_client(self) -> aiohttp.ClientSession | aiohttp_retry.RetryClient:
+        """Return the client to send requests with, creating the session on first use.
+
+        Returns:
+            The retrying client, or the plain session if retries are disabled
+
+        """
+        if self._session is None:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self.limit, limit_per_host=self.limit_per_host
+                ),
+                trust_env=True,
+            )
+            if self.max_retries > 0:
+                self._retry_client = aiohttp_retry.RetryClient(
+                    client_session=self._session,
+                    retry_options=aiohttp_retry.ExponentialRetry(
+                        attempts=self.max_retries + 1,
+                        statuses=set(RETRY_STATUSES),
+                        methods=set(RETRY_METHODS),
+                        retry_all_server_errors=False,
+                    ),
+                )
+
+        if self._retry_client is not None:
+            return self._retry_client
+        return self._session
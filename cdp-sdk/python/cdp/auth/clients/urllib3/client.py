@@ -1,16 +1,20 @@
 import json
 import logging
+from collections.abc import Iterator
 from typing import Any
 from urllib.parse import urlparse
 
 import urllib3
 from pydantic import BaseModel, Field
 
-from cdp.auth.utils.http import GetAuthHeadersOptions, get_auth_headers
+from cdp.auth.utils.http import GetAuthHeadersOptions, _get_correlation_data, get_auth_headers
 
 # Add logger
 logger = logging.getLogger(__name__)
 
+# Request and response bodies are truncated to this many bytes in debug logs.
+MAX_LOGGED_BODY_BYTES = 2048
+
 
 class Urllib3AuthClientOptions(BaseModel):
     r"""Configuration options for the authenticated HTTP client.
@@ -65,6 +69,7 @@ class Urllib3AuthClient:
         self.base_url = base_url.rstrip("/")
         self.client = urllib3.PoolManager()
         self.debug = debug
+        self._correlation_context = _get_correlation_data(options.source, options.source_version)
 
     def request(
         self,
@@ -76,6 +81,95 @@ class Urllib3AuthClient:
     ) -> urllib3.HTTPResponse:
         """Make an authenticated HTTP request.
 
+        Args:
+            method: The HTTP method
+            url: The URL to request (relative or absolute)
+            headers: Optional additional headers
+            body: Optional request body (can be a dict for JSON or bytes)
+            **kwargs: Additional arguments passed to urllib3.request()
+
+        Returns:
+            urllib3.HTTPResponse
+
+        """
+        response = self._send(method, url, headers, body, **kwargs)
+
+        if self.debug and logger.isEnabledFor(logging.DEBUG):
+            # Only log what is already in memory: reading a deferred body here would defeat
+            # preload_content=False.
+            logged_body = (
+                _truncate_body(response.data)
+                if kwargs.get("preload_content", True)
+                else "<not preloaded>"
+            )
+            logger.debug(
+                "HTTP Response: %s\nHeaders: %s\nBody: %s",
+                response.status,
+                response.headers,
+                logged_body,
+            )
+
+        return response
+
+    def stream(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str] | None = None,
+        body: dict[str, Any] | bytes | None = None,
+        chunk_size: int = 65536,
+        **kwargs: Any,
+    ) -> Iterator[bytes]:
+        """Make an authenticated HTTP request and yield the response body in chunks.
+
+        The response is not preloaded, so large responses (e.g. exports and long lists) are
+        never held in memory as a whole. The request is sent when iteration starts, and the
+        connection is released back to the pool once the body has been consumed or the
+        generator is closed.
+
+        Args:
+            method: The HTTP method
+            url: The URL to request (relative or absolute)
+            headers: Optional additional headers
+            body: Optional request body (can be a dict for JSON or bytes)
+            chunk_size: The maximum size in bytes of each yielded chunk
+            **kwargs: Additional arguments passed to urllib3.request()
+
+        Yields:
+            The response body in chunks of bytes
+
+        Raises:
+            urllib3.exceptions.HTTPError: If the response status is 400 or higher
+
+        """
+        response = self._send(method, url, headers, body, preload_content=False, **kwargs)
+        try:
+            if self.debug and logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "HTTP Response: %s\nHeaders: %s\nBody: %s",
+                    response.status,
+                    response.headers,
+                    "<streamed>",
+                )
+            if response.status >= 400:
+                raise urllib3.exceptions.HTTPError(
+                    f"{method} {url} failed with status {response.status}: "
+                    f"{_truncate_body(response.read())}"
+                )
+            yield from response.stream(chunk_size)
+        finally:
+            response.release_conn()
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str] | None,
+        body: dict[str, Any] | bytes | None,
+        **kwargs: Any,
+    ) -> urllib3.HTTPResponse:
+        """Sign and send a request, logging it when debugging is enabled.
+
         Args:
             method: The HTTP method
             url: The URL to request (relative or absolute)
@@ -113,28 +207,39 @@ class Urllib3AuthClient:
             )
         )
 
-        # Merge headers
+        # Merge headers, with the Correlation-Context computed when the client was created
         request_headers.update(auth_headers)
+        request_headers["Correlation-Context"] = self._correlation_context
 
-        if self.debug:
+        if self.debug and logger.isEnabledFor(logging.DEBUG):
             logger.debug(
                 "HTTP Request: %s %s\nHeaders: %s\nBody: %s",
                 method,
                 url,
                 request_headers,
-                body_bytes.decode("utf-8") if body_bytes else None,
+                _truncate_body(body_bytes),
             )
 
-        response = self.client.request(
+        return self.client.request(
             method=method, url=url, headers=request_headers, body=body_bytes, **kwargs
         )
 
-        if self.debug:
-            logger.debug(
-                "HTTP Response: %s\nHeaders: %s\nBody: %s",
-                response.status,
-                response.headers,
-                response.data.decode("utf-8"),
-            )
 
-        return response
+def _truncate_body(body: bytes | None) -> str | None:
+    """Decode a request or response body for a debug log, truncated to MAX_LOGGED_BODY_BYTES.
+
+    Args:
+        body: The body
+
+    Returns:
+        The decoded, possibly truncated body, or None if there is no body
+
+    """
+    if not body:
+        return None
+    if len(body) <= MAX_LOGGED_BODY_BYTES:
+        return body.decode("utf-8", errors="replace")
+    return (
+        f"{body[:MAX_LOGGED_BODY_BYTES].decode('utf-8', errors='replace')}"
+        f"... ({len(body)} bytes, truncated)"
+    )
@@ -49,3 +49,24 @@ def ed25519_private_key_factory():
         return base64.b64encode(private_bytes + public_bytes).decode()
 
     return _create_key
+
+
+@pytest.fixture
+def wallet_secret_factory():
+    """Create and return a factory for wallet secrets.
+
+    Returns:
+        callable: A factory function that creates base64-encoded DER EC private keys
+
+    """
+
+    def _create_wallet_secret():
+        private_key = ec.generate_private_key(ec.SECP256R1())
+        der = private_key.private_bytes(
+            encoding=serialization.Encoding.DER,
+            format=serialization.PrivateFormat.PKCS8,
+            encryption_algorithm=serialization.NoEncryption(),
+        )
+        return base64.b64encode(der).decode()
+
+    return _create_wallet_secret
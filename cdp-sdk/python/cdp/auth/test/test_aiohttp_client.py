@@ -0,0 +1,155 @@
+from unittest.mock import patch
+
+import jwt as jwt_lib
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from cdp.auth.clients.aiohttp.client import AiohttpAuthClient, AiohttpAuthClientOptions
+from cdp.auth.utils.jwt import _parse_private_key
+
+
+@pytest_asyncio.fixture
+async def server(api_server_factory):
+    """Start a local server that echoes requests and fails the first request of /flaky."""
+
+    async def echo(request):
+        return web.json_response(
+            {
+                "method": request.method,
+                "path": request.path,
+                "headers": dict(request.headers),
+                "body": await request.text(),
+            }
+        )
+
+    async def flaky(request):
+        attempts = len(_flaky_attempts(server))
+        if attempts == 1:
+            return web.Response(status=503)
+        return web.json_response({"attempts": attempts})
+
+    server = await api_server_factory([("*", "/flaky", flaky), ("*", "/{tail:.*}", echo)])
+    return server
+
+
+def _flaky_attempts(server):
+    """Get the methods of the requests to /flaky."""
+    return [request.method for request in server.requests if request.path == "/flaky"]
+
+
+@pytest.fixture
+def client_options(ec_private_key_factory, wallet_secret_factory):
+    """Create options with real keys for the aiohttp client."""
+    return AiohttpAuthClientOptions(
+        api_key_id="test-key-id",
+        api_key_secret=ec_private_key_factory(),
+        wallet_secret=wallet_secret_factory(),
+        source="test-source",
+    )
+
+
+@pytest.mark.asyncio
+async def test_request_adds_auth_headers(server, client_options):
+    """Test that requests include authentication headers."""
+    # Execute
+    async with AiohttpAuthClient(client_options, str(server.make_url(""))) as client:
+        response = await client.request("get", "/platform/v2/evm/accounts")
+        data = await response.json()
+
+    # Verify
+    assert response.status == 200
+    assert data["method"] == "GET"
+    token = data["headers"]["Authorization"].removeprefix("Bearer ")
+    decoded = jwt_lib.decode(token, options={"verify_signature": False})
+    assert decoded["sub"] == "test-key-id"
+    assert decoded["uris"] == [f"GET {server.host}:{server.port}/platform/v2/evm/accounts"]
+    assert "source=test-source" in data["headers"]["Correlation-Context"]
+    assert "X-Wallet-Auth" not in data["headers"]
+
+
+@pytest.mark.asyncio
+async def test_request_with_json_body_adds_wallet_auth(server, client_options):
+    """Test that write requests to accounts endpoints send the JSON body and wallet auth."""
+    # Execute
+    async with AiohttpAuthClient(client_options, str(server.make_url(""))) as client:
+        response = await client.request(
+            "POST",
+            "/platform/v2/evm/accounts",
+            headers={"Custom-Header": "value"},
+            body={"name": "test"},
+        )
+        data = await response.json()
+
+    # Verify
+    assert data["body"] == '{"name": "test"}'
+    assert data["headers"]["Content-Type"] == "application/json"
+    assert data["headers"]["Custom-Header"] == "value"
+    wallet_auth = jwt_lib.decode(
+        data["headers"]["X-Wallet-Auth"], options={"verify_signature": False}
+    )
+    assert "reqHash" in wallet_auth
+
+
+@pytest.mark.asyncio
+async def test_requests_reuse_session_and_keys(server, client_options):
+    """Test that requests share one connection pool and parse the keys only once."""
+    # Execute
+    with patch("cdp.auth.utils.jwt._parse_private_key", wraps=_parse_private_key) as mock_parse:
+        async with AiohttpAuthClient(client_options, str(server.make_url(""))) as client:
+            for _ in range(3):
+                await client.request("GET", "/platform/v2/evm/accounts")
+            session = client._session
+
+    # Verify
+    mock_parse.assert_called_once()
+    assert session.closed
+    assert len({request["transport"] for request in server.requests}) == 1
+
+
+@pytest.mark.asyncio
+async def test_request_retries_server_errors(server, client_options):
+    """Test that GET requests are retried on 5xx responses."""
+    # Execute
+    async with AiohttpAuthClient(client_options, str(server.make_url(""))) as client:
+        response = await client.request("GET", "/flaky")
+        data = await response.json()
+
+    # Verify
+    assert response.status == 200
+    assert data == {"attempts": 2}
+
+
+@pytest.mark.asyncio
+async def test_request_does_not_retry_writes(server, client_options):
+    """Test that write requests and clients without retries are not retried."""
+    # Execute
+    async with AiohttpAuthClient(client_options, str(server.make_url(""))) as client:
+        post_response = await client.request("POST", "/flaky", body={"name": "test"})
+    async with AiohttpAuthClient(client_options, str(server.make_url("")), max_retries=0) as client:
+        get_response = await client.request("GET", "/flaky")
+
+    # Verify
+    assert post_response.status == 503
+    assert get_response.status == 200
+    assert _flaky_attempts(server) == ["POST", "GET"]
+
+
+@pytest.mark.asyncio
+@patch("cdp.auth.clients.aiohttp.client.logger")
+async def test_request_with_debug(mock_logger, server, client_options):
+    """Test client with debug logging enabled."""
+    # Execute
+    async with AiohttpAuthClient(client_options, str(server.make_url("")), debug=True) as client:
+        await client.request("GET", "/test")
+
+    # Verify
+    assert mock_logger.debug.call_count == 2
+    log_format, method, url, headers, body = mock_logger.debug.call_args_list[0][0]
+    assert "HTTP Request:" in log_format
+    assert method == "GET"
+    assert url.endswith("/test")
+    log_format, status, headers, body = mock_logger.debug.call_args_list[1][0]
+    assert "HTTP Response:" in log_format
+    assert status == 200
+    assert '"path": "/test"' in body
@@ -1,11 +1,15 @@
+import logging
 from unittest.mock import MagicMock, patch
 from urllib.parse import urlparse
 
-from cdp.auth.clients.urllib3.client import Urllib3AuthClient
+import pytest
+import urllib3
+
+from cdp.auth.clients.urllib3.client import MAX_LOGGED_BODY_BYTES, Urllib3AuthClient
 from cdp.auth.utils.http import GetAuthHeadersOptions
 
 
-@patch("cdp.auth.utils.http.generate_jwt", return_value="mock.jwt.token")
+@patch("cdp.auth.utils.jwt.JwtSigner.generate_jwt", return_value="mock.jwt.token")
 @patch("urllib3.PoolManager")
 @patch("cdp.auth.clients.urllib3.client.get_auth_headers")
 def test_request_adds_auth_headers(
@@ -41,7 +45,7 @@ def test_request_adds_auth_headers(
     assert parsed_url.hostname == "api.example.com"
 
 
-@patch("cdp.auth.utils.http.generate_jwt", return_value="mock.jwt.token")
+@patch("cdp.auth.utils.jwt.JwtSigner.generate_jwt", return_value="mock.jwt.token")
 @patch("urllib3.PoolManager")
 @patch("cdp.auth.clients.urllib3.client.get_auth_headers")
 @patch("cdp.auth.clients.urllib3.client.logger")
@@ -91,7 +95,7 @@ def test_request_with_debug(
     assert response.headers == {"Content-Type": "application/json"}
 
 
-@patch("cdp.auth.utils.http.generate_jwt", return_value="mock.jwt.token")
+@patch("cdp.auth.utils.jwt.JwtSigner.generate_jwt", return_value="mock.jwt.token")
 @patch("urllib3.PoolManager")
 @patch("cdp.auth.clients.urllib3.client.get_auth_headers")
 def test_request_url_handling(
@@ -125,7 +129,7 @@ def test_request_url_handling(
     assert called_url == absolute_url
 
 
-@patch("cdp.auth.utils.http.generate_jwt", return_value="mock.jwt.token")
+@patch("cdp.auth.utils.jwt.JwtSigner.generate_jwt", return_value="mock.jwt.token")
 @patch("urllib3.PoolManager")
 @patch("cdp.auth.clients.urllib3.client.get_auth_headers")
 def test_request_merges_headers(
@@ -157,7 +161,7 @@ def test_request_merges_headers(
     assert "Authorization" in actual_headers
 
 
-@patch("cdp.auth.utils.http.generate_jwt", return_value="mock.jwt.token")
+@patch("cdp.auth.utils.jwt.JwtSigner.generate_jwt", return_value="mock.jwt.token")
 @patch("urllib3.PoolManager")
 @patch("cdp.auth.clients.urllib3.client.get_auth_headers")
 def test_request_with_query_params(
@@ -189,7 +193,7 @@ def test_request_with_query_params(
     assert call_kwargs["url"] == f"{base_url}/test"
 
 
-@patch("cdp.auth.utils.http.generate_jwt", return_value="mock.jwt.token")
+@patch("cdp.auth.utils.jwt.JwtSigner.generate_jwt", return_value="mock.jwt.token")
 @patch("urllib3.PoolManager")
 @patch("cdp.auth.clients.urllib3.client.get_auth_headers")
 def test_request_with_json_body(
@@ -218,3 +222,171 @@ def test_request_with_json_body(
     # Verify
     actual_headers = mock_client.request.call_args[1]["headers"]
     assert actual_headers.get("Content-Type") == "application/json"
+
+
+@patch("urllib3.PoolManager")
+@patch("cdp.auth.clients.urllib3.client.get_auth_headers")
+def test_stream_yields_chunks(
+    mock_get_headers,
+    mock_pool_manager,
+    auth_client_options_factory,
+    http_client_factory,
+    http_response_factory,
+    auth_headers_factory,
+):
+    """Test that streaming does not preload the response and releases the connection."""
+    # Setup
+    mock_response = http_response_factory()
+    mock_response.stream.return_value = iter([b'{"items": [', b"]}"])
+    mock_client = http_client_factory(response=mock_response)
+    mock_pool_manager.return_value = mock_client
+    mock_get_headers.return_value = auth_headers_factory()
+
+    client = Urllib3AuthClient(auth_client_options_factory(), "https://api.example.com")
+
+    # Execute
+    chunks = list(client.stream("GET", "/export", chunk_size=1024))
+
+    # Verify
+    assert chunks == [b'{"items": [', b"]}"]
+    assert mock_client.request.call_args[1]["preload_content"] is False
+    mock_response.stream.assert_called_once_with(1024)
+    mock_response.release_conn.assert_called_once()
+
+
+@patch("urllib3.PoolManager")
+@patch("cdp.auth.clients.urllib3.client.get_auth_headers")
+def test_stream_raises_on_error_status(
+    mock_get_headers,
+    mock_pool_manager,
+    auth_client_options_factory,
+    http_client_factory,
+    http_response_factory,
+    auth_headers_factory,
+):
+    """Test that streaming an error response raises instead of yielding the error body."""
+    # Setup
+    mock_response = http_response_factory(status=404)
+    mock_response.read.return_value = b'{"errorType": "not_found"}'
+    mock_pool_manager.return_value = http_client_factory(response=mock_response)
+    mock_get_headers.return_value = auth_headers_factory()
+
+    client = Urllib3AuthClient(auth_client_options_factory(), "https://api.example.com")
+
+    # Execute & Verify
+    with pytest.raises(urllib3.exceptions.HTTPError, match="failed with status 404"):
+        list(client.stream("GET", "/export"))
+    mock_response.stream.assert_not_called()
+    mock_response.release_conn.assert_called_once()
+
+
+@patch("urllib3.PoolManager")
+@patch("cdp.auth.clients.urllib3.client.get_auth_headers")
+@patch("cdp.auth.clients.urllib3.client.logger")
+def test_request_with_debug_truncates_body(
+    mock_logger,
+    mock_get_headers,
+    mock_pool_manager,
+    auth_client_options_factory,
+    http_client_factory,
+    http_response_factory,
+    auth_headers_factory,
+):
+    """Test that large bodies are truncated in debug logs."""
+    # Setup
+    data = b"x" * (MAX_LOGGED_BODY_BYTES + 100)
+    mock_pool_manager.return_value = http_client_factory(response=http_response_factory(data=data))
+    mock_get_headers.return_value = auth_headers_factory()
+
+    client = Urllib3AuthClient(auth_client_options_factory(), "https://api.example.com", debug=True)
+
+    # Execute
+    client.request("GET", "/test")
+
+    # Verify
+    logged_body = mock_logger.debug.call_args_list[1][0][3]
+    assert logged_body.startswith("x" * MAX_LOGGED_BODY_BYTES + "...")
+    assert f"({len(data)} bytes, truncated)" in logged_body
+
+
+@patch("urllib3.PoolManager")
+@patch("cdp.auth.clients.urllib3.client.get_auth_headers")
+@patch("cdp.auth.clients.urllib3.client.logger")
+def test_request_with_debug_does_not_read_deferred_body(
+    mock_logger,
+    mock_get_headers,
+    mock_pool_manager,
+    auth_client_options_factory,
+    http_client_factory,
+    auth_headers_factory,
+):
+    """Test that debug logging does not read a response that is not preloaded."""
+    # Setup
+    mock_response = MagicMock(status=200)
+    type(mock_response).data = property(lambda _: pytest.fail("response body was read"))
+    mock_pool_manager.return_value = http_client_factory(response=mock_response)
+    mock_get_headers.return_value = auth_headers_factory()
+
+    client = Urllib3AuthClient(auth_client_options_factory(), "https://api.example.com", debug=True)
+
+    # Execute
+    client.request("GET", "/test", preload_content=False)
+
+    # Verify
+    assert mock_logger.debug.call_args_list[1][0][3] == "<not preloaded>"
+
+
+@patch("urllib3.PoolManager")
+@patch("cdp.auth.clients.urllib3.client.get_auth_headers")
+@patch("cdp.auth.clients.urllib3.client._truncate_body")
+def test_request_with_debug_skips_formatting_when_logger_disabled(
+    mock_truncate_body,
+    mock_get_headers,
+    mock_pool_manager,
+    auth_client_options_factory,
+    http_client_factory,
+    auth_headers_factory,
+):
+    """Test that bodies are not decoded for debug logs the logger would discard."""
+    # Setup
+    mock_pool_manager.return_value = http_client_factory()
+    mock_get_headers.return_value = auth_headers_factory()
+
+    client = Urllib3AuthClient(auth_client_options_factory(), "https://api.example.com", debug=True)
+
+    # Execute
+    with patch.object(
+        logging.getLogger("cdp.auth.clients.urllib3.client"), "isEnabledFor", return_value=False
+    ):
+        client.request("POST", "/test", body={"data": "test"})
+
+    # Verify
+    mock_truncate_body.assert_not_called()
+
+
+@patch("urllib3.PoolManager")
+@patch("cdp.auth.clients.urllib3.client.get_auth_headers")
+@patch("cdp.auth.clients.urllib3.client._get_correlation_data", return_value="source=test")
+def test_correlation_context_is_resolved_when_created(
+    mock_get_correlation_data,
+    mock_get_headers,
+    mock_pool_manager,
+    auth_client_options_factory,
+    http_client_factory,
+    auth_headers_factory,
+):
+    """Test that the Correlation-Context header is computed once, when the client is created."""
+    # Setup
+    mock_client = http_client_factory()
+    mock_pool_manager.return_value = mock_client
+    mock_get_headers.return_value = auth_headers_factory()
+
+    client = Urllib3AuthClient(auth_client_options_factory(), "https://api.example.com")
+
+    # Execute
+    client.request("GET", "/test")
+    client.request("GET", "/test")
+
+    # Verify
+    mock_get_correlation_data.assert_called_once()
+    assert mock_client.request.call_args.kwargs["headers"]["Correlation-Context"] == "source=test"
@@ -1,15 +1,20 @@
-from unittest.mock import patch
+import inspect
+from unittest.mock import MagicMock, patch
 
 import pytest
 
 from cdp.auth.utils.http import (
+    _get_auth_headers,
+    _get_auth_headers_with_credentials,
     _get_correlation_data,
+    _get_process_signers,
     _requires_wallet_auth,
     get_auth_headers,
 )
+from cdp.auth.utils.jwt import JwtSigner
 
 
-@patch("cdp.auth.utils.http.generate_jwt")
+@patch("cdp.auth.utils.jwt.JwtSigner.generate_jwt")
 def test_get_auth_headers(mock_jwt, auth_options_factory):
     """Test getting authentication headers."""
     # Setup
@@ -25,8 +30,16 @@ def test_get_auth_headers(mock_jwt, auth_options_factory):
     assert "X-Wallet-Auth" not in headers
 
 
-@patch("cdp.auth.utils.http.generate_jwt")
-@patch("cdp.auth.utils.http.generate_wallet_jwt")
+def test_signers_are_only_taken_by_the_internal_path():
+    """Test that get_auth_headers keeps its options-only signature and signers stay internal."""
+    assert list(inspect.signature(get_auth_headers).parameters) == ["options"]
+    optional = ["expires_in", "audience", "bearer_token"]
+    parameters = inspect.signature(_get_auth_headers).parameters
+    assert all(parameters[name].kind is inspect.Parameter.KEYWORD_ONLY for name in optional)
+
+
+@patch("cdp.auth.utils.jwt.JwtSigner.generate_jwt")
+@patch("cdp.auth.utils.jwt.WalletJwtSigner.generate_wallet_jwt")
 def test_get_auth_headers_with_wallet_auth(mock_wallet_jwt, mock_jwt, auth_options_factory):
     """Test creating headers with wallet authentication."""
     # Setup
@@ -47,7 +60,7 @@ def test_get_auth_headers_with_wallet_auth(mock_wallet_jwt, mock_jwt, auth_optio
     assert headers["X-Wallet-Auth"] == "mock.wallet.token"
 
 
-@patch("cdp.auth.utils.http.generate_jwt")
+@patch("cdp.auth.utils.jwt.JwtSigner.generate_jwt")
 def test_get_auth_headers_missing_wallet_auth(mock_jwt, auth_options_factory):
     """Test error when wallet auth is required but not provided."""
     # Setup
@@ -63,6 +76,85 @@ def test_get_auth_headers_missing_wallet_auth(mock_jwt, auth_options_factory):
         get_auth_headers(options)
 
 
+def test_get_auth_headers_delegates_to_the_internal_path(auth_options_factory):
+    """Test that get_auth_headers validates its options and builds headers via _get_auth_headers."""
+    options = auth_options_factory(request_method="get")
+
+    with patch(
+        "cdp.auth.utils.http._get_auth_headers", return_value={"Authorization": "Bearer x"}
+    ) as mock_get_auth_headers:
+        assert get_auth_headers(options) == {"Authorization": "Bearer x"}
+
+    signer, wallet_signer, *args = mock_get_auth_headers.call_args.args
+    assert (signer, wallet_signer) == _get_process_signers("test-key", "test-secret", None, None)
+    assert args == ["GET", "api.example.com", "/test", None, _get_correlation_data()]
+    assert mock_get_auth_headers.call_args.kwargs == {"expires_in": None, "audience": None}
+
+    with pytest.raises(ValueError, match="Invalid request method"):
+        get_auth_headers(auth_options_factory(request_method="TRACE"))
+
+
+def test_get_auth_headers_with_signers():
+    """Test getting authentication headers from the signers held by a client."""
+    # Setup
+    signer = MagicMock()
+    signer.generate_jwt.return_value = "signer.jwt.token"
+    wallet_signer = MagicMock()
+    wallet_signer.wallet_secret = "test-wallet-key"
+    wallet_signer.generate_wallet_jwt.return_value = "signer.wallet.token"
+    body = {"name": "test-account"}
+
+    # Execute
+    headers = _get_auth_headers(
+        signer,
+        wallet_signer,
+        "POST",
+        "api.example.com",
+        "/v2/evm/accounts",
+        body,
+        "sdk_language=python,source=test-source",
+    )
+
+    # Verify
+    assert headers["Authorization"] == "Bearer signer.jwt.token"
+    assert headers["Content-Type"] == "application/json"
+    assert headers["X-Wallet-Auth"] == "signer.wallet.token"
+    assert headers["Correlation-Context"] == "sdk_language=python,source=test-source"
+    signer.generate_jwt.assert_called_once_with(
+        "POST", "api.example.com", "/v2/evm/accounts", None, None
+    )
+    wallet_signer.generate_wallet_jwt.assert_called_once_with(
+        "POST", "api.example.com", "/v2/evm/accounts", body
+    )
+
+
+def test_get_auth_headers_with_signers_without_wallet_auth():
+    """Test that the wallet signer is not used when the request does not need wallet auth."""
+    # Setup
+    signer = MagicMock()
+    signer.generate_jwt.return_value = "signer.jwt.token"
+    wallet_signer = MagicMock()
+
+    # Execute
+    headers = _get_auth_headers(signer, wallet_signer, "GET", "api.example.com", "/v2/evm/accounts")
+
+    # Verify
+    assert "X-Wallet-Auth" not in headers
+    wallet_signer.generate_wallet_jwt.assert_not_called()
+
+
+def test_get_auth_headers_with_signers_missing_wallet_secret():
+    """Test error when wallet auth is required but the wallet signer has no secret."""
+    # Setup
+    signer = MagicMock()
+    wallet_signer = MagicMock()
+    wallet_signer.wallet_secret = None
+
+    # Execute & Verify
+    with pytest.raises(ValueError, match="Wallet Secret not configured"):
+        _get_auth_headers(signer, wallet_signer, "POST", "api.example.com", "/accounts")
+
+
 @pytest.mark.parametrize(
     "request_method,request_path,expected",
     [
@@ -101,3 +193,52 @@ def test_get_correlation_data(source, version, expected_source):
 
     if version:
         assert f"source_version={version}" in data
+
+
+def test_get_correlation_data_reads_version_once():
+    """Test that the SDK version is read from package metadata only once per source."""
+    # Setup
+    _get_correlation_data.cache_clear()
+
+    # Execute
+    with patch("cdp.auth.utils.http.version", return_value="1.2.3") as mock_version:
+        first = _get_correlation_data("cached-source", "1.0.0")
+        second = _get_correlation_data("cached-source", "1.0.0")
+
+    _get_correlation_data.cache_clear()
+
+    # Verify
+    mock_version.assert_called_once_with("cdp-sdk")
+    assert first == second
+    assert "sdk_version=1.2.3" in first
+
+
+def test_get_auth_headers_with_credentials_reuses_signers(
+    ec_private_key_factory, wallet_secret_factory
+):
+    """Test that signing from raw credentials reuses the signers of the current process."""
+    # Setup
+    api_key_secret = ec_private_key_factory()
+    wallet_secret = wallet_secret_factory()
+    _get_process_signers.cache_clear()
+
+    # Execute
+    with patch("cdp.auth.utils.http.JwtSigner", wraps=JwtSigner) as mock_signer_class:
+        for _ in range(2):
+            headers = _get_auth_headers_with_credentials(
+                "test-key-id",
+                api_key_secret,
+                wallet_secret,
+                None,
+                "POST",
+                "api.example.com",
+                "/v2/evm/accounts",
+                {"name": "test-account"},
+            )
+
+    _get_process_signers.cache_clear()
+
+    # Verify
+    mock_signer_class.assert_called_once()
+    assert headers["Authorization"].startswith("Bearer ")
+    assert "X-Wallet-Auth" in headers
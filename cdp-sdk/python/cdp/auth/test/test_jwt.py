@@ -1,4 +1,8 @@
 import base64
+import hashlib
+import json
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from unittest.mock import patch
 from urllib.parse import urlparse
 
 import jwt as jwt_lib
@@ -10,10 +14,18 @@ from pydantic import ValidationError
 # Import JWT utilities from the utils package
 from cdp.auth.utils.jwt import (
     JwtOptions,
+    JwtSigner,
+    WalletJwtOptions,
+    WalletJwtSigner,
     _generate_nonce,
+    _hash_request_data,
+    _load_wallet_key,
     _parse_private_key,
     generate_jwt,
+    generate_jwts,
+    generate_wallet_jwt,
 )
+from cdp.utils import sort_keys
 
 
 # Test fixtures for common test data
@@ -268,3 +280,340 @@ def test_generate_jwt_custom_expiry(ec_private_key_factory, jwt_options_factory)
     # Verify
     decoded = jwt_lib.decode(token, options={"verify_signature": False})
     assert decoded["exp"] - decoded["nbf"] == 300
+
+
+def test_jwt_signer_generate_jwt(ec_private_key_factory):
+    """Test JWT generation with a JwtSigner."""
+    # Setup
+    signer = JwtSigner("test-key-id", ec_private_key_factory())
+
+    # Execute
+    token = signer.generate_jwt("get", "api.cdp.coinbase.com", "/platform/v2/evm/accounts")
+
+    # Verify
+    header = jwt_lib.get_unverified_header(token)
+    decoded = jwt_lib.decode(token, options={"verify_signature": False})
+    assert header["alg"] == "ES256"
+    assert header["kid"] == "test-key-id"
+    assert decoded["sub"] == "test-key-id"
+    assert decoded["exp"] - decoded["nbf"] == 120
+    assert decoded["uris"] == ["GET api.cdp.coinbase.com/platform/v2/evm/accounts"]
+
+
+def test_jwt_signer_websocket_jwt(ed25519_private_key_factory):
+    """Test WebSocket JWT generation with a JwtSigner."""
+    # Setup
+    signer = JwtSigner("test-key-id", ed25519_private_key_factory())
+
+    # Execute
+    token = signer.generate_jwt(expires_in=300)
+
+    # Verify
+    decoded = jwt_lib.decode(token, options={"verify_signature": False})
+    assert signer.algorithm == "EdDSA"
+    assert decoded["exp"] - decoded["nbf"] == 300
+    assert "uris" not in decoded
+
+
+def test_jwt_signer_parses_key_once(ec_private_key_factory):
+    """Test that the JwtSigner parses the API key only once."""
+    # Setup
+    signer = JwtSigner("test-key-id", ec_private_key_factory())
+
+    # Execute
+    with patch("cdp.auth.utils.jwt._parse_private_key", wraps=_parse_private_key) as mock_parse:
+        for _ in range(3):
+            signer.generate_jwt("GET", "api.cdp.coinbase.com", "/platform/v2/evm/accounts")
+
+    # Verify
+    mock_parse.assert_called_once()
+
+
+def test_jwt_signer_rotate(ec_private_key_factory, ed25519_private_key_factory):
+    """Test that rotating the credentials of a JwtSigner drops the cached key."""
+    # Setup
+    signer = JwtSigner("test-key-id", ec_private_key_factory())
+    assert signer.algorithm == "ES256"
+
+    # Execute
+    signer.rotate("new-key-id", ed25519_private_key_factory())
+    token = signer.generate_jwt("GET", "api.cdp.coinbase.com", "/platform/v2/evm/accounts")
+
+    # Verify
+    header = jwt_lib.get_unverified_header(token)
+    assert signer.algorithm == "EdDSA"
+    assert header["alg"] == "EdDSA"
+    assert header["kid"] == "new-key-id"
+
+
+@pytest.mark.parametrize(
+    "api_key_id,api_key_secret,error_message",
+    [
+        ("", "dummy-secret", "Key ID is required"),
+        ("test-key-id", "", "Private key is required"),
+        ("test-key-id", "invalid-key-data", "Failed to generate JWT"),
+    ],
+)
+def test_jwt_signer_invalid_credentials(api_key_id, api_key_secret, error_message):
+    """Test that a JwtSigner with invalid credentials raises an error when signing."""
+    # Setup
+    signer = JwtSigner(api_key_id, api_key_secret)
+
+    # Execute & Verify
+    with pytest.raises(ValueError, match=error_message):
+        signer.generate_jwt("GET", "api.cdp.coinbase.com", "/platform/v2/evm/accounts")
+
+
+def test_hash_request_data_is_canonical():
+    """Test that the request hash does not depend on key order."""
+    # Setup
+    data = {"b": {"d": [{"f": 1, "e": 2}], "c": "x"}, "a": 3}
+    reordered = {"a": 3, "b": {"c": "x", "d": [{"e": 2, "f": 1}]}}
+    expected = hashlib.sha256(
+        json.dumps(sort_keys(data), separators=(",", ":"), sort_keys=True).encode("utf-8")
+    ).hexdigest()
+
+    # Execute & Verify
+    assert _hash_request_data(data) == expected
+    assert _hash_request_data(reordered) == expected
+
+
+def test_generate_wallet_jwt(wallet_secret_factory):
+    """Test Wallet Auth JWT generation."""
+    # Setup
+    wallet_secret = wallet_secret_factory()
+    request_data = {"name": "test-account"}
+    options = WalletJwtOptions(
+        wallet_auth_key=wallet_secret,
+        request_method="post",
+        request_host="api.cdp.coinbase.com",
+        request_path="/platform/v2/evm/accounts",
+        request_data=request_data,
+    )
+
+    # Execute
+    token = generate_wallet_jwt(options)
+
+    # Verify
+    public_key = _load_wallet_key(wallet_secret).public_key()
+    decoded = jwt_lib.decode(token, public_key, algorithms=["ES256"])
+    assert decoded["uris"] == ["POST api.cdp.coinbase.com/platform/v2/evm/accounts"]
+    assert decoded["reqHash"] == _hash_request_data(request_data)
+
+
+def test_wallet_jwt_signer_generate_wallet_jwt(wallet_secret_factory):
+    """Test Wallet Auth JWT generation with a WalletJwtSigner."""
+    # Setup
+    wallet_secret = wallet_secret_factory()
+    signer = WalletJwtSigner(wallet_secret)
+
+    # Execute
+    token = signer.generate_wallet_jwt(
+        "DELETE", "api.cdp.coinbase.com", "/platform/v2/evm/accounts/0x123", {}
+    )
+
+    # Verify
+    public_key = _load_wallet_key(wallet_secret).public_key()
+    decoded = jwt_lib.decode(token, public_key, algorithms=["ES256"])
+    assert decoded["uris"] == ["DELETE api.cdp.coinbase.com/platform/v2/evm/accounts/0x123"]
+    assert "reqHash" not in decoded
+
+
+def test_wallet_jwt_signer_loads_key_once(wallet_secret_factory):
+    """Test that the WalletJwtSigner loads the wallet key only once."""
+    # Setup
+    signer = WalletJwtSigner(wallet_secret_factory())
+
+    # Execute
+    with patch("cdp.auth.utils.jwt._load_wallet_key", wraps=_load_wallet_key) as mock_load:
+        for _ in range(3):
+            signer.generate_wallet_jwt(
+                "POST", "api.cdp.coinbase.com", "/platform/v2/evm/accounts", {"name": "test"}
+            )
+
+    # Verify
+    mock_load.assert_called_once()
+
+
+def test_wallet_jwt_signer_rotate(wallet_secret_factory):
+    """Test that rotating the wallet secret of a WalletJwtSigner drops the cached key."""
+    # Setup
+    signer = WalletJwtSigner(wallet_secret_factory())
+    signer.generate_wallet_jwt("POST", "api.cdp.coinbase.com", "/platform/v2/evm/accounts")
+    new_wallet_secret = wallet_secret_factory()
+
+    # Execute
+    signer.rotate(new_wallet_secret)
+    token = signer.generate_wallet_jwt("POST", "api.cdp.coinbase.com", "/platform/v2/evm/accounts")
+
+    # Verify
+    public_key = _load_wallet_key(new_wallet_secret).public_key()
+    jwt_lib.decode(token, public_key, algorithms=["ES256"])
+
+
+@pytest.mark.parametrize(
+    "wallet_secret,error_message",
+    [
+        (None, "Server Wallet Secret is not defined"),
+        ("invalid-wallet-secret", "Could not create the EC key"),
+    ],
+)
+def test_wallet_jwt_signer_invalid_secret(wallet_secret, error_message):
+    """Test that a WalletJwtSigner with an invalid wallet secret raises an error when signing."""
+    # Setup
+    signer = WalletJwtSigner(wallet_secret)
+
+    # Execute & Verify
+    with pytest.raises(ValueError, match=error_message):
+        signer.generate_wallet_jwt("POST", "api.cdp.coinbase.com", "/platform/v2/evm/accounts")
+
+
+def test_jwt_signer_reuses_cached_get_jwt(ec_private_key_factory):
+    """Test that a JwtSigner with a cache margin reuses JWTs for GET requests."""
+    # Setup
+    signer = JwtSigner("test-key-id", ec_private_key_factory(), cache_margin=30)
+
+    # Execute
+    first = signer.generate_jwt("GET", "api.cdp.coinbase.com", "/platform/v2/evm/accounts")
+    second = signer.generate_jwt("get", "api.cdp.coinbase.com", "/platform/v2/evm/accounts")
+    other_path = signer.generate_jwt("GET", "api.cdp.coinbase.com", "/platform/v2/solana/accounts")
+    other_audience = signer.generate_jwt(
+        "GET", "api.cdp.coinbase.com", "/platform/v2/evm/accounts", audience=["other"]
+    )
+
+    # Verify
+    assert first == second
+    assert other_path != first
+    assert other_audience != first
+
+
+def test_jwt_signer_does_not_cache_non_get_jwt(ec_private_key_factory):
+    """Test that a JwtSigner does not reuse JWTs for non-GET requests."""
+    # Setup
+    signer = JwtSigner("test-key-id", ec_private_key_factory(), cache_margin=30)
+
+    # Execute
+    first = signer.generate_jwt("POST", "api.cdp.coinbase.com", "/platform/v2/evm/accounts")
+    second = signer.generate_jwt("POST", "api.cdp.coinbase.com", "/platform/v2/evm/accounts")
+
+    # Verify
+    assert first != second
+
+
+def test_jwt_signer_refreshes_jwt_within_margin(ec_private_key_factory):
+    """Test that a cached JWT is not reused within the safety margin before it expires."""
+    # Setup
+    signer = JwtSigner("test-key-id", ec_private_key_factory(), cache_margin=30)
+
+    # Execute
+    with patch("cdp.auth.utils.jwt.time.time", return_value=1_000_000):
+        first = signer.generate_jwt("GET", "api.cdp.coinbase.com", "/platform/v2/evm/accounts")
+    with patch("cdp.auth.utils.jwt.time.time", return_value=1_000_089):
+        reused = signer.generate_jwt("GET", "api.cdp.coinbase.com", "/platform/v2/evm/accounts")
+    with patch("cdp.auth.utils.jwt.time.time", return_value=1_000_090):
+        refreshed = signer.generate_jwt("GET", "api.cdp.coinbase.com", "/platform/v2/evm/accounts")
+
+    # Verify
+    assert reused == first
+    assert refreshed != first
+    assert jwt_lib.decode(refreshed, options={"verify_signature": False})["nbf"] == 1_000_090
+
+
+def test_jwt_signer_rotate_clears_cached_jwts(ec_private_key_factory):
+    """Test that rotating the credentials of a JwtSigner drops the cached JWTs."""
+    # Setup
+    api_key_secret = ec_private_key_factory()
+    signer = JwtSigner("test-key-id", api_key_secret, cache_margin=30)
+    first = signer.generate_jwt("GET", "api.cdp.coinbase.com", "/platform/v2/evm/accounts")
+
+    # Execute
+    signer.rotate("test-key-id", ec_private_key_factory())
+    second = signer.generate_jwt("GET", "api.cdp.coinbase.com", "/platform/v2/evm/accounts")
+
+    # Verify
+    assert first != second
+
+
+def test_generate_jwts(ec_private_key_factory, ed25519_private_key_factory):
+    """Test batch JWT generation with several API keys, keeping the order of the options."""
+    # Setup
+    ec_key = ec_private_key_factory()
+    ed25519_key = ed25519_private_key_factory()
+    options = [
+        JwtOptions(
+            api_key_id=f"key-{i % 2}",
+            api_key_secret=ec_key if i % 2 == 0 else ed25519_key,
+            request_method="get",
+            request_host="api.cdp.coinbase.com",
+            request_path=f"/platform/v2/evm/accounts/{i}",
+        )
+        for i in range(6)
+    ]
+
+    # Execute
+    with patch("cdp.auth.utils.jwt._parse_private_key", wraps=_parse_private_key) as mock_parse:
+        tokens = generate_jwts(options, chunk_size=2)
+
+    # Verify
+    assert mock_parse.call_count == 4
+    for i, token in enumerate(tokens):
+        header = jwt_lib.get_unverified_header(token)
+        decoded = jwt_lib.decode(token, options={"verify_signature": False})
+        assert header["alg"] == ("ES256" if i % 2 == 0 else "EdDSA")
+        assert decoded["sub"] == f"key-{i % 2}"
+        assert decoded["uris"] == [f"GET api.cdp.coinbase.com/platform/v2/evm/accounts/{i}"]
+
+
+@pytest.mark.parametrize("executor_class", [ThreadPoolExecutor, ProcessPoolExecutor])
+def test_generate_jwts_with_executor(executor_class, ec_private_key_factory):
+    """Test batch JWT generation with chunks signed in an executor."""
+    # Setup
+    options = [
+        JwtOptions(
+            api_key_id="test-key-id",
+            api_key_secret=ec_private_key_factory(),
+            request_method="POST",
+            request_host="api.cdp.coinbase.com",
+            request_path=f"/platform/v2/evm/accounts/{i}",
+            expires_in=300,
+        )
+        for i in range(3)
+    ]
+
+    # Execute
+    with executor_class(max_workers=2) as executor:
+        tokens = generate_jwts(options, executor=executor)
+
+    # Verify
+    for i, token in enumerate(tokens):
+        decoded = jwt_lib.decode(token, options={"verify_signature": False})
+        assert decoded["exp"] - decoded["nbf"] == 300
+        assert decoded["uris"] == [f"POST api.cdp.coinbase.com/platform/v2/evm/accounts/{i}"]
+
+
+def test_generate_jwts_empty():
+    """Test that an empty batch produces no JWTs."""
+    assert generate_jwts([]) == []
+
+
+@pytest.mark.parametrize(
+    "api_key_id,api_key_secret,error_message",
+    [
+        ("", "dummy-secret", "Key ID is required"),
+        ("test-key-id", "", "Private key is required"),
+        ("test-key-id", "invalid-key-data", "Failed to generate JWT"),
+    ],
+)
+def test_generate_jwts_invalid_options(
+    api_key_id, api_key_secret, error_message, ec_private_key_factory, jwt_options_factory
+):
+    """Test that a single invalid option fails the whole batch."""
+    # Setup
+    options = [
+        jwt_options_factory(api_key_secret=ec_private_key_factory()),
+        jwt_options_factory(api_key_id=api_key_id, api_key_secret=api_key_secret),
+    ]
+
+    # Execute & Verify
+    with pytest.raises(ValueError, match=error_message):
+        generate_jwts(options)
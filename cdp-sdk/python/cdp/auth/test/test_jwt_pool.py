@@ -0,0 +1,141 @@
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from cdp.auth.utils.jwt_pool import JwtPool
+
+ENDPOINT = ("POST", "api.cdp.coinbase.com", "/platform/v2/evm/accounts/0x123/sign")
+
+
+def _counting_mint():
+    """Create a mint coroutine function that returns numbered tokens."""
+    minted = []
+
+    async def _mint(method, host, path):
+        minted.append((method, host, path))
+        return f"token-{len(minted)}"
+
+    return _mint, minted
+
+
+@pytest.mark.asyncio
+async def test_take_unknown_endpoint():
+    """Test that endpoints that are not pooled get no token and start no task."""
+    # Setup
+    mint, minted = _counting_mint()
+    pool = JwtPool(mint, [ENDPOINT])
+
+    # Execute
+    token = pool.take("GET", "api.cdp.coinbase.com", "/platform/v2/evm/accounts")
+
+    # Verify
+    assert token is None
+    assert pool._task is None
+    assert minted == []
+
+
+@pytest.mark.asyncio
+async def test_take_returns_pre_signed_tokens_once():
+    """Test that the pool hands out each pre-signed token only once, oldest first."""
+    # Setup
+    mint, minted = _counting_mint()
+    pool = JwtPool(mint, [ENDPOINT], size=2)
+
+    # Execute
+    first = pool.take(*ENDPOINT)
+    await asyncio.sleep(0)
+    second = pool.take(*ENDPOINT)
+    third = pool.take(*ENDPOINT)
+    await pool.close()
+
+    # Verify
+    assert first is None
+    assert second == "token-1"
+    assert third == "token-2"
+    assert minted[0] == ENDPOINT
+
+
+@pytest.mark.asyncio
+async def test_refill_evicts_expiring_tokens():
+    """Test that tokens within the safety margin before expiry are evicted and replaced."""
+    # Setup
+    mint, _ = _counting_mint()
+    pool = JwtPool(mint, [ENDPOINT], size=1, expires_in=120, margin=30)
+    with patch("cdp.auth.utils.jwt_pool.time.time", return_value=1_000_000):
+        await pool.refill()
+
+    # Execute
+    with patch("cdp.auth.utils.jwt_pool.time.time", return_value=1_000_090):
+        await pool.refill()
+        token = pool.take(*ENDPOINT)
+    await pool.close()
+
+    # Verify
+    assert token == "token-2"
+
+
+@pytest.mark.asyncio
+async def test_clear_discards_tokens():
+    """Test that clearing the pool discards all pre-signed tokens."""
+    # Setup
+    mint, _ = _counting_mint()
+    pool = JwtPool(mint, [ENDPOINT], size=2)
+    await pool.refill()
+
+    # Execute
+    pool.clear()
+
+    # Verify
+    assert pool.take(*ENDPOINT) is None
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_clear_drops_tokens_minted_before_it():
+    """Test that a token minted while the pool was cleared, e.g. by a key rotation, is dropped."""
+    # Setup
+    minting = asyncio.Event()
+    release = asyncio.Event()
+
+    async def _slow_mint(method, host, path):
+        minting.set()
+        await release.wait()
+        return "old-key-token"
+
+    pool = JwtPool(_slow_mint, [ENDPOINT], size=1)
+    refill = asyncio.ensure_future(pool.refill())
+    await minting.wait()
+
+    # Execute
+    pool.clear()
+    release.set()
+    await refill
+
+    # Verify
+    assert pool.take(*ENDPOINT) is None
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_mint_errors_do_not_stop_refilling():
+    """Test that a failure to mint does not stop the background task."""
+    # Setup
+    attempts = []
+
+    async def _failing_mint(method, host, path):
+        attempts.append(path)
+        raise ValueError("Failed to generate JWT")
+
+    pool = JwtPool(_failing_mint, [ENDPOINT], refill_interval=0.01)
+
+    # Execute
+    token = pool.take(*ENDPOINT)
+    await asyncio.sleep(0.05)
+
+    # Verify
+    assert token is None
+    assert not pool._task.done()
+    assert len(attempts) > 1
+    await pool.close()
+    assert pool._task is None
@@ -1,6 +1,12 @@
+import asyncio
 from unittest.mock import patch
 
+import jwt as jwt_lib
+import pytest
+
 from cdp.auth.utils.ws import (
+    GetWebSocketAuthHeadersOptions,
+    WebSocketAuthHeadersProvider,
     get_websocket_auth_headers,
 )
 
@@ -65,3 +71,107 @@ def test_correlation_context(mock_correlation, mock_jwt, websocket_auth_options_
     # Verify
     mock_correlation.assert_called_once_with(options.source, options.source_version)
     assert headers["Correlation-Context"] == "test-correlation-data"
+
+
+def test_websocket_auth_headers_provider_reuses_headers(ec_private_key_factory):
+    """Test that the provider only signs new headers when they are about to expire."""
+    # Setup
+    options = GetWebSocketAuthHeadersOptions(
+        api_key_id="test-key-id", api_key_secret=ec_private_key_factory(), source="test-source"
+    )
+    provider = WebSocketAuthHeadersProvider(options, refresh_margin=30)
+
+    # Execute
+    with patch("cdp.auth.utils.ws.time.time", return_value=1_000_000):
+        first = provider.get_headers()
+    with patch("cdp.auth.utils.ws.time.time", return_value=1_000_089):
+        reused = provider.get_headers()
+    with patch("cdp.auth.utils.ws.time.time", return_value=1_000_090):
+        refreshed = provider.get_headers()
+
+    # Verify
+    assert reused == first
+    assert refreshed != first
+    assert provider.expires_at == 1_000_090 + 120
+    assert "source=test-source" in first["Correlation-Context"]
+    decoded = jwt_lib.decode(
+        first["Authorization"].removeprefix("Bearer "), options={"verify_signature": False}
+    )
+    assert "uris" not in decoded
+
+
+def test_websocket_auth_headers_provider_refresh(ec_private_key_factory):
+    """Test that refreshing signs new headers even if the current ones are still valid."""
+    # Setup
+    options = GetWebSocketAuthHeadersOptions(
+        api_key_id="test-key-id", api_key_secret=ec_private_key_factory()
+    )
+    provider = WebSocketAuthHeadersProvider(options)
+    first = provider.get_headers()
+
+    # Execute
+    refreshed = provider.refresh()
+
+    # Verify
+    assert refreshed != first
+    assert provider.get_headers() == refreshed
+
+
+def test_websocket_auth_headers_provider_invalid_margin(websocket_auth_options_factory):
+    """Test that the refresh margin must leave room for refreshing ahead of expiry."""
+    with pytest.raises(ValueError, match="twice the refresh margin"):
+        WebSocketAuthHeadersProvider(websocket_auth_options_factory(), refresh_margin=60)
+
+
+@pytest.mark.asyncio
+async def test_websocket_auth_headers_provider_refreshes_in_background(ec_private_key_factory):
+    """Test that the background task refreshes the headers ahead of expiry and calls the hook."""
+    # Setup
+    options = GetWebSocketAuthHeadersOptions(
+        api_key_id="test-key-id", api_key_secret=ec_private_key_factory(), expires_in=3
+    )
+    refreshed = []
+
+    async def on_refresh(headers):
+        refreshed.append(headers)
+
+    # Execute
+    async with WebSocketAuthHeadersProvider(
+        options, refresh_margin=1, on_refresh=on_refresh
+    ) as provider:
+        for _ in range(150):
+            if len(refreshed) == 2:
+                break
+            await asyncio.sleep(0.01)
+        current = provider.get_headers()
+        task = provider._task
+
+    # Verify
+    assert len(refreshed) == 2
+    assert refreshed[0] != refreshed[1]
+    assert current == refreshed[1]
+    assert task.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_websocket_auth_headers_provider_survives_hook_errors(ec_private_key_factory):
+    """Test that a failing refresh hook does not stop the background task."""
+    # Setup
+    options = GetWebSocketAuthHeadersOptions(
+        api_key_id="test-key-id", api_key_secret=ec_private_key_factory()
+    )
+
+    def on_refresh(headers):
+        raise RuntimeError("reconnect failed")
+
+    provider = WebSocketAuthHeadersProvider(options, on_refresh=on_refresh)
+
+    # Execute
+    provider.start()
+    await asyncio.sleep(0.01)
+
+    # Verify
+    assert provider.expires_at is not None
+    assert not provider._task.done()
+    await provider.close()
+    assert provider._task is None
@@ -1,14 +1,17 @@
+from functools import lru_cache
+from importlib.metadata import version
 from typing import Any
 
 from pydantic import BaseModel, Field
 
 from cdp.auth.utils.jwt import (
     JwtOptions,
-    WalletJwtOptions,
-    generate_jwt,
-    generate_wallet_jwt,
+    JwtSigner,
+    WalletJwtSigner,
 )
 
+_WALLET_SECRET_NOT_CONFIGURED_MESSAGE = "Wallet Secret not configured. Please set the CDP_WALLET_SECRET environment variable, or pass it as an option to the CdpClient constructor."
+
 
 class GetAuthHeadersOptions(BaseModel):
     """Options for generating authentication headers.
@@ -44,6 +47,9 @@ class GetAuthHeadersOptions(BaseModel):
 def get_auth_headers(options: GetAuthHeadersOptions) -> dict[str, str]:
     """Get authentication headers for a request.
 
+    The options are validated, then the headers are built by the same path as the SDK's own
+    clients, with signers that are reused across calls with the same credentials.
+
     Args:
         options: The authentication header options
 
@@ -51,9 +57,7 @@ def get_auth_headers(options: GetAuthHeadersOptions) -> dict[str, str]:
         Dict with authentication headers
 
     """
-    headers = {}
-
-    # Create JWT options
+    # Validate the request details the JWT is signed for
     jwt_options = JwtOptions(
         api_key_id=options.api_key_id,
         api_key_secret=options.api_key_secret,
@@ -64,38 +68,179 @@ def get_auth_headers(options: GetAuthHeadersOptions) -> dict[str, str]:
         audience=options.audience,
     )
 
-    # Generate and add JWT token
-    jwt_token = generate_jwt(jwt_options)
-    headers["Authorization"] = f"Bearer {jwt_token}"
-    headers["Content-Type"] = "application/json"
+    signer, wallet_signer = _get_process_signers(
+        options.api_key_id, options.api_key_secret, options.wallet_secret, None
+    )
+    return _get_auth_headers(
+        signer,
+        wallet_signer,
+        jwt_options.request_method,
+        options.request_host,
+        options.request_path,
+        options.request_body,
+        _get_correlation_data(options.source, options.source_version),
+        expires_in=options.expires_in,
+        audience=options.audience,
+    )
+
+
+def _get_auth_headers(
+    signer: JwtSigner,
+    wallet_signer: WalletJwtSigner,
+    request_method: str,
+    request_host: str,
+    request_path: str,
+    request_body: dict[str, Any] | None = None,
+    correlation_context: str | None = None,
+    *,
+    expires_in: int | None = None,
+    audience: list[str] | None = None,
+    bearer_token: str | None = None,
+) -> dict[str, str]:
+    """Get authentication headers for a request using signers held by a client.
+
+    This is the per-request path of the SDK's own clients. Unlike get_auth_headers, it takes
+    plain arguments and skips building and validating pydantic option models, since the
+    clients already pass well-formed values.
+
+    Args:
+        signer: The signer holding the API key
+        wallet_signer: The signer holding the wallet secret
+        request_method: The HTTP method in uppercase
+        request_host: The request host
+        request_path: The request path
+        request_body: Optional request body
+        correlation_context: The client's precomputed Correlation-Context header value, as
+            returned by _get_correlation_data. Defaults to the SDK's own correlation data.
+        expires_in: Optional JWT expiration time in seconds
+        audience: Optional audience claim for the JWT
+        bearer_token: Optional JWT that was already signed for this request, e.g. taken from a
+            JwtPool. When provided, the signer is not used.
+
+    Returns:
+        Dict with authentication headers
+
+    """
+    if bearer_token is None:
+        bearer_token = signer.generate_jwt(
+            request_method, request_host, request_path, expires_in, audience
+        )
+    headers = {
+        "Authorization": f"Bearer {bearer_token}",
+        "Content-Type": "application/json",
+    }
 
     # Add wallet auth if needed
-    if _requires_wallet_auth(options.request_method, options.request_path):
-        if not options.wallet_secret:
-            raise ValueError(
-                "Wallet Secret not configured. Please set the CDP_WALLET_SECRET environment variable, or pass it as an option to the CdpClient constructor.",
-            )
-
-        wallet_auth_token = generate_wallet_jwt(
-            WalletJwtOptions(
-                wallet_auth_key=options.wallet_secret,
-                request_method=options.request_method,
-                request_host=options.request_host,
-                request_path=options.request_path,
-                request_data=options.request_body or {},
-            )
+    if _requires_wallet_auth(request_method, request_path):
+        if not wallet_signer.wallet_secret:
+            raise ValueError(_WALLET_SECRET_NOT_CONFIGURED_MESSAGE)
+
+        headers["X-Wallet-Auth"] = wallet_signer.generate_wallet_jwt(
+            request_method, request_host, request_path, request_body
         )
-        headers["X-Wallet-Auth"] = wallet_auth_token
 
     # Add correlation data
-    headers["Correlation-Context"] = _get_correlation_data(
-        options.source,
-        options.source_version,
+    headers["Correlation-Context"] = (
+        correlation_context if correlation_context is not None else _get_correlation_data()
     )
 
     return headers
 
 
+def _get_auth_headers_with_credentials(
+    api_key_id: str,
+    api_key_secret: str,
+    wallet_secret: str | None,
+    jwt_cache_margin: int | None,
+    request_method: str,
+    request_host: str,
+    request_path: str,
+    request_body: dict[str, Any] | None = None,
+    correlation_context: str | None = None,
+    bearer_token: str | None = None,
+) -> dict[str, str]:
+    """Get authentication headers from raw credentials, reusing signers within the process.
+
+    Signers cannot be pickled, so this is the entry point used when signing is offloaded to a
+    process pool, and by callers that only hold raw credentials. Each process keeps its own
+    signers for the credentials it has seen.
+
+    Args:
+        api_key_id: The API key ID
+        api_key_secret: The API key secret
+        wallet_secret: The wallet secret
+        jwt_cache_margin: The JWT cache margin of the signer, or None to disable JWT reuse
+        request_method: The HTTP method in uppercase
+        request_host: The request host
+        request_path: The request path
+        request_body: Optional request body
+        correlation_context: The precomputed Correlation-Context header value
+        bearer_token: Optional JWT that was already signed for this request
+
+    Returns:
+        Dict with authentication headers
+
+    """
+    signer, wallet_signer = _get_process_signers(
+        api_key_id, api_key_secret, wallet_secret, jwt_cache_margin
+    )
+    return _get_auth_headers(
+        signer,
+        wallet_signer,
+        request_method,
+        request_host,
+        request_path,
+        request_body,
+        correlation_context,
+        bearer_token=bearer_token,
+    )
+
+
+def _generate_jwt_with_credentials(
+    api_key_id: str,
+    api_key_secret: str,
+    request_method: str,
+    request_host: str,
+    request_path: str,
+) -> str:
+    """Generate a JWT from raw credentials, reusing the signer within the process.
+
+    The counterpart of _get_auth_headers_with_credentials for minting JWTs in a process pool.
+
+    Args:
+        api_key_id: The API key ID
+        api_key_secret: The API key secret
+        request_method: The HTTP method in uppercase
+        request_host: The request host
+        request_path: The request path
+
+    Returns:
+        The generated JWT string
+
+    """
+    signer, _ = _get_process_signers(api_key_id, api_key_secret, None, None)
+    return signer.generate_jwt(request_method, request_host, request_path)
+
+
+@lru_cache(maxsize=8)
+def _get_process_signers(
+    api_key_id: str, api_key_secret: str, wallet_secret: str | None, jwt_cache_margin: int | None
+) -> tuple[JwtSigner, WalletJwtSigner]:
+    """Return the signers of the current process for the given credentials.
+
+    Args:
+        api_key_id: The API key ID
+        api_key_secret: The API key secret
+        wallet_secret: The wallet secret
+        jwt_cache_margin: The JWT cache margin of the signer
+
+    Returns:
+        The API key signer and the wallet signer
+
+    """
+    return JwtSigner(api_key_id, api_key_secret, jwt_cache_margin), WalletJwtSigner(wallet_secret)
+
+
 def _requires_wallet_auth(method: str, path: str) -> bool:
     """Determine if the request requires wallet authentication.
 
@@ -110,9 +255,13 @@ def _requires_wallet_auth(method: str, path: str) -> bool:
     return "/accounts" in path and (method == "POST" or method == "DELETE")
 
 
+@lru_cache(maxsize=32)
 def _get_correlation_data(source: str | None = None, source_version: str | None = None) -> str:
     """Return encoded correlation data including the SDK version and language.
 
+    The result is cached per source and source version, as looking up the installed SDK
+    version reads package metadata from disk.
+
     Args:
         source: Optional source identifier
         source_version: Optional source version
@@ -121,8 +270,6 @@ def _get_correlation_data(source: str | None = None, source_version: str | None
         Encoded correlation data as a query string
 
     """
-    from importlib.metadata import version
-
     sdk_version = version("cdp-sdk")
 
     data = {
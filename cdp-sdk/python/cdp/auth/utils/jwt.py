@@ -2,8 +2,12 @@ import base64
 import hashlib
 import json
 import random
+import threading
 import time
 import uuid
+from collections import OrderedDict
+from collections.abc import Sequence
+from concurrent.futures import Executor
 from datetime import datetime
 from typing import Any
 from urllib.parse import urlparse
@@ -13,8 +17,6 @@ from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.primitives.asymmetric import ec, ed25519
 from pydantic import BaseModel, Field, field_validator
 
-from cdp.utils import sort_keys
-
 
 class JwtOptions(BaseModel):
     r"""Configuration options for JWT generation.
@@ -148,64 +150,270 @@ def generate_jwt(options: JwtOptions) -> str:
     if not options.api_key_secret:
         raise ValueError("Private key is required")
 
-    # Check if we have a REST API request or a websocket connection
-    has_all_uri_params = all([options.request_method, options.request_host, options.request_path])
-    has_no_uri_params = all(
-        param is None
-        for param in [options.request_method, options.request_host, options.request_path]
-    )
+    # Build the uris claim, or None for JWTs intended for websocket connections
+    uri = _build_uri(options.request_method, options.request_host, options.request_path)
 
-    # Ensure we either have all request parameters or none (for websocket)
-    if not (has_all_uri_params or has_no_uri_params):
-        raise ValueError(
-            "Either all request details (method, host, path) must be provided, or all must be None for JWTs intended for websocket connections"
+    try:
+        private_key, algorithm = _load_private_key(options.api_key_secret)
+        return _encode_jwt(
+            private_key, algorithm, options.api_key_id, uri, options.expires_in, options.audience
+        )
+
+    except Exception as error:
+        raise ValueError(f"Failed to generate JWT: {error!s}") from error
+
+
+def generate_jwts(
+    options: Sequence[JwtOptions], executor: Executor | None = None, chunk_size: int = 256
+) -> list[str]:
+    """Generate many JWTs (Bearer tokens) at once, e.g. for fan-out workloads.
+
+    The options are grouped by API key and split into chunks of at most ``chunk_size`` tokens.
+    Each API key secret is parsed once per chunk rather than once per token. The chunks are
+    signed one after the other, or concurrently in ``executor`` if one is given. Pass a
+    ``ProcessPoolExecutor`` to spread signing across CPU cores; only the credentials and claims
+    are sent to the worker processes, never parsed keys.
+
+    Args:
+        options: The configuration options for each JWT
+        executor: Optional executor in which the chunks are signed
+        chunk_size: The maximum number of JWTs signed per chunk
+
+    Returns:
+        The generated JWTs, in the same order as the options
+
+    Raises:
+        ValueError: If required parameters are missing, invalid, or if JWT signing fails
+
+    """
+    # Validate every request up front, so that no key is parsed for an invalid batch
+    groups: dict[tuple[str, str], list[tuple[int, str | None, int | None, list[str] | None]]] = {}
+    for index, option in enumerate(options):
+        if not option.api_key_id:
+            raise ValueError("Key ID is required")
+        if not option.api_key_secret:
+            raise ValueError("Private key is required")
+        uri = _build_uri(option.request_method, option.request_host, option.request_path)
+        groups.setdefault((option.api_key_id, option.api_key_secret), []).append(
+            (index, uri, option.expires_in, option.audience)
         )
 
+    chunks = [
+        (api_key_id, api_key_secret, requests[start : start + chunk_size])
+        for (api_key_id, api_key_secret), requests in groups.items()
+        for start in range(0, len(requests), chunk_size)
+    ]
+    api_key_ids = [api_key_id for api_key_id, _, _ in chunks]
+    api_key_secrets = [api_key_secret for _, api_key_secret, _ in chunks]
+    claims = [[request[1:] for request in requests] for _, _, requests in chunks]
+
+    map_chunks = executor.map if executor is not None else map
+    tokens: list[str] = [""] * len(options)
     try:
-        # Parse the private key
-        private_key = _parse_private_key(options.api_key_secret)
-
-        # Determine algorithm based on key type
-        if isinstance(private_key, ec.EllipticCurvePrivateKey):
-            algorithm = "ES256"
-        elif isinstance(private_key, ed25519.Ed25519PrivateKey):
-            algorithm = "EdDSA"
-        else:
-            raise ValueError("Unsupported key type")
-
-        # Create header with nonce
-        header = {
-            "alg": algorithm,
-            "kid": options.api_key_id,
-            "typ": "JWT",
-            "nonce": _generate_nonce(),
-        }
-
-        # Create claims with timing
-        now = int(time.time())
-        expires_in = options.expires_in or 120  # Default to 120 seconds
-
-        claims = {
-            "sub": options.api_key_id,
-            "iss": "cdp",
-            "aud": options.audience if options.audience is not None else ["cdp_service"],
-            "nbf": now,
-            "exp": now + expires_in,
-        }
-
-        # Add the uris claim only for JWTs intended for REST API requests, not for websocket connections
-        if has_all_uri_params:
-            # Build the URI claim
-            parsed_url = urlparse(f"{options.request_host}{options.request_path}")
-            uri = f"{options.request_method} {parsed_url.netloc}{parsed_url.path}"
-            claims["uris"] = [uri]
-
-        # Generate the JWT
-        return jwt.encode(claims, private_key, algorithm=algorithm, headers=header)
+        results = map_chunks(_generate_jwt_chunk, api_key_ids, api_key_secrets, claims)
+        for (_, _, requests), chunk_tokens in zip(chunks, results, strict=True):
+            for (index, *_), token in zip(requests, chunk_tokens, strict=True):
+                tokens[index] = token
 
     except Exception as error:
         raise ValueError(f"Failed to generate JWT: {error!s}") from error
 
+    return tokens
+
+
+class JwtSigner:
+    """Generates JWTs (Bearer tokens) with an API key that is parsed only once.
+
+    Parsing the PEM or base64 encoded API key secret is much more expensive than signing
+    with it, so long-lived clients should hold a single signer and reuse it for every request.
+    The key is parsed on first use and cached together with its signing algorithm. Use
+    ``rotate`` to replace the credentials; the cached key is dropped and the new secret is
+    parsed on the next call.
+
+    Optionally, JWTs for GET requests can be reused: a JWT is bound to the method, host and
+    path of a request, so repeated polls of the same resource can share one token until
+    ``cache_margin`` seconds before it expires.
+
+    Args:
+        api_key_id: The API key ID
+        api_key_secret: The API key secret, either a PEM EC key or a base64 Ed25519 key
+        cache_margin: Optional safety margin in seconds. When set, JWTs for GET requests are
+            cached and reused until this many seconds before they expire.
+
+    """
+
+    def __init__(
+        self, api_key_id: str, api_key_secret: str, cache_margin: int | None = None
+    ) -> None:
+        # (api_key_id, api_key_secret, private_key, algorithm), swapped as a whole so that
+        # concurrent callers never observe a key that does not belong to the current secret.
+        self._state: tuple[str, str, Any, str | None] = (api_key_id, api_key_secret, None, None)
+        self._token_cache = _JwtCache(cache_margin) if cache_margin is not None else None
+
+    @property
+    def api_key_id(self) -> str:
+        """Get the API key ID."""
+        return self._state[0]
+
+    @property
+    def api_key_secret(self) -> str:
+        """Get the API key secret."""
+        return self._state[1]
+
+    @property
+    def algorithm(self) -> str:
+        """Get the JWT signing algorithm for the API key, parsing the key if needed."""
+        return self._load()[1]
+
+    def rotate(self, api_key_id: str, api_key_secret: str) -> None:
+        """Replace the credentials used for signing.
+
+        Args:
+            api_key_id: The new API key ID
+            api_key_secret: The new API key secret
+
+        """
+        self._state = (api_key_id, api_key_secret, None, None)
+        if self._token_cache is not None:
+            self._token_cache.clear()
+
+    def generate_jwt(
+        self,
+        request_method: str | None = None,
+        request_host: str | None = None,
+        request_path: str | None = None,
+        expires_in: int | None = None,
+        audience: list[str] | None = None,
+        use_cache: bool = True,
+    ) -> str:
+        """Generate a JWT (Bearer token) using the cached API key.
+
+        Accepts the same request details as ``JwtOptions``. Leaving all of request_method,
+        request_host and request_path as None produces a JWT intended for websocket connections.
+
+        Args:
+            request_method: The HTTP method for the request
+            request_host: The host for the request
+            request_path: The path for the request
+            expires_in: Optional expiration time in seconds (defaults to 120)
+            audience: Optional audience claim for the JWT
+            use_cache: Whether a cached JWT may be returned for GET requests when the signer
+                has a cache_margin (defaults to True). Pass False to always sign a new JWT.
+
+        Returns:
+            The generated JWT (Bearer token) string
+
+        Raises:
+            ValueError: If required parameters are missing, invalid, or if JWT signing fails
+
+        """
+        api_key_id, api_key_secret = self._state[0], self._state[1]
+        if not api_key_id:
+            raise ValueError("Key ID is required")
+        if not api_key_secret:
+            raise ValueError("Private key is required")
+
+        if request_method is not None:
+            request_method = request_method.upper()
+        uri = _build_uri(request_method, request_host, request_path)
+
+        cache_key = None
+        if use_cache and self._token_cache is not None and request_method == "GET":
+            cache_key = (
+                api_key_id,
+                uri,
+                tuple(audience) if audience is not None else None,
+                expires_in,
+            )
+            token = self._token_cache.get(cache_key)
+            if token is not None:
+                return token
+
+        try:
+            private_key, algorithm = self._load()
+            issued_at = int(time.time())
+            token = _encode_jwt(private_key, algorithm, api_key_id, uri, expires_in, audience)
+
+        except Exception as error:
+            raise ValueError(f"Failed to generate JWT: {error!s}") from error
+
+        if cache_key is not None:
+            self._token_cache.put(cache_key, token, issued_at + (expires_in or 120))
+        return token
+
+    def _load(self) -> tuple[ec.EllipticCurvePrivateKey | ed25519.Ed25519PrivateKey, str]:
+        """Return the parsed private key and its algorithm, parsing the secret on first use.
+
+        Returns:
+            A tuple of the private key and its JWT algorithm
+
+        """
+        state = self._state
+        api_key_id, api_key_secret, private_key, algorithm = state
+        if private_key is None:
+            private_key, algorithm = _load_private_key(api_key_secret)
+            # Only cache the parsed key if the credentials were not rotated meanwhile.
+            if self._state is state:
+                self._state = (api_key_id, api_key_secret, private_key, algorithm)
+        return private_key, algorithm
+
+
+class _JwtCache:
+    """A thread-safe LRU cache of signed JWTs that are reused until shortly before they expire.
+
+    Args:
+        margin: The number of seconds before expiry after which a cached JWT is no longer reused
+        max_size: The maximum number of cached JWTs
+
+    """
+
+    def __init__(self, margin: int, max_size: int = 1024) -> None:
+        self._margin = margin
+        self._max_size = max_size
+        self._tokens: OrderedDict[tuple, tuple[str, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple) -> str | None:
+        """Return the cached JWT for the key, or None if it is missing or about to expire.
+
+        Args:
+            key: The cache key
+
+        Returns:
+            The cached JWT, or None
+
+        """
+        with self._lock:
+            entry = self._tokens.get(key)
+            if entry is None:
+                return None
+            token, expires_at = entry
+            if time.time() >= expires_at - self._margin:
+                del self._tokens[key]
+                return None
+            self._tokens.move_to_end(key)
+            return token
+
+    def put(self, key: tuple, token: str, expires_at: float) -> None:
+        """Cache a JWT.
+
+        Args:
+            key: The cache key
+            token: The signed JWT
+            expires_at: The expiry of the JWT as a Unix timestamp
+
+        """
+        with self._lock:
+            self._tokens[key] = (token, expires_at)
+            self._tokens.move_to_end(key)
+            while len(self._tokens) > self._max_size:
+                self._tokens.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached JWTs."""
+        with self._lock:
+            self._tokens.clear()
+
 
 def generate_wallet_jwt(options: WalletJwtOptions) -> str:
     """Build a wallet authentication JWT for the given API endpoint URL.
@@ -226,32 +434,270 @@ def generate_wallet_jwt(options: WalletJwtOptions) -> str:
         raise ValueError("Server Wallet Secret is not defined")
 
     uri = f"{options.request_method} {options.request_host}{options.request_path}"
+
+    try:
+        private_key = _load_wallet_key(options.wallet_auth_key)
+        return _encode_wallet_jwt(private_key, uri, options.request_data)
+
+    except Exception as error:
+        raise ValueError(f"Could not create the EC key: {error!s}") from error
+
+
+class WalletJwtSigner:
+    """Generates Wallet Auth JWTs with a wallet secret that is decoded only once.
+
+    Decoding the base64 DER wallet secret on every write request is avoidable overhead, so
+    long-lived clients should hold a single signer and reuse it. The EC key is loaded on first
+    use and cached. Use ``rotate`` to replace the wallet secret.
+
+    Args:
+        wallet_secret: The base64 encoded DER wallet secret
+
+    """
+
+    def __init__(self, wallet_secret: str | None) -> None:
+        # (wallet_secret, private_key), swapped as a whole on rotation.
+        self._state: tuple[str | None, ec.EllipticCurvePrivateKey | None] = (wallet_secret, None)
+
+    @property
+    def wallet_secret(self) -> str | None:
+        """Get the wallet secret."""
+        return self._state[0]
+
+    def rotate(self, wallet_secret: str | None) -> None:
+        """Replace the wallet secret used for signing.
+
+        Args:
+            wallet_secret: The new wallet secret
+
+        """
+        self._state = (wallet_secret, None)
+
+    def generate_wallet_jwt(
+        self,
+        request_method: str,
+        request_host: str,
+        request_path: str,
+        request_data: dict[str, Any] | None = None,
+    ) -> str:
+        """Generate a Wallet Auth JWT using the cached wallet key.
+
+        Args:
+            request_method: The HTTP method for the request
+            request_host: The host for the request
+            request_path: The path for the request
+            request_data: The request data, hashed into the reqHash claim when not empty
+
+        Returns:
+            The generated JWT string
+
+        Raises:
+            ValueError: If the wallet secret is missing or if JWT signing fails
+
+        """
+        state = self._state
+        wallet_secret, private_key = state
+        if not wallet_secret:
+            raise ValueError("Server Wallet Secret is not defined")
+
+        uri = f"{request_method.upper()} {request_host}{request_path}"
+
+        try:
+            if private_key is None:
+                private_key = _load_wallet_key(wallet_secret)
+                # Only cache the loaded key if the secret was not rotated meanwhile.
+                if self._state is state:
+                    self._state = (wallet_secret, private_key)
+            return _encode_wallet_jwt(private_key, uri, request_data)
+
+        except Exception as error:
+            raise ValueError(f"Could not create the EC key: {error!s}") from error
+
+
+def _build_uri(
+    request_method: str | None, request_host: str | None, request_path: str | None
+) -> str | None:
+    """Build the value of the uris claim for a REST API request.
+
+    Args:
+        request_method: The HTTP method for the request, or None for websocket JWTs
+        request_host: The host for the request, or None for websocket JWTs
+        request_path: The path for the request, or None for websocket JWTs
+
+    Returns:
+        The URI claim value, or None for JWTs intended for websocket connections
+
+    Raises:
+        ValueError: If only some of the request details are provided
+
+    """
+    if request_method and request_host and request_path:
+        parsed_url = urlparse(f"{request_host}{request_path}")
+        return f"{request_method} {parsed_url.netloc}{parsed_url.path}"
+
+    # Ensure we either have all request parameters or none (for websocket)
+    if request_method is None and request_host is None and request_path is None:
+        return None
+
+    raise ValueError(
+        "Either all request details (method, host, path) must be provided, or all must be None for JWTs intended for websocket connections"
+    )
+
+
+def _encode_jwt(
+    private_key: ec.EllipticCurvePrivateKey | ed25519.Ed25519PrivateKey,
+    algorithm: str,
+    api_key_id: str,
+    uri: str | None,
+    expires_in: int | None,
+    audience: list[str] | None,
+) -> str:
+    """Sign the claims of a JWT (Bearer token) with an already parsed private key.
+
+    Args:
+        private_key: The parsed API key
+        algorithm: The JWT algorithm matching the key type
+        api_key_id: The API key ID
+        uri: The uris claim value, or None for JWTs intended for websocket connections
+        expires_in: Optional expiration time in seconds (defaults to 120)
+        audience: Optional audience claim for the JWT
+
+    Returns:
+        The signed JWT string
+
+    """
+    # Create header with nonce
+    header = {
+        "alg": algorithm,
+        "kid": api_key_id,
+        "typ": "JWT",
+        "nonce": _generate_nonce(),
+    }
+
+    # Create claims with timing
+    now = int(time.time())
+    expires_in = expires_in or 120  # Default to 120 seconds
+
+    claims = {
+        "sub": api_key_id,
+        "iss": "cdp",
+        "aud": audience if audience is not None else ["cdp_service"],
+        "nbf": now,
+        "exp": now + expires_in,
+    }
+
+    # Add the uris claim only for JWTs intended for REST API requests, not for websocket connections
+    if uri is not None:
+        claims["uris"] = [uri]
+
+    return jwt.encode(claims, private_key, algorithm=algorithm, headers=header)
+
+
+def _generate_jwt_chunk(
+    api_key_id: str,
+    api_key_secret: str,
+    claims: list[tuple[str | None, int | None, list[str] | None]],
+) -> list[str]:
+    """Sign a chunk of JWTs with one API key, parsing the key once for the whole chunk.
+
+    Runs in the executor passed to generate_jwts, so it must stay a picklable module-level
+    function.
+
+    Args:
+        api_key_id: The API key ID
+        api_key_secret: The API key secret
+        claims: The (uri, expires_in, audience) tuple of each JWT
+
+    Returns:
+        The signed JWTs, in the same order as the claims
+
+    """
+    private_key, algorithm = _load_private_key(api_key_secret)
+    return [
+        _encode_jwt(private_key, algorithm, api_key_id, uri, expires_in, audience)
+        for uri, expires_in, audience in claims
+    ]
+
+
+def _load_private_key(
+    key_data: str,
+) -> tuple[ec.EllipticCurvePrivateKey | ed25519.Ed25519PrivateKey, str]:
+    """Parse a private key and determine the JWT algorithm to sign with it.
+
+    Args:
+        key_data: The private key data in either PEM (EC) or base64 (Ed25519) format
+
+    Returns:
+        A tuple of the parsed private key and its JWT algorithm
+
+    Raises:
+        ValueError: If the key cannot be parsed or is of an unsupported type
+
+    """
+    private_key = _parse_private_key(key_data)
+
+    # Determine algorithm based on key type
+    if isinstance(private_key, ec.EllipticCurvePrivateKey):
+        return private_key, "ES256"
+    elif isinstance(private_key, ed25519.Ed25519PrivateKey):
+        return private_key, "EdDSA"
+    raise ValueError("Unsupported key type")
+
+
+def _load_wallet_key(wallet_secret: str) -> ec.EllipticCurvePrivateKey:
+    """Load the EC private key from a base64 encoded DER wallet secret.
+
+    Args:
+        wallet_secret: The base64 encoded DER wallet secret
+
+    Returns:
+        The parsed EC private key
+
+    """
+    return serialization.load_der_private_key(base64.b64decode(wallet_secret), password=None)
+
+
+def _encode_wallet_jwt(
+    private_key: ec.EllipticCurvePrivateKey, uri: str, request_data: dict[str, Any] | None
+) -> str:
+    """Sign the claims of a Wallet Auth JWT with an already loaded wallet key.
+
+    Args:
+        private_key: The loaded wallet key
+        uri: The uris claim value
+        request_data: The request data, hashed into the reqHash claim when not empty
+
+    Returns:
+        The signed JWT string
+
+    """
     now = int(datetime.now().timestamp())
 
     claims = {"uris": [uri], "iat": now, "nbf": now, "jti": str(uuid.uuid4())}
 
-    if options.request_data:
-        sorted_data = sort_keys(options.request_data)
-        json_bytes = json.dumps(sorted_data, separators=(",", ":"), sort_keys=True).encode("utf-8")
-        claims["reqHash"] = hashlib.sha256(json_bytes).hexdigest()
+    if request_data:
+        claims["reqHash"] = _hash_request_data(request_data)
 
-    try:
-        der_bytes = serialization.load_der_private_key(
-            base64.b64decode(options.wallet_auth_key), password=None
-        )
+    return jwt.encode(claims, private_key, algorithm="ES256", headers={"typ": "JWT"})
 
-        # Generate and sign the token
-        token = jwt.encode(
-            claims,
-            der_bytes,  # Use the private key directly
-            algorithm="ES256",
-            headers={"typ": "JWT"},
-        )
 
-        return token
+# Encodes JSON with recursively sorted keys and no whitespace in a single pass. Reusing one
+# encoder avoids building a new JSONEncoder for every json.dumps call with custom options.
+_canonical_json_encoder = json.JSONEncoder(separators=(",", ":"), sort_keys=True)
 
-    except Exception as error:
-        raise ValueError(f"Could not create the EC key: {error!s}") from error
+
+def _hash_request_data(request_data: dict[str, Any]) -> str:
+    """Hash the canonical JSON form of the request data for the reqHash claim.
+
+    Args:
+        request_data: The request data
+
+    Returns:
+        The hex encoded SHA-256 digest of the canonical JSON
+
+    """
+    json_bytes = _canonical_json_encoder.encode(request_data).encode("utf-8")
+    return hashlib.sha256(json_bytes).hexdigest()
 
 
 def _parse_private_key(
@@ -0,0 +1,131 @@
+import asyncio
+import contextlib
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+
+
+class JwtPool:
+    """Keeps pre-signed JWTs (Bearer tokens) for hot endpoints, so requests do not wait on signing.
+
+    A JWT is bound to the method, host and path of a request, so tokens can be minted ahead of
+    time for a known set of endpoints. A background task tops up the pool of each endpoint and
+    evicts tokens before they come within ``margin`` seconds of expiring. Every token is handed
+    out at most once, oldest first.
+
+    The background task is started by the first ``take`` call on a running event loop and is
+    restarted if that loop has gone away.
+
+    Args:
+        mint: Coroutine function that signs a JWT for a (method, host, path) request
+        endpoints: The (method, host, path) tuples to keep tokens for
+        size: The number of tokens to keep per endpoint
+        expires_in: The lifetime in seconds of the tokens returned by mint
+        margin: The number of seconds before expiry after which a token is discarded
+        refill_interval: The maximum number of seconds between two refills
+
+    """
+
+    def __init__(
+        self,
+        mint: Callable[[str, str, str], Awaitable[str]],
+        endpoints: list[tuple[str, str, str]],
+        size: int = 4,
+        expires_in: int = 120,
+        margin: int = 30,
+        refill_interval: float = 1.0,
+    ) -> None:
+        self._mint = mint
+        self._size = size
+        self._expires_in = expires_in
+        self._margin = margin
+        self._refill_interval = refill_interval
+        self._tokens: dict[tuple[str, str, str], deque[tuple[str, float]]] = {
+            (method.upper(), host, path): deque() for method, host, path in endpoints
+        }
+        self._task: asyncio.Task | None = None
+        self._wakeup: asyncio.Event | None = None
+        # Bumped by clear, so that tokens minted before it are not added to the pool after it
+        self._generation = 0
+
+    def take(self, method: str, host: str, path: str) -> str | None:
+        """Take a pre-signed JWT for the request, if one is available.
+
+        Must be called from a coroutine running on the event loop.
+
+        Args:
+            method: The HTTP method in uppercase
+            host: The request host
+            path: The request path
+
+        Returns:
+            A JWT that has not been handed out before, or None if the endpoint is not pooled or
+            its pool is empty
+
+        """
+        tokens = self._tokens.get((method, host, path))
+        if tokens is None:
+            return None
+
+        self._ensure_started()
+        self._wakeup.set()
+
+        now = time.time()
+        while tokens:
+            token, expires_at = tokens.popleft()
+            if expires_at - self._margin > now:
+                return token
+        return None
+
+    def clear(self) -> None:
+        """Discard all pre-signed JWTs, e.g. after the API key was rotated."""
+        self._generation += 1
+        for tokens in self._tokens.values():
+            tokens.clear()
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def refill(self) -> None:
+        """Evict expiring JWTs and top up the pool of every endpoint."""
+        for (method, host, path), tokens in self._tokens.items():
+            now = time.time()
+            while tokens and tokens[0][1] - self._margin <= now:
+                tokens.popleft()
+            while len(tokens) < self._size:
+                generation = self._generation
+                issued_at = int(time.time())
+                token = await self._mint(method, host, path)
+                if self._generation != generation:
+                    # The pool was cleared while minting, so the token may be signed with a
+                    # rotated key. The wakeup set by clear starts a new refill.
+                    return
+                tokens.append((token, issued_at + self._expires_in))
+
+    async def close(self) -> None:
+        """Stop the background refill task."""
+        task, self._task = self._task, None
+        if task is None or task.done():
+            return
+        task.cancel()
+        if task.get_loop() is asyncio.get_running_loop():
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+    def _ensure_started(self) -> None:
+        """Start the background refill task on the running event loop if it is not running."""
+        if self._task is None or self._task.done():
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def _run(self) -> None:
+        """Refill the pools whenever a token is taken, and at least every refill interval."""
+        # wait_for can swallow a cancellation that races with the wakeup, so the loop also stops
+        # once close has detached the task.
+        while self._task is asyncio.current_task():
+            self._wakeup.clear()
+            # A failure to mint (e.g. an invalid API key) must not stop the task. Requests fall
+            # back to signing inline, which surfaces the error to the caller.
+            with contextlib.suppress(Exception):
+                await self.refill()
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), self._refill_interval)
@@ -1,7 +1,17 @@
+import asyncio
+import contextlib
+import inspect
+import logging
+import time
+from collections.abc import Callable
+from typing import Any
+
 from pydantic import BaseModel, Field
 
 from cdp.auth.utils.http import _get_correlation_data
-from cdp.auth.utils.jwt import JwtOptions, generate_jwt
+from cdp.auth.utils.jwt import JwtOptions, JwtSigner, generate_jwt
+
+logger = logging.getLogger(__name__)
 
 
 class GetWebSocketAuthHeadersOptions(BaseModel):
@@ -60,3 +70,137 @@ def get_websocket_auth_headers(options: GetWebSocketAuthHeadersOptions) -> dict[
     )
 
     return headers
+
+
+class WebSocketAuthHeadersProvider:
+    """Issues WebSocket authentication headers and refreshes them before they expire.
+
+    Long-lived streaming connections need fresh headers whenever they reconnect. The provider
+    keeps the current headers and only signs a new JWT when they are about to expire, so
+    ``get_headers`` is cheap enough to call on every reconnect attempt. The API key is parsed
+    once.
+
+    Once ``start`` has been called on a running event loop, a background task re-signs the
+    headers ``2 * refresh_margin`` seconds before they expire, so ``get_headers`` never has to
+    sign inline, and passes the new headers to ``on_refresh``. Use the hook to re-authenticate
+    or reconnect open connections before their token expires. The provider can also be used as
+    an async context manager, which starts and stops the background task.
+
+    Args:
+        options: The WebSocket authentication header options
+        refresh_margin: The minimum remaining lifetime in seconds of the headers returned by
+            get_headers
+        on_refresh: Optional function or coroutine function called with the new headers after
+            every background refresh
+
+    Raises:
+        ValueError: If the JWT lifetime is not longer than twice the refresh margin
+
+    """
+
+    def __init__(
+        self,
+        options: GetWebSocketAuthHeadersOptions,
+        refresh_margin: int = 30,
+        on_refresh: Callable[[dict[str, str]], Any] | None = None,
+    ) -> None:
+        self._expires_in = options.expires_in or 120
+        if self._expires_in <= 2 * refresh_margin:
+            raise ValueError("expires_in must be longer than twice the refresh margin")
+
+        self._options = options
+        self._refresh_margin = refresh_margin
+        self._on_refresh = on_refresh
+        self._signer = JwtSigner(options.api_key_id, options.api_key_secret)
+        self._correlation_context = _get_correlation_data(options.source, options.source_version)
+        # (headers, expires_at), swapped as a whole on refresh
+        self._current: tuple[dict[str, str], float] | None = None
+        self._task: asyncio.Task | None = None
+
+    async def __aenter__(self) -> "WebSocketAuthHeadersProvider":
+        """Start the background refresh task when entering the async context manager."""
+        self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Stop the background refresh task when exiting the async context manager."""
+        await self.close()
+
+    @property
+    def expires_at(self) -> float | None:
+        """Get the expiry of the current headers as a Unix timestamp, or None if none exist."""
+        current = self._current
+        return current[1] if current is not None else None
+
+    def get_headers(self) -> dict[str, str]:
+        """Get authentication headers for a WebSocket connection.
+
+        Returns the current headers, and only signs new ones if they would expire within the
+        refresh margin.
+
+        Returns:
+            Dict with authentication headers
+
+        """
+        current = self._current
+        if current is None or time.time() >= current[1] - self._refresh_margin:
+            return self.refresh()
+        return dict(current[0])
+
+    def refresh(self) -> dict[str, str]:
+        """Sign new authentication headers, e.g. after the server rejected the current ones.
+
+        Returns:
+            Dict with the new authentication headers
+
+        """
+        issued_at = int(time.time())
+        jwt_token = self._signer.generate_jwt(
+            expires_in=self._expires_in, audience=self._options.audience
+        )
+        headers = {
+            "Authorization": f"Bearer {jwt_token}",
+            "Content-Type": "application/json",
+            "Correlation-Context": self._correlation_context,
+        }
+        self._current = (headers, issued_at + self._expires_in)
+        return dict(headers)
+
+    def start(self) -> None:
+        """Start the background refresh task on the running event loop if it is not running."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def close(self) -> None:
+        """Stop the background refresh task."""
+        task, self._task = self._task, None
+        if task is None or task.done():
+            return
+        task.cancel()
+        if task.get_loop() is asyncio.get_running_loop():
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+    async def _run(self) -> None:
+        """Refresh the headers ahead of expiry and notify the on_refresh hook."""
+        while self._task is asyncio.current_task():
+            current = self._current
+            if current is not None:
+                delay = current[1] - 2 * self._refresh_margin - time.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+            try:
+                headers = self.refresh()
+            except Exception:
+                logger.warning("Failed to refresh WebSocket auth headers", exc_info=True)
+                await asyncio.sleep(1)
+                continue
+
+            if self._on_refresh is not None:
+                try:
+                    result = self._on_refresh(headers)
+                    if inspect.isawaitable(result):
+                        await result
+                except Exception:
+                    logger.warning("WebSocket auth headers refresh hook failed", exc_info=True)
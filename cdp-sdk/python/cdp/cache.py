@@ -0,0 +1,303 @@
+import importlib
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import Any, TypeVar
+
+from pydantic import BaseModel
+
+T = TypeVar("T")
+
+# Cached resources
+EVM_ACCOUNT = "evm_account"
+EVM_SMART_ACCOUNT = "evm_smart_account"
+SOLANA_ACCOUNT = "solana_account"
+POLICY = "policy"
+
+DEFAULT_TTLS = {
+    EVM_ACCOUNT: 300.0,
+    EVM_SMART_ACCOUNT: 300.0,
+    SOLANA_ACCOUNT: 300.0,
+    POLICY: 60.0,
+}
+
+
+class CacheBackend(ABC):
+    """Storage for the entries of a ReadCache."""
+
+    @abstractmethod
+    def get(self, key: str) -> Any | None:
+        """Get an entry.
+
+        Args:
+            key: The key of the entry
+
+        Returns:
+            The value, or None if there is no entry or it has expired
+
+        """
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        """Store an entry.
+
+        Args:
+            key: The key of the entry
+            value: The value, an API model or a string
+            ttl: The number of seconds until the entry expires
+
+        """
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Remove an entry if it exists.
+
+        Args:
+            key: The key of the entry
+
+        """
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove all entries."""
+
+
+class MemoryCacheBackend(CacheBackend):
+    """An in-memory cache backend that evicts the least recently used entries.
+
+    Args:
+        max_entries: The maximum number of entries
+
+    """
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: str) -> Any | None:
+        """Get an entry, marking it as recently used."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        """Store an entry, evicting the least recently used entry if the cache is full."""
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        """Remove an entry if it exists."""
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+
+
+class DiskCacheBackend(CacheBackend):
+    """A cache backend that keeps entries in a local SQLite file, so they survive restarts.
+
+    Values are stored as JSON. Only API models of the SDK and strings can be cached, and
+    entries are only ever loaded back into those types.
+
+    Args:
+        path: The path of the SQLite file, which is created if it does not exist
+
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS entries "
+                "(key TEXT PRIMARY KEY, expires_at REAL, type TEXT, data TEXT)"
+            )
+
+    def get(self, key: str) -> Any | None:
+        """Get an entry."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT expires_at, type, data FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        expires_at, value_type, data = row
+        if expires_at <= time.time():
+            self.delete(key)
+            return None
+        return _decode(value_type, data)
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        """Store an entry."""
+        value_type, data = _encode(value)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?)",
+                (key, time.time() + ttl, value_type, data),
+            )
+
+    def delete(self, key: str) -> None:
+        """Remove an entry if it exists."""
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM entries WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM entries")
+
+    def close(self) -> None:
+        """Close the SQLite file."""
+        with self._lock:
+            self._connection.close()
+
+
+def _encode(value: Any) -> tuple[str, str]:
+    """Encode a value for the disk backend."""
+    if isinstance(value, str):
+        return "str", value
+    if isinstance(value, BaseModel) and type(value).__module__.startswith("cdp."):
+        model_type = type(value)
+        # The generated API models serialize their oneOf fields in to_json.
+        data = value.to_json() if hasattr(value, "to_json") else value.model_dump_json()
+        return f"{model_type.__module__}:{model_type.__qualname__}", data
+    raise TypeError(f"Cannot cache values of type {type(value).__name__} on disk")
+
+
+def _decode(value_type: str, data: str) -> Any | None:
+    """Decode a value of the disk backend."""
+    if value_type == "str":
+        return data
+    module_name, _, qualname = value_type.partition(":")
+    if not module_name.startswith("cdp."):
+        return None
+    model_type = getattr(importlib.import_module(module_name), qualname, None)
+    if not (isinstance(model_type, type) and issubclass(model_type, BaseModel)):
+        return None
+    if hasattr(model_type, "from_json"):
+        return model_type.from_json(data)
+    return model_type.model_validate_json(data)
+
+
+class ReadCache:
+    """A TTL cache for account, smart account and policy lookups.
+
+    The SDK stores the results of get_account, get_smart_account and get_policy_by_id calls in
+    the cache and returns them until they expire. Entries are removed when the client updates,
+    deletes or creates the same resource, so lookups see the changes made through the client.
+    Changes made elsewhere are seen once the entry expires.
+
+    Cached results are shared between calls, so treat them as read-only.
+
+    Args:
+        backend: Where to keep the entries. Defaults to a MemoryCacheBackend.
+        ttls: The number of seconds entries are kept, by resource (evm_account,
+            evm_smart_account, solana_account or policy). Resources that are not listed use
+            DEFAULT_TTLS, and a TTL of 0 disables caching of a resource.
+        enabled: Whether to cache at all. A disabled cache passes every lookup through.
+
+    """
+
+    def __init__(
+        self,
+        backend: CacheBackend | None = None,
+        ttls: dict[str, float] | None = None,
+        enabled: bool = True,
+    ) -> None:
+        self.backend = backend or MemoryCacheBackend()
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.enabled = enabled
+
+    async def fetch(self, resource: str, key: str, load: Callable[[], Awaitable[T]]) -> T:
+        """Get a resource by its ID, loading and caching it on a miss.
+
+        Args:
+            resource: The type of the resource
+            key: The ID of the resource, e.g. an address
+            load: Coroutine function that loads the resource from the API
+
+        Returns:
+            The resource
+
+        """
+        if not self._caches(resource):
+            return await load()
+        entry_key = f"{resource}:{key}"
+        value = self.backend.get(entry_key)
+        if value is None:
+            value = await load()
+            self.backend.set(entry_key, value, self.ttls[resource])
+        return value
+
+    async def fetch_by_name(
+        self,
+        resource: str,
+        name: str,
+        load: Callable[[], Awaitable[T]],
+        get_key: Callable[[T], str],
+    ) -> T:
+        """Get a resource by its name, loading and caching it on a miss.
+
+        The name is cached as a pointer to the ID of the resource, so invalidating the ID also
+        invalidates lookups by name, and the resource is shared with lookups by ID.
+
+        Args:
+            resource: The type of the resource
+            name: The name of the resource
+            load: Coroutine function that loads the resource from the API
+            get_key: Function that returns the ID of a loaded resource
+
+        Returns:
+            The resource
+
+        """
+        if not self._caches(resource):
+            return await load()
+        name_key = f"{resource}:name:{name}"
+        key = self.backend.get(name_key)
+        value = self.backend.get(f"{resource}:{key}") if key is not None else None
+        # The resource may have been renamed since the name was cached.
+        if value is None or getattr(value, "name", name) != name:
+            value = await load()
+            key = get_key(value)
+            self.backend.set(f"{resource}:{key}", value, self.ttls[resource])
+            self.backend.set(name_key, key, self.ttls[resource])
+        return value
+
+    def invalidate(self, resource: str, key: str | None = None, name: str | None = None) -> None:
+        """Remove the entries of a resource.
+
+        Args:
+            resource: The type of the resource
+            key: The ID of the resource, if known
+            name: The name of the resource, if known
+
+        """
+        if not self.enabled:
+            return
+        if key is not None:
+            self.backend.delete(f"{resource}:{key}")
+        if name is not None:
+            self.backend.delete(f"{resource}:name:{name}")
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self.backend.clear()
+
+    def _caches(self, resource: str) -> bool:
+        """Check whether a resource is cached."""
+        return self.enabled and self.ttls.get(resource, 0) > 0
@@ -1,11 +1,19 @@
 import os
+from concurrent.futures import Executor
 
 from cdp.__version__ import __version__
 from cdp.analytics import Analytics, wrap_class_with_error_tracking
 from cdp.api_clients import ApiClients
+from cdp.cache import ReadCache
 from cdp.constants import SDK_DEFAULT_SOURCE
 from cdp.evm_client import EvmClient
 from cdp.openapi_client.cdp_api_client import CdpApiClient
+from cdp.openapi_client.circuit_breaker import CircuitBreaker
+from cdp.openapi_client.codec import JsonCodec
+from cdp.openapi_client.hedging import Hedger
+from cdp.openapi_client.rate_limit import RateLimiter
+from cdp.openapi_client.retry import RetryBudget, RetryPolicy
+from cdp.openapi_client.transport import TransportConfig, TransportRegistry
 from cdp.policies_client import PoliciesClient
 from cdp.solana_client import SolanaClient
 
@@ -23,6 +31,22 @@ class CdpClient:
         max_network_retries: int = 3,
         source: str = SDK_DEFAULT_SOURCE,
         source_version: str = __version__,
+        jwt_cache_margin: int | None = None,
+        signing_executor: Executor | None = None,
+        hot_endpoints: list[tuple[str, str]] | None = None,
+        jwt_pool_size: int = 4,
+        transport_registry: TransportRegistry | None = None,
+        transport_config: TransportConfig | None = None,
+        retry_policy: RetryPolicy | None = None,
+        retry_budget: RetryBudget | None = None,
+        idempotent_writes: bool = False,
+        circuit_breaker: CircuitBreaker | None = None,
+        rate_limiter: RateLimiter | None = None,
+        coalesce_requests: bool = False,
+        read_cache: ReadCache | None = None,
+        hedger: Hedger | None = None,
+        json_codec: JsonCodec | None = None,
+        validate_api_calls: bool = True,
     ):
         """Instantiate the CdpClient.
 
@@ -32,9 +56,79 @@ class CdpClient:
             wallet_secret (str, optional): The wallet secret. Defaults to the CDP_WALLET_SECRET environment variable.
             debugging (bool, optional): Whether to enable debugging. Defaults to False.
             base_path (str, optional): The base path. Defaults to "https://api.cdp.coinbase.com/platform".
-            max_network_retries (int, optional): The maximum number of network retries. Defaults to 3.
+            max_network_retries (int, optional): The maximum number of retries of GET, HEAD and
+                OPTIONS requests on network errors, 429 and 5xx responses. Ignored when
+                retry_policy is given. Defaults to 3.
             source (str, optional): The source. Defaults to SDK_DEFAULT_SOURCE.
             source_version (str, optional): The source version. Defaults to __version__.
+            jwt_cache_margin (int, optional): When set, the JWTs signed for GET requests are reused
+                until this many seconds before they expire, which saves signing on polling loops
+                and paginated list calls. Defaults to None (disabled).
+            signing_executor (Executor, optional): A thread or process pool to sign requests in,
+                so that JWT signing does not block the event loop under heavy concurrency. The
+                executor is not shut down by the client. Defaults to None.
+            hot_endpoints (list[tuple[str, str]], optional): (method, path) pairs such as
+                ("POST", "/v2/evm/accounts/0x.../sign"), with paths relative to base_path, for
+                which JWTs are signed ahead of time in the background. Requests to them then skip
+                signing their Bearer token. Defaults to None.
+            jwt_pool_size (int, optional): The number of pre-signed JWTs kept per hot endpoint.
+                Defaults to 4.
+            transport_registry (TransportRegistry, optional): A registry of connection pools to
+                share with other clients, e.g. when creating one client per API key. Clients
+                with the same registry reuse each other's connections to the CDP API, while
+                keeping their own credentials. Closing the last client that uses the registry on
+                an event loop closes its connections there. Defaults to None, which gives the
+                client its own connection pool.
+            transport_config (TransportConfig, optional): Connection and timeout settings, such
+                as limit_per_host, keepalive_timeout, dns_cache_ttl, tcp_nodelay,
+                happy_eyeballs_delay, and separate read_timeout and write_timeout for GET and
+                for write requests. With a transport_registry, only the timeouts apply; the
+                connection settings come from the registry. Defaults to None.
+            retry_policy (RetryPolicy, optional): Which statuses and methods are retried, how
+                often, and the delays between attempts. Retries use decorrelated jitter and
+                honor Retry-After headers. Defaults to None, which retries GET, HEAD and OPTIONS
+                requests max_network_retries times.
+            retry_budget (RetryBudget, optional): Stops retrying while most requests fail, so
+                retries do not multiply the load during an outage. Share one budget between
+                clients to throttle them together. Defaults to None, which gives the client its
+                own budget.
+            idempotent_writes (bool, optional): Whether to send every write request that
+                accepts an idempotency key, such as creating an account or sending a
+                transaction, with a generated key unless one is passed. The key is reused when
+                the request is retried, so these writes are retried on 5xx responses and
+                connection errors like reads, without the risk of being applied twice. Writes
+                without idempotency keys, such as transfers, user operation sends and faucet
+                requests, are never retried. Defaults to False.
+            circuit_breaker (CircuitBreaker, optional): Per-endpoint circuit breakers. Once an
+                endpoint fails repeatedly, calls to it raise a CircuitOpenError right away
+                instead of waiting for timeouts and retries, while calls to other endpoints
+                continue. Defaults to None (disabled).
+            rate_limiter (RateLimiter, optional): Paces requests to the CDP API quotas, with
+                separate limits for groups of endpoints such as the faucet or signing. Requests
+                over the limit wait for their turn instead of failing, and the limits slow down
+                on 429 responses and follow rate limit headers. Defaults to None (disabled).
+            coalesce_requests (bool, optional): Whether concurrent identical GET requests, such
+                as many coroutines calling get_account for the same address at once, share one
+                request to the API. Every caller then gets the same result object, so treat it
+                as read-only. Defaults to False.
+            read_cache (ReadCache, optional): A TTL cache for get_account, get_smart_account
+                and get_policy_by_id lookups. Entries are removed when the client updates,
+                deletes or creates the resource, and expire after a per-resource TTL. Use a
+                DiskCacheBackend to keep them across restarts. Defaults to None (disabled).
+            hedger (Hedger, optional): Cuts the tail latency of reads such as
+                get_user_operation: when a matching GET is slower than a fixed delay or its
+                learned p95 latency, a second copy is sent and the first response is used.
+                Hedges are only sent when the rate limiter and retry budget have room for
+                them. Defaults to None (disabled).
+            json_codec (JsonCodec, optional): The JSON library to encode request bodies and
+                decode responses with, e.g. an OrjsonCodec. Responses that are single API
+                models are validated straight from their bytes by pydantic either way.
+                Defaults to None, which uses the json module.
+            validate_api_calls (bool, optional): Whether the generated API methods validate
+                their arguments with pydantic on every call. The EVM, Solana and policies
+                clients already pass typed values, so turning this off saves that work on each
+                request; calls through api_clients then pass arguments to the API unchecked.
+                Defaults to True.
 
         """
         api_key_id = api_key_id or os.getenv("CDP_API_KEY_ID") or os.getenv("CDP_API_KEY_NAME")
@@ -80,17 +174,31 @@ For more information, see: https://github.com/coinbase/cdp-sdk/blob/main/python/
             api_key_id,
             api_key_secret,
             wallet_secret,
-            debugging,
-            base_path,
-            max_network_retries,
-            source,
-            source_version,
+            debugging=debugging,
+            base_path=base_path,
+            max_network_retries=max_network_retries,
+            source=source,
+            source_version=source_version,
+            jwt_cache_margin=jwt_cache_margin,
+            signing_executor=signing_executor,
+            hot_endpoints=hot_endpoints,
+            jwt_pool_size=jwt_pool_size,
+            transport_registry=transport_registry,
+            transport_config=transport_config,
+            retry_policy=retry_policy,
+            retry_budget=retry_budget,
+            idempotent_writes=idempotent_writes,
+            circuit_breaker=circuit_breaker,
+            rate_limiter=rate_limiter,
+            coalesce_requests=coalesce_requests,
+            hedger=hedger,
+            json_codec=json_codec,
         )
-        self.api_clients = ApiClients(self.cdp_api_client)
+        self.api_clients = ApiClients(self.cdp_api_client, validate_api_calls)
 
-        self._evm = EvmClient(self.api_clients)
-        self._solana = SolanaClient(self.api_clients)
-        self._policies = PoliciesClient(self.api_clients)
+        self._evm = EvmClient(self.api_clients, read_cache)
+        self._solana = SolanaClient(self.api_clients, read_cache)
+        self._policies = PoliciesClient(self.api_clients, read_cache)
 
         if os.getenv("DISABLE_CDP_ERROR_REPORTING") != "true":
             Analytics["identifier"] = api_key_id
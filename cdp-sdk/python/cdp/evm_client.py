@@ -19,6 +19,7 @@ from cdp.actions.evm.swap import (
 from cdp.actions.evm.wait_for_user_operation import wait_for_user_operation
 from cdp.analytics import wrap_class_with_error_tracking
 from cdp.api_clients import ApiClients
+from cdp.cache import EVM_ACCOUNT, EVM_SMART_ACCOUNT, ReadCache
 from cdp.constants import ImportAccountPublicRSAKey
 from cdp.evm_call_types import ContractCall, EncodedCall
 from cdp.evm_server_account import EvmServerAccount, ListEvmAccountsResponse
@@ -55,8 +56,9 @@ if TYPE_CHECKING:
 class EvmClient:
     """The EvmClient class is responsible for CDP API calls for the EVM."""
 
-    def __init__(self, api_clients: ApiClients):
+    def __init__(self, api_clients: ApiClients, read_cache: ReadCache | None = None):
         self.api_clients = api_clients
+        self.read_cache = read_cache or ReadCache(enabled=False)
         wrap_class_with_error_tracking(EvmServerAccount)
         wrap_class_with_error_tracking(EvmSmartAccount)
 
@@ -84,6 +86,7 @@ class EvmClient:
                 account_policy=account_policy,
             ),
         )
+        self.read_cache.invalidate(EVM_ACCOUNT, name=name)
         return EvmServerAccount(evm_account, self.api_clients.evm_accounts, self.api_clients)
 
     async def import_account(
@@ -128,6 +131,7 @@ class EvmClient:
                 ),
                 x_idempotency_key=idempotency_key,
             )
+            self.read_cache.invalidate(EVM_ACCOUNT, name=name)
             return EvmServerAccount(evm_account, self.api_clients.evm_accounts, self.api_clients)
         except ApiError as e:
             raise e
@@ -194,6 +198,7 @@ class EvmClient:
         evm_smart_account = await self.api_clients.evm_smart_accounts.create_evm_smart_account(
             CreateEvmSmartAccountRequest(owners=[owner.address], name=name),
         )
+        self.read_cache.invalidate(EVM_SMART_ACCOUNT, name=name)
         return EvmSmartAccount(
             evm_smart_account.address, owner, evm_smart_account.name, self.api_clients
         )
@@ -238,9 +243,18 @@ class EvmClient:
 
         """
         if address:
-            evm_account = await self.api_clients.evm_accounts.get_evm_account(address)
+            evm_account = await self.read_cache.fetch(
+                EVM_ACCOUNT,
+                address.lower(),
+                lambda: self.api_clients.evm_accounts.get_evm_account(address),
+            )
         elif name:
-            evm_account = await self.api_clients.evm_accounts.get_evm_account_by_name(name)
+            evm_account = await self.read_cache.fetch_by_name(
+                EVM_ACCOUNT,
+                name,
+                lambda: self.api_clients.evm_accounts.get_evm_account_by_name(name),
+                lambda account: account.address.lower(),
+            )
         else:
             raise ValueError("Either address or name must be provided")
         return EvmServerAccount(evm_account, self.api_clients.evm_accounts, self.api_clients)
@@ -285,12 +299,17 @@ class EvmClient:
 
         """
         if address:
-            evm_smart_account = await self.api_clients.evm_smart_accounts.get_evm_smart_account(
-                address
+            evm_smart_account = await self.read_cache.fetch(
+                EVM_SMART_ACCOUNT,
+                address.lower(),
+                lambda: self.api_clients.evm_smart_accounts.get_evm_smart_account(address),
             )
         elif name:
-            evm_smart_account = (
-                await self.api_clients.evm_smart_accounts.get_evm_smart_account_by_name(name)
+            evm_smart_account = await self.read_cache.fetch_by_name(
+                EVM_SMART_ACCOUNT,
+                name,
+                lambda: self.api_clients.evm_smart_accounts.get_evm_smart_account_by_name(name),
+                lambda account: account.address.lower(),
             )
         else:
             raise ValueError("Either address or name must be provided")
@@ -636,14 +655,18 @@ class EvmClient:
             EvmServerAccount: The updated EVM account.
 
         """
-        account = await self.api_clients.evm_accounts.update_evm_account(
-            address=address,
-            update_evm_account_request=UpdateEvmAccountRequest(
-                name=update.name,
-                account_policy=update.account_policy,
-            ),
-            x_idempotency_key=idempotency_key,
-        )
+        try:
+            account = await self.api_clients.evm_accounts.update_evm_account(
+                address=address,
+                update_evm_account_request=UpdateEvmAccountRequest(
+                    name=update.name,
+                    account_policy=update.account_policy,
+                ),
+                x_idempotency_key=idempotency_key,
+            )
+        finally:
+            # The update may have been applied even if the response was lost.
+            self.read_cache.invalidate(EVM_ACCOUNT, address.lower(), update.name)
         return EvmServerAccount(account, self.api_clients.evm_accounts, self.api_clients)
 
     async def wait_for_user_operation(
@@ -17,135 +17,292 @@
 
 __version__ = "1.0.0"
 
-# import apis into sdk package
-from cdp.openapi_client.api.evm_accounts_api import EVMAccountsApi
-from cdp.openapi_client.api.evm_smart_accounts_api import EVMSmartAccountsApi
-from cdp.openapi_client.api.evm_swaps_api import EVMSwapsApi
-from cdp.openapi_client.api.evm_token_balances_api import EVMTokenBalancesApi
-from cdp.openapi_client.api.faucets_api import FaucetsApi
-from cdp.openapi_client.api.payments_alpha_api import PaymentsAlphaApi
-from cdp.openapi_client.api.policy_engine_api import PolicyEngineApi
-from cdp.openapi_client.api.solana_accounts_api import SolanaAccountsApi
-
-# import ApiClient
-from cdp.openapi_client.api_response import ApiResponse
-from cdp.openapi_client.api_client import ApiClient
-from cdp.openapi_client.cdp_api_client import CdpApiClient
-from cdp.openapi_client.configuration import Configuration
-from cdp.openapi_client.exceptions import OpenApiException
-from cdp.openapi_client.exceptions import ApiTypeError
-from cdp.openapi_client.exceptions import ApiValueError
-from cdp.openapi_client.exceptions import ApiKeyError
-from cdp.openapi_client.exceptions import ApiAttributeError
-from cdp.openapi_client.exceptions import ApiException
-
-# import models into sdk package
-from cdp.openapi_client.models.abi_function import AbiFunction
-from cdp.openapi_client.models.abi_inner import AbiInner
-from cdp.openapi_client.models.abi_input import AbiInput
-from cdp.openapi_client.models.abi_parameter import AbiParameter
-from cdp.openapi_client.models.abi_state_mutability import AbiStateMutability
-from cdp.openapi_client.models.common_swap_response import CommonSwapResponse
-from cdp.openapi_client.models.common_swap_response_fees import CommonSwapResponseFees
-from cdp.openapi_client.models.common_swap_response_issues import CommonSwapResponseIssues
-from cdp.openapi_client.models.common_swap_response_issues_allowance import CommonSwapResponseIssuesAllowance
-from cdp.openapi_client.models.common_swap_response_issues_balance import CommonSwapResponseIssuesBalance
-from cdp.openapi_client.models.create_evm_account_request import CreateEvmAccountRequest
-from cdp.openapi_client.models.create_evm_smart_account_request import CreateEvmSmartAccountRequest
-from cdp.openapi_client.models.create_evm_swap_quote_request import CreateEvmSwapQuoteRequest
-from cdp.openapi_client.models.create_payment_transfer_quote201_response import CreatePaymentTransferQuote201Response
-from cdp.openapi_client.models.create_payment_transfer_quote_request import CreatePaymentTransferQuoteRequest
-from cdp.openapi_client.models.create_policy_request import CreatePolicyRequest
-from cdp.openapi_client.models.create_solana_account_request import CreateSolanaAccountRequest
-from cdp.openapi_client.models.create_swap_quote_response import CreateSwapQuoteResponse
-from cdp.openapi_client.models.create_swap_quote_response_all_of_permit2 import CreateSwapQuoteResponseAllOfPermit2
-from cdp.openapi_client.models.create_swap_quote_response_all_of_transaction import CreateSwapQuoteResponseAllOfTransaction
-from cdp.openapi_client.models.create_swap_quote_response_wrapper import CreateSwapQuoteResponseWrapper
-from cdp.openapi_client.models.crypto_rail import CryptoRail
-from cdp.openapi_client.models.crypto_rail_address import CryptoRailAddress
-from cdp.openapi_client.models.crypto_rail_networks_inner import CryptoRailNetworksInner
-from cdp.openapi_client.models.eip712_domain import EIP712Domain
-from cdp.openapi_client.models.eip712_message import EIP712Message
-from cdp.openapi_client.models.error import Error
-from cdp.openapi_client.models.error_type import ErrorType
-from cdp.openapi_client.models.eth_value_criterion import EthValueCriterion
-from cdp.openapi_client.models.evm_account import EvmAccount
-from cdp.openapi_client.models.evm_address_criterion import EvmAddressCriterion
-from cdp.openapi_client.models.evm_call import EvmCall
-from cdp.openapi_client.models.evm_data_condition import EvmDataCondition
-from cdp.openapi_client.models.evm_data_condition_params_inner import EvmDataConditionParamsInner
-from cdp.openapi_client.models.evm_data_criterion import EvmDataCriterion
-from cdp.openapi_client.models.evm_data_criterion_abi import EvmDataCriterionAbi
-from cdp.openapi_client.models.evm_data_parameter_condition import EvmDataParameterCondition
-from cdp.openapi_client.models.evm_data_parameter_condition_list import EvmDataParameterConditionList
-from cdp.openapi_client.models.evm_message_criterion import EvmMessageCriterion
-from cdp.openapi_client.models.evm_network_criterion import EvmNetworkCriterion
-from cdp.openapi_client.models.evm_smart_account import EvmSmartAccount
-from cdp.openapi_client.models.evm_swaps_network import EvmSwapsNetwork
-from cdp.openapi_client.models.evm_user_operation import EvmUserOperation
-from cdp.openapi_client.models.export_evm_account200_response import ExportEvmAccount200Response
-from cdp.openapi_client.models.export_evm_account_request import ExportEvmAccountRequest
-from cdp.openapi_client.models.export_solana_account200_response import ExportSolanaAccount200Response
-from cdp.openapi_client.models.fee import Fee
-from cdp.openapi_client.models.get_swap_price_response import GetSwapPriceResponse
-from cdp.openapi_client.models.get_swap_price_response_wrapper import GetSwapPriceResponseWrapper
-from cdp.openapi_client.models.import_evm_account_request import ImportEvmAccountRequest
-from cdp.openapi_client.models.known_abi_type import KnownAbiType
-from cdp.openapi_client.models.list_evm_accounts200_response import ListEvmAccounts200Response
-from cdp.openapi_client.models.list_evm_smart_accounts200_response import ListEvmSmartAccounts200Response
-from cdp.openapi_client.models.list_evm_token_balances200_response import ListEvmTokenBalances200Response
-from cdp.openapi_client.models.list_evm_token_balances_network import ListEvmTokenBalancesNetwork
-from cdp.openapi_client.models.list_policies200_response import ListPolicies200Response
-from cdp.openapi_client.models.list_response import ListResponse
-from cdp.openapi_client.models.list_solana_accounts200_response import ListSolanaAccounts200Response
-from cdp.openapi_client.models.payment_method import PaymentMethod
-from cdp.openapi_client.models.payment_method_limits import PaymentMethodLimits
-from cdp.openapi_client.models.payment_method_limits_source_limit import PaymentMethodLimitsSourceLimit
-from cdp.openapi_client.models.payment_method_limits_target_limit import PaymentMethodLimitsTargetLimit
-from cdp.openapi_client.models.payment_method_request import PaymentMethodRequest
-from cdp.openapi_client.models.payment_rail_action import PaymentRailAction
-from cdp.openapi_client.models.policy import Policy
-from cdp.openapi_client.models.prepare_user_operation_request import PrepareUserOperationRequest
-from cdp.openapi_client.models.request_evm_faucet200_response import RequestEvmFaucet200Response
-from cdp.openapi_client.models.request_evm_faucet_request import RequestEvmFaucetRequest
-from cdp.openapi_client.models.request_solana_faucet200_response import RequestSolanaFaucet200Response
-from cdp.openapi_client.models.request_solana_faucet_request import RequestSolanaFaucetRequest
-from cdp.openapi_client.models.rule import Rule
-from cdp.openapi_client.models.send_evm_transaction200_response import SendEvmTransaction200Response
-from cdp.openapi_client.models.send_evm_transaction_criteria_inner import SendEvmTransactionCriteriaInner
-from cdp.openapi_client.models.send_evm_transaction_request import SendEvmTransactionRequest
-from cdp.openapi_client.models.send_evm_transaction_rule import SendEvmTransactionRule
-from cdp.openapi_client.models.send_user_operation_request import SendUserOperationRequest
-from cdp.openapi_client.models.sign_evm_hash200_response import SignEvmHash200Response
-from cdp.openapi_client.models.sign_evm_hash_request import SignEvmHashRequest
-from cdp.openapi_client.models.sign_evm_hash_rule import SignEvmHashRule
-from cdp.openapi_client.models.sign_evm_message200_response import SignEvmMessage200Response
-from cdp.openapi_client.models.sign_evm_message_criteria_inner import SignEvmMessageCriteriaInner
-from cdp.openapi_client.models.sign_evm_message_request import SignEvmMessageRequest
-from cdp.openapi_client.models.sign_evm_message_rule import SignEvmMessageRule
-from cdp.openapi_client.models.sign_evm_transaction200_response import SignEvmTransaction200Response
-from cdp.openapi_client.models.sign_evm_transaction_criteria_inner import SignEvmTransactionCriteriaInner
-from cdp.openapi_client.models.sign_evm_transaction_request import SignEvmTransactionRequest
-from cdp.openapi_client.models.sign_evm_transaction_rule import SignEvmTransactionRule
-from cdp.openapi_client.models.sign_evm_typed_data200_response import SignEvmTypedData200Response
-from cdp.openapi_client.models.sign_sol_transaction_criteria_inner import SignSolTransactionCriteriaInner
-from cdp.openapi_client.models.sign_sol_transaction_rule import SignSolTransactionRule
-from cdp.openapi_client.models.sign_solana_message200_response import SignSolanaMessage200Response
-from cdp.openapi_client.models.sign_solana_message_request import SignSolanaMessageRequest
-from cdp.openapi_client.models.sign_solana_transaction200_response import SignSolanaTransaction200Response
-from cdp.openapi_client.models.sign_solana_transaction_request import SignSolanaTransactionRequest
-from cdp.openapi_client.models.sol_address_criterion import SolAddressCriterion
-from cdp.openapi_client.models.solana_account import SolanaAccount
-from cdp.openapi_client.models.swap_unavailable_response import SwapUnavailableResponse
-from cdp.openapi_client.models.token import Token
-from cdp.openapi_client.models.token_amount import TokenAmount
-from cdp.openapi_client.models.token_balance import TokenBalance
-from cdp.openapi_client.models.token_fee import TokenFee
-from cdp.openapi_client.models.transfer import Transfer
-from cdp.openapi_client.models.transfer_source import TransferSource
-from cdp.openapi_client.models.transfer_target import TransferTarget
-from cdp.openapi_client.models.update_evm_account_request import UpdateEvmAccountRequest
-from cdp.openapi_client.models.update_policy_request import UpdatePolicyRequest
-from cdp.openapi_client.models.update_solana_account_request import UpdateSolanaAccountRequest
+import importlib
+from typing import TYPE_CHECKING, Any
+
+# The module of each name exported by the package. Modules are imported on first access, so
+# that importing the package, or one of its modules such as the retry policy, does not load
+# every API and model.
+_LAZY_IMPORTS = {
+    # apis
+    "EVMAccountsApi": "cdp.openapi_client.api.evm_accounts_api",
+    "EVMSmartAccountsApi": "cdp.openapi_client.api.evm_smart_accounts_api",
+    "EVMSwapsApi": "cdp.openapi_client.api.evm_swaps_api",
+    "EVMTokenBalancesApi": "cdp.openapi_client.api.evm_token_balances_api",
+    "FaucetsApi": "cdp.openapi_client.api.faucets_api",
+    "PaymentsAlphaApi": "cdp.openapi_client.api.payments_alpha_api",
+    "PolicyEngineApi": "cdp.openapi_client.api.policy_engine_api",
+    "SolanaAccountsApi": "cdp.openapi_client.api.solana_accounts_api",
+
+    # ApiClient
+    "ApiResponse": "cdp.openapi_client.api_response",
+    "ApiClient": "cdp.openapi_client.api_client",
+    "CdpApiClient": "cdp.openapi_client.cdp_api_client",
+    "Configuration": "cdp.openapi_client.configuration",
+    "OpenApiException": "cdp.openapi_client.exceptions",
+    "ApiTypeError": "cdp.openapi_client.exceptions",
+    "ApiValueError": "cdp.openapi_client.exceptions",
+    "ApiKeyError": "cdp.openapi_client.exceptions",
+    "ApiAttributeError": "cdp.openapi_client.exceptions",
+    "ApiException": "cdp.openapi_client.exceptions",
+
+    # models
+    "AbiFunction": "cdp.openapi_client.models.abi_function",
+    "AbiInner": "cdp.openapi_client.models.abi_inner",
+    "AbiInput": "cdp.openapi_client.models.abi_input",
+    "AbiParameter": "cdp.openapi_client.models.abi_parameter",
+    "AbiStateMutability": "cdp.openapi_client.models.abi_state_mutability",
+    "CommonSwapResponse": "cdp.openapi_client.models.common_swap_response",
+    "CommonSwapResponseFees": "cdp.openapi_client.models.common_swap_response_fees",
+    "CommonSwapResponseIssues": "cdp.openapi_client.models.common_swap_response_issues",
+    "CommonSwapResponseIssuesAllowance": "cdp.openapi_client.models.common_swap_response_issues_allowance",
+    "CommonSwapResponseIssuesBalance": "cdp.openapi_client.models.common_swap_response_issues_balance",
+    "CreateEvmAccountRequest": "cdp.openapi_client.models.create_evm_account_request",
+    "CreateEvmSmartAccountRequest": "cdp.openapi_client.models.create_evm_smart_account_request",
+    "CreateEvmSwapQuoteRequest": "cdp.openapi_client.models.create_evm_swap_quote_request",
+    "CreatePaymentTransferQuote201Response": "cdp.openapi_client.models.create_payment_transfer_quote201_response",
+    "CreatePaymentTransferQuoteRequest": "cdp.openapi_client.models.create_payment_transfer_quote_request",
+    "CreatePolicyRequest": "cdp.openapi_client.models.create_policy_request",
+    "CreateSolanaAccountRequest": "cdp.openapi_client.models.create_solana_account_request",
+    "CreateSwapQuoteResponse": "cdp.openapi_client.models.create_swap_quote_response",
+    "CreateSwapQuoteResponseAllOfPermit2": "cdp.openapi_client.models.create_swap_quote_response_all_of_permit2",
+    "CreateSwapQuoteResponseAllOfTransaction": "cdp.openapi_client.models.create_swap_quote_response_all_of_transaction",
+    "CreateSwapQuoteResponseWrapper": "cdp.openapi_client.models.create_swap_quote_response_wrapper",
+    "CryptoRail": "cdp.openapi_client.models.crypto_rail",
+    "CryptoRailAddress": "cdp.openapi_client.models.crypto_rail_address",
+    "CryptoRailNetworksInner": "cdp.openapi_client.models.crypto_rail_networks_inner",
+    "EIP712Domain": "cdp.openapi_client.models.eip712_domain",
+    "EIP712Message": "cdp.openapi_client.models.eip712_message",
+    "Error": "cdp.openapi_client.models.error",
+    "ErrorType": "cdp.openapi_client.models.error_type",
+    "EthValueCriterion": "cdp.openapi_client.models.eth_value_criterion",
+    "EvmAccount": "cdp.openapi_client.models.evm_account",
+    "EvmAddressCriterion": "cdp.openapi_client.models.evm_address_criterion",
+    "EvmCall": "cdp.openapi_client.models.evm_call",
+    "EvmDataCondition": "cdp.openapi_client.models.evm_data_condition",
+    "EvmDataConditionParamsInner": "cdp.openapi_client.models.evm_data_condition_params_inner",
+    "EvmDataCriterion": "cdp.openapi_client.models.evm_data_criterion",
+    "EvmDataCriterionAbi": "cdp.openapi_client.models.evm_data_criterion_abi",
+    "EvmDataParameterCondition": "cdp.openapi_client.models.evm_data_parameter_condition",
+    "EvmDataParameterConditionList": "cdp.openapi_client.models.evm_data_parameter_condition_list",
+    "EvmMessageCriterion": "cdp.openapi_client.models.evm_message_criterion",
+    "EvmNetworkCriterion": "cdp.openapi_client.models.evm_network_criterion",
+    "EvmSmartAccount": "cdp.openapi_client.models.evm_smart_account",
+    "EvmSwapsNetwork": "cdp.openapi_client.models.evm_swaps_network",
+    "EvmUserOperation": "cdp.openapi_client.models.evm_user_operation",
+    "ExportEvmAccount200Response": "cdp.openapi_client.models.export_evm_account200_response",
+    "ExportEvmAccountRequest": "cdp.openapi_client.models.export_evm_account_request",
+    "ExportSolanaAccount200Response": "cdp.openapi_client.models.export_solana_account200_response",
+    "Fee": "cdp.openapi_client.models.fee",
+    "GetSwapPriceResponse": "cdp.openapi_client.models.get_swap_price_response",
+    "GetSwapPriceResponseWrapper": "cdp.openapi_client.models.get_swap_price_response_wrapper",
+    "ImportEvmAccountRequest": "cdp.openapi_client.models.import_evm_account_request",
+    "KnownAbiType": "cdp.openapi_client.models.known_abi_type",
+    "ListEvmAccounts200Response": "cdp.openapi_client.models.list_evm_accounts200_response",
+    "ListEvmSmartAccounts200Response": "cdp.openapi_client.models.list_evm_smart_accounts200_response",
+    "ListEvmTokenBalances200Response": "cdp.openapi_client.models.list_evm_token_balances200_response",
+    "ListEvmTokenBalancesNetwork": "cdp.openapi_client.models.list_evm_token_balances_network",
+    "ListPolicies200Response": "cdp.openapi_client.models.list_policies200_response",
+    "ListResponse": "cdp.openapi_client.models.list_response",
+    "ListSolanaAccounts200Response": "cdp.openapi_client.models.list_solana_accounts200_response",
+    "PaymentMethod": "cdp.openapi_client.models.payment_method",
+    "PaymentMethodLimits": "cdp.openapi_client.models.payment_method_limits",
+    "PaymentMethodLimitsSourceLimit": "cdp.openapi_client.models.payment_method_limits_source_limit",
+    "PaymentMethodLimitsTargetLimit": "cdp.openapi_client.models.payment_method_limits_target_limit",
+    "PaymentMethodRequest": "cdp.openapi_client.models.payment_method_request",
+    "PaymentRailAction": "cdp.openapi_client.models.payment_rail_action",
+    "Policy": "cdp.openapi_client.models.policy",
+    "PrepareUserOperationRequest": "cdp.openapi_client.models.prepare_user_operation_request",
+    "RequestEvmFaucet200Response": "cdp.openapi_client.models.request_evm_faucet200_response",
+    "RequestEvmFaucetRequest": "cdp.openapi_client.models.request_evm_faucet_request",
+    "RequestSolanaFaucet200Response": "cdp.openapi_client.models.request_solana_faucet200_response",
+    "RequestSolanaFaucetRequest": "cdp.openapi_client.models.request_solana_faucet_request",
+    "Rule": "cdp.openapi_client.models.rule",
+    "SendEvmTransaction200Response": "cdp.openapi_client.models.send_evm_transaction200_response",
+    "SendEvmTransactionCriteriaInner": "cdp.openapi_client.models.send_evm_transaction_criteria_inner",
+    "SendEvmTransactionRequest": "cdp.openapi_client.models.send_evm_transaction_request",
+    "SendEvmTransactionRule": "cdp.openapi_client.models.send_evm_transaction_rule",
+    "SendUserOperationRequest": "cdp.openapi_client.models.send_user_operation_request",
+    "SignEvmHash200Response": "cdp.openapi_client.models.sign_evm_hash200_response",
+    "SignEvmHashRequest": "cdp.openapi_client.models.sign_evm_hash_request",
+    "SignEvmHashRule": "cdp.openapi_client.models.sign_evm_hash_rule",
+    "SignEvmMessage200Response": "cdp.openapi_client.models.sign_evm_message200_response",
+    "SignEvmMessageCriteriaInner": "cdp.openapi_client.models.sign_evm_message_criteria_inner",
+    "SignEvmMessageRequest": "cdp.openapi_client.models.sign_evm_message_request",
+    "SignEvmMessageRule": "cdp.openapi_client.models.sign_evm_message_rule",
+    "SignEvmTransaction200Response": "cdp.openapi_client.models.sign_evm_transaction200_response",
+    "SignEvmTransactionCriteriaInner": "cdp.openapi_client.models.sign_evm_transaction_criteria_inner",
+    "SignEvmTransactionRequest": "cdp.openapi_client.models.sign_evm_transaction_request",
+    "SignEvmTransactionRule": "cdp.openapi_client.models.sign_evm_transaction_rule",
+    "SignEvmTypedData200Response": "cdp.openapi_client.models.sign_evm_typed_data200_response",
+    "SignSolTransactionCriteriaInner": "cdp.openapi_client.models.sign_sol_transaction_criteria_inner",
+    "SignSolTransactionRule": "cdp.openapi_client.models.sign_sol_transaction_rule",
+    "SignSolanaMessage200Response": "cdp.openapi_client.models.sign_solana_message200_response",
+    "SignSolanaMessageRequest": "cdp.openapi_client.models.sign_solana_message_request",
+    "SignSolanaTransaction200Response": "cdp.openapi_client.models.sign_solana_transaction200_response",
+    "SignSolanaTransactionRequest": "cdp.openapi_client.models.sign_solana_transaction_request",
+    "SolAddressCriterion": "cdp.openapi_client.models.sol_address_criterion",
+    "SolanaAccount": "cdp.openapi_client.models.solana_account",
+    "SwapUnavailableResponse": "cdp.openapi_client.models.swap_unavailable_response",
+    "Token": "cdp.openapi_client.models.token",
+    "TokenAmount": "cdp.openapi_client.models.token_amount",
+    "TokenBalance": "cdp.openapi_client.models.token_balance",
+    "TokenFee": "cdp.openapi_client.models.token_fee",
+    "Transfer": "cdp.openapi_client.models.transfer",
+    "TransferSource": "cdp.openapi_client.models.transfer_source",
+    "TransferTarget": "cdp.openapi_client.models.transfer_target",
+    "UpdateEvmAccountRequest": "cdp.openapi_client.models.update_evm_account_request",
+    "UpdatePolicyRequest": "cdp.openapi_client.models.update_policy_request",
+    "UpdateSolanaAccountRequest": "cdp.openapi_client.models.update_solana_account_request",
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+if TYPE_CHECKING:
+    # import apis into sdk package
+    from cdp.openapi_client.api.evm_accounts_api import EVMAccountsApi
+    from cdp.openapi_client.api.evm_smart_accounts_api import EVMSmartAccountsApi
+    from cdp.openapi_client.api.evm_swaps_api import EVMSwapsApi
+    from cdp.openapi_client.api.evm_token_balances_api import EVMTokenBalancesApi
+    from cdp.openapi_client.api.faucets_api import FaucetsApi
+    from cdp.openapi_client.api.payments_alpha_api import PaymentsAlphaApi
+    from cdp.openapi_client.api.policy_engine_api import PolicyEngineApi
+    from cdp.openapi_client.api.solana_accounts_api import SolanaAccountsApi
+
+    # import ApiClient
+    from cdp.openapi_client.api_response import ApiResponse
+    from cdp.openapi_client.api_client import ApiClient
+    from cdp.openapi_client.cdp_api_client import CdpApiClient
+    from cdp.openapi_client.configuration import Configuration
+    from cdp.openapi_client.exceptions import OpenApiException
+    from cdp.openapi_client.exceptions import ApiTypeError
+    from cdp.openapi_client.exceptions import ApiValueError
+    from cdp.openapi_client.exceptions import ApiKeyError
+    from cdp.openapi_client.exceptions import ApiAttributeError
+    from cdp.openapi_client.exceptions import ApiException
+
+    # import models into sdk package
+    from cdp.openapi_client.models.abi_function import AbiFunction
+    from cdp.openapi_client.models.abi_inner import AbiInner
+    from cdp.openapi_client.models.abi_input import AbiInput
+    from cdp.openapi_client.models.abi_parameter import AbiParameter
+    from cdp.openapi_client.models.abi_state_mutability import AbiStateMutability
+    from cdp.openapi_client.models.common_swap_response import CommonSwapResponse
+    from cdp.openapi_client.models.common_swap_response_fees import CommonSwapResponseFees
+    from cdp.openapi_client.models.common_swap_response_issues import CommonSwapResponseIssues
+    from cdp.openapi_client.models.common_swap_response_issues_allowance import CommonSwapResponseIssuesAllowance
+    from cdp.openapi_client.models.common_swap_response_issues_balance import CommonSwapResponseIssuesBalance
+    from cdp.openapi_client.models.create_evm_account_request import CreateEvmAccountRequest
+    from cdp.openapi_client.models.create_evm_smart_account_request import CreateEvmSmartAccountRequest
+    from cdp.openapi_client.models.create_evm_swap_quote_request import CreateEvmSwapQuoteRequest
+    from cdp.openapi_client.models.create_payment_transfer_quote201_response import CreatePaymentTransferQuote201Response
+    from cdp.openapi_client.models.create_payment_transfer_quote_request import CreatePaymentTransferQuoteRequest
+    from cdp.openapi_client.models.create_policy_request import CreatePolicyRequest
+    from cdp.openapi_client.models.create_solana_account_request import CreateSolanaAccountRequest
+    from cdp.openapi_client.models.create_swap_quote_response import CreateSwapQuoteResponse
+    from cdp.openapi_client.models.create_swap_quote_response_all_of_permit2 import CreateSwapQuoteResponseAllOfPermit2
+    from cdp.openapi_client.models.create_swap_quote_response_all_of_transaction import CreateSwapQuoteResponseAllOfTransaction
+    from cdp.openapi_client.models.create_swap_quote_response_wrapper import CreateSwapQuoteResponseWrapper
+    from cdp.openapi_client.models.crypto_rail import CryptoRail
+    from cdp.openapi_client.models.crypto_rail_address import CryptoRailAddress
+    from cdp.openapi_client.models.crypto_rail_networks_inner import CryptoRailNetworksInner
+    from cdp.openapi_client.models.eip712_domain import EIP712Domain
+    from cdp.openapi_client.models.eip712_message import EIP712Message
+    from cdp.openapi_client.models.error import Error
+    from cdp.openapi_client.models.error_type import ErrorType
+    from cdp.openapi_client.models.eth_value_criterion import EthValueCriterion
+    from cdp.openapi_client.models.evm_account import EvmAccount
+    from cdp.openapi_client.models.evm_address_criterion import EvmAddressCriterion
+    from cdp.openapi_client.models.evm_call import EvmCall
+    from cdp.openapi_client.models.evm_data_condition import EvmDataCondition
+    from cdp.openapi_client.models.evm_data_condition_params_inner import EvmDataConditionParamsInner
+    from cdp.openapi_client.models.evm_data_criterion import EvmDataCriterion
+    from cdp.openapi_client.models.evm_data_criterion_abi import EvmDataCriterionAbi
+    from cdp.openapi_client.models.evm_data_parameter_condition import EvmDataParameterCondition
+    from cdp.openapi_client.models.evm_data_parameter_condition_list import EvmDataParameterConditionList
+    from cdp.openapi_client.models.evm_message_criterion import EvmMessageCriterion
+    from cdp.openapi_client.models.evm_network_criterion import EvmNetworkCriterion
+    from cdp.openapi_client.models.evm_smart_account import EvmSmartAccount
+    from cdp.openapi_client.models.evm_swaps_network import EvmSwapsNetwork
+    from cdp.openapi_client.models.evm_user_operation import EvmUserOperation
+    from cdp.openapi_client.models.export_evm_account200_response import ExportEvmAccount200Response
+    from cdp.openapi_client.models.export_evm_account_request import ExportEvmAccountRequest
+    from cdp.openapi_client.models.export_solana_account200_response import ExportSolanaAccount200Response
+    from cdp.openapi_client.models.fee import Fee
+    from cdp.openapi_client.models.get_swap_price_response import GetSwapPriceResponse
+    from cdp.openapi_client.models.get_swap_price_response_wrapper import GetSwapPriceResponseWrapper
+    from cdp.openapi_client.models.import_evm_account_request import ImportEvmAccountRequest
+    from cdp.openapi_client.models.known_abi_type import KnownAbiType
+    from cdp.openapi_client.models.list_evm_accounts200_response import ListEvmAccounts200Response
+    from cdp.openapi_client.models.list_evm_smart_accounts200_response import ListEvmSmartAccounts200Response
+    from cdp.openapi_client.models.list_evm_token_balances200_response import ListEvmTokenBalances200Response
+    from cdp.openapi_client.models.list_evm_token_balances_network import ListEvmTokenBalancesNetwork
+    from cdp.openapi_client.models.list_policies200_response import ListPolicies200Response
+    from cdp.openapi_client.models.list_response import ListResponse
+    from cdp.openapi_client.models.list_solana_accounts200_response import ListSolanaAccounts200Response
+    from cdp.openapi_client.models.payment_method import PaymentMethod
+    from cdp.openapi_client.models.payment_method_limits import PaymentMethodLimits
+    from cdp.openapi_client.models.payment_method_limits_source_limit import PaymentMethodLimitsSourceLimit
+    from cdp.openapi_client.models.payment_method_limits_target_limit import PaymentMethodLimitsTargetLimit
+    from cdp.openapi_client.models.payment_method_request import PaymentMethodRequest
+    from cdp.openapi_client.models.payment_rail_action import PaymentRailAction
+    from cdp.openapi_client.models.policy import Policy
+    from cdp.openapi_client.models.prepare_user_operation_request import PrepareUserOperationRequest
+    from cdp.openapi_client.models.request_evm_faucet200_response import RequestEvmFaucet200Response
+    from cdp.openapi_client.models.request_evm_faucet_request import RequestEvmFaucetRequest
+    from cdp.openapi_client.models.request_solana_faucet200_response import RequestSolanaFaucet200Response
+    from cdp.openapi_client.models.request_solana_faucet_request import RequestSolanaFaucetRequest
+    from cdp.openapi_client.models.rule import Rule
+    from cdp.openapi_client.models.send_evm_transaction200_response import SendEvmTransaction200Response
+    from cdp.openapi_client.models.send_evm_transaction_criteria_inner import SendEvmTransactionCriteriaInner
+    from cdp.openapi_client.models.send_evm_transaction_request import SendEvmTransactionRequest
+    from cdp.openapi_client.models.send_evm_transaction_rule import SendEvmTransactionRule
+    from cdp.openapi_client.models.send_user_operation_request import SendUserOperationRequest
+    from cdp.openapi_client.models.sign_evm_hash200_response import SignEvmHash200Response
+    from cdp.openapi_client.models.sign_evm_hash_request import SignEvmHashRequest
+    from cdp.openapi_client.models.sign_evm_hash_rule import SignEvmHashRule
+    from cdp.openapi_client.models.sign_evm_message200_response import SignEvmMessage200Response
+    from cdp.openapi_client.models.sign_evm_message_criteria_inner import SignEvmMessageCriteriaInner
+    from cdp.openapi_client.models.sign_evm_message_request import SignEvmMessageRequest
+    from cdp.openapi_client.models.sign_evm_message_rule import SignEvmMessageRule
+    from cdp.openapi_client.models.sign_evm_transaction200_response import SignEvmTransaction200Response
+    from cdp.openapi_client.models.sign_evm_transaction_criteria_inner import SignEvmTransactionCriteriaInner
+    from cdp.openapi_client.models.sign_evm_transaction_request import SignEvmTransactionRequest
+    from cdp.openapi_client.models.sign_evm_transaction_rule import SignEvmTransactionRule
+    from cdp.openapi_client.models.sign_evm_typed_data200_response import SignEvmTypedData200Response
+    from cdp.openapi_client.models.sign_sol_transaction_criteria_inner import SignSolTransactionCriteriaInner
+    from cdp.openapi_client.models.sign_sol_transaction_rule import SignSolTransactionRule
+    from cdp.openapi_client.models.sign_solana_message200_response import SignSolanaMessage200Response
+    from cdp.openapi_client.models.sign_solana_message_request import SignSolanaMessageRequest
+    from cdp.openapi_client.models.sign_solana_transaction200_response import SignSolanaTransaction200Response
+    from cdp.openapi_client.models.sign_solana_transaction_request import SignSolanaTransactionRequest
+    from cdp.openapi_client.models.sol_address_criterion import SolAddressCriterion
+    from cdp.openapi_client.models.solana_account import SolanaAccount
+    from cdp.openapi_client.models.swap_unavailable_response import SwapUnavailableResponse
+    from cdp.openapi_client.models.token import Token
+    from cdp.openapi_client.models.token_amount import TokenAmount
+    from cdp.openapi_client.models.token_balance import TokenBalance
+    from cdp.openapi_client.models.token_fee import TokenFee
+    from cdp.openapi_client.models.transfer import Transfer
+    from cdp.openapi_client.models.transfer_source import TransferSource
+    from cdp.openapi_client.models.transfer_target import TransferTarget
+    from cdp.openapi_client.models.update_evm_account_request import UpdateEvmAccountRequest
+    from cdp.openapi_client.models.update_policy_request import UpdatePolicyRequest
+    from cdp.openapi_client.models.update_solana_account_request import UpdateSolanaAccountRequest
+
+
+def __getattr__(name: str) -> Any:
+    """Import an exported name on first access."""
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the names of the package, including those not imported yet."""
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
 
 
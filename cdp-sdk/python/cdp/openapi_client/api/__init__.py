@@ -1,12 +1,44 @@
 # flake8: noqa
 
-# import apis into api package
-from cdp.openapi_client.api.evm_accounts_api import EVMAccountsApi
-from cdp.openapi_client.api.evm_smart_accounts_api import EVMSmartAccountsApi
-from cdp.openapi_client.api.evm_swaps_api import EVMSwapsApi
-from cdp.openapi_client.api.evm_token_balances_api import EVMTokenBalancesApi
-from cdp.openapi_client.api.faucets_api import FaucetsApi
-from cdp.openapi_client.api.payments_alpha_api import PaymentsAlphaApi
-from cdp.openapi_client.api.policy_engine_api import PolicyEngineApi
-from cdp.openapi_client.api.solana_accounts_api import SolanaAccountsApi
+import importlib
+from typing import TYPE_CHECKING, Any
 
+# The module of each api, imported on first access
+_LAZY_IMPORTS = {
+    "EVMAccountsApi": "cdp.openapi_client.api.evm_accounts_api",
+    "EVMSmartAccountsApi": "cdp.openapi_client.api.evm_smart_accounts_api",
+    "EVMSwapsApi": "cdp.openapi_client.api.evm_swaps_api",
+    "EVMTokenBalancesApi": "cdp.openapi_client.api.evm_token_balances_api",
+    "FaucetsApi": "cdp.openapi_client.api.faucets_api",
+    "PaymentsAlphaApi": "cdp.openapi_client.api.payments_alpha_api",
+    "PolicyEngineApi": "cdp.openapi_client.api.policy_engine_api",
+    "SolanaAccountsApi": "cdp.openapi_client.api.solana_accounts_api",
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+if TYPE_CHECKING:
+    # import apis into api package
+    from cdp.openapi_client.api.evm_accounts_api import EVMAccountsApi
+    from cdp.openapi_client.api.evm_smart_accounts_api import EVMSmartAccountsApi
+    from cdp.openapi_client.api.evm_swaps_api import EVMSwapsApi
+    from cdp.openapi_client.api.evm_token_balances_api import EVMTokenBalancesApi
+    from cdp.openapi_client.api.faucets_api import FaucetsApi
+    from cdp.openapi_client.api.payments_alpha_api import PaymentsAlphaApi
+    from cdp.openapi_client.api.policy_engine_api import PolicyEngineApi
+    from cdp.openapi_client.api.solana_accounts_api import SolanaAccountsApi
+
+
+def __getattr__(name: str) -> Any:
+    """Import an exported name on first access."""
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the names of the package, including those not imported yet."""
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
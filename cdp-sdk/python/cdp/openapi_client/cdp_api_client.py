@@ -1,17 +1,61 @@
+import asyncio
 import json
+import re
+import uuid
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextvars import ContextVar
+from functools import partial
 from urllib.parse import urlparse
 
-from urllib3.util import Retry
+from pydantic import BaseModel
 
+import cdp.openapi_client.models
 from cdp import __version__
-from cdp.auth.utils.http import GetAuthHeadersOptions, get_auth_headers
+from cdp.auth.utils.http import (
+    _generate_jwt_with_credentials,
+    _get_auth_headers,
+    _get_auth_headers_with_credentials,
+    _get_correlation_data,
+    _requires_wallet_auth,
+)
+from cdp.auth.utils.jwt import JwtSigner, WalletJwtSigner
+from cdp.auth.utils.jwt_pool import JwtPool
 from cdp.openapi_client import rest
 from cdp.openapi_client.api_client import ApiClient
 from cdp.openapi_client.api_response import ApiResponse, T as ApiResponseT
+from cdp.openapi_client.circuit_breaker import CircuitBreaker
+from cdp.openapi_client.codec import JsonCodec, can_validate_json, get_decoder, serialize
 from cdp.openapi_client.configuration import Configuration
 from cdp.openapi_client.constants import ERROR_DOCS_PAGE_URL, SDK_DEFAULT_SOURCE
 from cdp.openapi_client.errors import ApiError, is_openapi_error
 from cdp.openapi_client.exceptions import ApiException
+from cdp.openapi_client.hedging import Hedger
+from cdp.openapi_client.rate_limit import RateLimiter
+from cdp.openapi_client.retry import (
+    IDEMPOTENCY_KEY_HEADER,
+    IDEMPOTENT_OPERATIONS,
+    RetryBudget,
+    RetryPolicy,
+    accepts_idempotency_key,
+)
+from cdp.openapi_client.transport import (
+    READ_METHODS,
+    CdpRESTClientObject,
+    TransportConfig,
+    TransportRegistry,
+)
+
+# The method and path template of the request that the running task serialized last, which
+# identifies the endpoint of the request passed to call_api next.
+_endpoint: ContextVar[tuple[str, str] | None] = ContextVar("_endpoint", default=None)
+
+# The endpoints that accept an X-Idempotency-Key header, as returned by _get_endpoint
+_IDEMPOTENT_ENDPOINTS = frozenset(f"{method} {path}" for method, path in IDEMPOTENT_OPERATIONS)
+
+# The content types and charsets of the responses that are decoded without the generated client
+_JSON_CONTENT_TYPE = re.compile(r"^application/(json|[\w!#$&.+-^_]+\+json)\s*(;|$)", re.IGNORECASE)
+_NON_UTF8_CHARSET = re.compile(r"charset=(?!utf-?8\b)", re.IGNORECASE)
+_TEXT_CONTENT_TYPE = re.compile(r"^text\/[a-z.+-]+\s*(;|$)", re.IGNORECASE)
 
 
 class CdpApiClient(ApiClient):
@@ -27,6 +71,20 @@ class CdpApiClient(ApiClient):
         max_network_retries: int = 3,
         source: str = SDK_DEFAULT_SOURCE,
         source_version: str = __version__,
+        jwt_cache_margin: int | None = None,
+        signing_executor: Executor | None = None,
+        hot_endpoints: list[tuple[str, str]] | None = None,
+        jwt_pool_size: int = 4,
+        transport_registry: TransportRegistry | None = None,
+        transport_config: TransportConfig | None = None,
+        retry_policy: RetryPolicy | None = None,
+        retry_budget: RetryBudget | None = None,
+        idempotent_writes: bool = False,
+        circuit_breaker: CircuitBreaker | None = None,
+        rate_limiter: RateLimiter | None = None,
+        coalesce_requests: bool = False,
+        hedger: Hedger | None = None,
+        json_codec: JsonCodec | None = None,
     ):
         """Initialize the CDP API Client.
 
@@ -36,22 +94,149 @@ class CdpApiClient(ApiClient):
             wallet_secret (str): The wallet secret for authentication.
             debugging (bool): Whether debugging is enabled.
             base_path (str, optional): The base URL for the API. Defaults to "https://api.cdp.coinbase.com/platform".
-            max_network_retries (int): The maximum number of network retries. Defaults to 3.
+            max_network_retries (int): The maximum number of retries of GET, HEAD and OPTIONS
+                requests on network errors, 429 and 5xx responses. Ignored when retry_policy is
+                given. Defaults to 3.
             source (str): Specifies whether the sdk is being used directly or if it's an Agentkit extension.
             source_version (str): The version of the source package.
+            jwt_cache_margin (int, optional): When set, the JWTs signed for GET requests are
+                reused until this many seconds before they expire. Defaults to None (disabled).
+            signing_executor (Executor, optional): An executor to sign requests in, so that JWT
+                signing does not block the event loop. Both thread and process pools are
+                supported. The executor is not shut down by the client. Defaults to None, which
+                signs on the event loop.
+            hot_endpoints (list[tuple[str, str]], optional): (method, path) pairs, with paths
+                relative to base_path, for which JWTs are signed ahead of time in the background
+                so that requests to them skip signing. Defaults to None.
+            jwt_pool_size (int): The number of pre-signed JWTs kept per hot endpoint.
+                Defaults to 4.
+            transport_registry (TransportRegistry, optional): A registry of aiohttp sessions to
+                share with other clients instead of creating a session for this client. Closing
+                the client releases the shared sessions. Defaults to None.
+            transport_config (TransportConfig, optional): Connection limits, keepalive, DNS
+                caching, TCP and timeout settings. Defaults to None, which keeps the settings
+                of the generated client.
+            retry_policy (RetryPolicy, optional): The retried statuses and methods, the number
+                of retries and their delays. Defaults to None, which retries as described for
+                max_network_retries.
+            retry_budget (RetryBudget, optional): The budget that stops retries while most
+                requests fail. Share one budget between clients to throttle their retries
+                together. Defaults to None, which gives the client its own budget.
+            idempotent_writes (bool): Whether to add a generated X-Idempotency-Key header to
+                write requests that do not have one, so that they are retried like GET
+                requests. Only operations that accept the header get one; other writes, such
+                as transfers, are never retried. The key is kept across the retries of a
+                request. Defaults to False.
+            circuit_breaker (CircuitBreaker, optional): Per-endpoint circuit breakers that make
+                calls to a failing endpoint fail fast. Defaults to None (disabled).
+            rate_limiter (RateLimiter, optional): A rate limiter that requests wait for a
+                permit from before they are sent. Defaults to None (disabled).
+            coalesce_requests (bool): Whether concurrent GET requests for the same URL share
+                one request to the API and one deserialized result. Defaults to False.
+            hedger (Hedger, optional): Sends a second copy of reads that are slower than
+                usual and uses the first response. Defaults to None (disabled).
+            json_codec (JsonCodec, optional): The codec that encodes JSON request bodies and
+                decodes the JSON responses that are not validated straight from bytes.
+                Defaults to None, which uses the json module of the generated client.
 
         """
-        retry_strategy = self._get_retry_strategy(max_network_retries)
-        configuration = Configuration(host=base_path, retries=retry_strategy)
+        configuration = Configuration(host=base_path)
         super().__init__(configuration)
+        self.rest_client = CdpRESTClientObject(
+            self.rest_client,
+            configuration,
+            transport_config,
+            transport_registry,
+            retry_policy or RetryPolicy(max_retries=max_network_retries),
+            retry_budget,
+            self._sign_retry,
+            rate_limiter,
+            hedger,
+            json_codec,
+        )
+        self._json_codec = json_codec
+        self._idempotent_writes = idempotent_writes
+        self._circuit_breaker = circuit_breaker
+        self._coalesce_requests = coalesce_requests
+        self._in_flight: dict[tuple, asyncio.Future[rest.RESTResponse]] = {}
 
-        self.api_key_id = api_key_id
-        self.api_key_secret = api_key_secret
-        self.wallet_secret = wallet_secret
-        self.source = source
-        self.source_version = source_version
+        self._jwt_signer = JwtSigner(api_key_id, api_key_secret, jwt_cache_margin)
+        self._jwt_cache_margin = jwt_cache_margin
+        self._signing_executor = signing_executor
+        self._wallet_jwt_signer = WalletJwtSigner(wallet_secret)
+        self._source = source
+        self._source_version = source_version
+        self._correlation_context = _get_correlation_data(source, source_version)
         self._debugging = debugging
 
+        self._jwt_pool: JwtPool | None = None
+        if hot_endpoints:
+            base_url = urlparse(base_path)
+            self._jwt_pool = JwtPool(
+                self._mint_jwt,
+                [
+                    (method.upper(), base_url.netloc, base_url.path + path)
+                    for method, path in hot_endpoints
+                ],
+                jwt_pool_size,
+            )
+
+    @property
+    def api_key_id(self) -> str:
+        """Get the API key ID used to sign requests."""
+        return self._jwt_signer.api_key_id
+
+    @api_key_id.setter
+    def api_key_id(self, value: str) -> None:
+        """Set the API key ID used to sign requests."""
+        self._jwt_signer.rotate(value, self._jwt_signer.api_key_secret)
+        if self._jwt_pool is not None:
+            self._jwt_pool.clear()
+
+    @property
+    def api_key_secret(self) -> str:
+        """Get the API key secret used to sign requests."""
+        return self._jwt_signer.api_key_secret
+
+    @api_key_secret.setter
+    def api_key_secret(self, value: str) -> None:
+        """Set the API key secret used to sign requests, discarding the cached parsed key."""
+        self._jwt_signer.rotate(self._jwt_signer.api_key_id, value)
+        if self._jwt_pool is not None:
+            self._jwt_pool.clear()
+
+    @property
+    def wallet_secret(self) -> str | None:
+        """Get the wallet secret used to sign Wallet Auth JWTs."""
+        return self._wallet_jwt_signer.wallet_secret
+
+    @wallet_secret.setter
+    def wallet_secret(self, value: str | None) -> None:
+        """Set the wallet secret used to sign Wallet Auth JWTs, discarding the cached key."""
+        self._wallet_jwt_signer.rotate(value)
+
+    @property
+    def source(self) -> str:
+        """Get the source reported in the Correlation-Context header."""
+        return self._source
+
+    @source.setter
+    def source(self, value: str) -> None:
+        """Set the source reported in the Correlation-Context header."""
+        self._source = value
+        self._correlation_context = _get_correlation_data(value, self._source_version)
+
+    @property
+    def source_version(self) -> str:
+        """Get the source version reported in the Correlation-Context header."""
+        return self._source_version
+
+    @source_version.setter
+    def source_version(self, value: str) -> None:
+        """Set the source version reported in the Correlation-Context header."""
+        self._source_version = value
+        self._correlation_context = _get_correlation_data(self._source, value)
+
     async def call_api(
         self,
         method,
@@ -62,6 +247,59 @@ class CdpApiClient(ApiClient):
         _request_timeout=None,
     ) -> rest.RESTResponse:
         """Make the HTTP request (asynchronous)."""
+        if not self._coalesce_requests or method.upper() != "GET":
+            return await self._call_api(
+                method, url, header_params, body, post_params, _request_timeout
+            )
+
+        # Join an identical request that is in flight, or start one that others can join
+        key = (
+            asyncio.get_running_loop(),
+            url,
+            tuple(sorted((header_params or {}).items())),
+        )
+        flight = self._in_flight.get(key)
+        if flight is None:
+            flight = asyncio.ensure_future(
+                self._call_api_and_read(
+                    method, url, header_params, body, post_params, _request_timeout
+                )
+            )
+            self._in_flight[key] = flight
+            flight.add_done_callback(partial(self._land, key))
+        # The request runs in its own task, which took a copy of the endpoint.
+        _endpoint.set(None)
+        # Cancelling one caller must not cancel the request for the others.
+        return await asyncio.shield(flight)
+
+    async def _call_api_and_read(
+        self, method, url, header_params, body, post_params, _request_timeout
+    ) -> rest.RESTResponse:
+        """Make the HTTP request and read the response, so that callers can share it."""
+        response = await self._call_api(
+            method, url, header_params, body, post_params, _request_timeout
+        )
+        await response.read()
+        return response
+
+    def _land(self, key: tuple, flight: asyncio.Future) -> None:
+        """Remove a finished request from the requests in flight."""
+        if self._in_flight.get(key) is flight:
+            del self._in_flight[key]
+        # Mark the error as retrieved in case every caller was cancelled.
+        if not flight.cancelled():
+            flight.exception()
+
+    async def _call_api(
+        self,
+        method,
+        url,
+        header_params=None,
+        body=None,
+        post_params=None,
+        _request_timeout=None,
+    ) -> rest.RESTResponse:
+        """Sign and send the HTTP request, converting errors to ApiError."""
         if self._debugging is True:
             print(f"CDP API REQUEST: {method} {url}")
 
@@ -69,34 +307,47 @@ class CdpApiClient(ApiClient):
         parsed_url = urlparse(
             url if url.startswith("http") else self.configuration.host + url
         )
+        endpoint = self._get_endpoint(method, parsed_url.path)
+        idempotent = endpoint in _IDEMPOTENT_ENDPOINTS
+
+        # Fail fast if the endpoint's circuit is open, before any JWT is signed
+        if self._circuit_breaker is not None:
+            self._circuit_breaker.before_call(endpoint)
 
         # Get auth headers
-        auth_headers = get_auth_headers(
-            GetAuthHeadersOptions(
-                api_key_id=self.api_key_id,
-                api_key_secret=self.api_key_secret,
-                request_method=method,
-                request_host=parsed_url.netloc,
-                request_path=parsed_url.path,
-                request_body=body,
-                wallet_secret=self.wallet_secret,
-                source=self.source,
-                source_version=self.source_version,
+        try:
+            auth_headers = await self._get_request_auth_headers(
+                method, parsed_url.netloc, parsed_url.path, body
             )
-        )
+        except BaseException:
+            if self._circuit_breaker is not None:
+                self._circuit_breaker.record(endpoint, None)
+            raise
 
         # Merge headers
         request_headers = header_params or {}
         request_headers.update(auth_headers)
+        if (
+            self._idempotent_writes
+            and idempotent
+            and method.upper() not in READ_METHODS
+            and IDEMPOTENCY_KEY_HEADER not in request_headers
+        ):
+            request_headers[IDEMPOTENCY_KEY_HEADER] = str(uuid.uuid4())
 
         if self._debugging is True:
             print(f"Request headers: {request_headers}")
 
         # Make request through parent class
+        succeeded = None
+        # Writes are only retried if the API deduplicates them by their idempotency key
+        idempotent_token = accepts_idempotency_key.set(idempotent)
         try:
             response = await super().call_api(
                 method, url, request_headers, body, post_params, _request_timeout
             )
+            if self._circuit_breaker is not None:
+                succeeded = not self._circuit_breaker.is_failure_status(response.status)
             return response
         except ApiException as e:
             if self._debugging:
@@ -172,6 +423,7 @@ class CdpApiClient(ApiClient):
                 error_link=ERROR_DOCS_PAGE_URL,
             ) from None
         except Exception as e:
+            succeeded = False
             if self._debugging:
                 print(f"Error: {e}")
 
@@ -191,6 +443,163 @@ class CdpApiClient(ApiClient):
                 error_message=f"An unexpected error occurred: {e!s}",
                 error_link=ERROR_DOCS_PAGE_URL,
             ) from None
+        finally:
+            accepts_idempotency_key.reset(idempotent_token)
+            if self._circuit_breaker is not None:
+                self._circuit_breaker.record(endpoint, succeeded)
+
+    def param_serialize(self, method, resource_path, *args, **kwargs):
+        """Build the request params, remembering the path template of the endpoint."""
+        _endpoint.set((method, resource_path))
+        return super().param_serialize(method, resource_path, *args, **kwargs)
+
+    def sanitize_for_serialization(self, obj):
+        """Serialize request params and bodies with serializers compiled per model class."""
+        return serialize(obj)
+
+    def _get_endpoint(self, method: str, path: str) -> str:
+        """Identify the endpoint of a request by its method and path template.
+
+        Args:
+            method (str): The HTTP method.
+            path (str): The request path, used when the request was not built by a generated
+                API method.
+
+        Returns:
+            str: The endpoint, e.g. "POST /v2/evm/accounts/{address}/sign".
+
+        """
+        method = method.upper()
+        serialized = _endpoint.get()
+        if serialized is not None:
+            _endpoint.set(None)
+            if serialized[0].upper() == method:
+                path = serialized[1]
+        return f"{method} {path}"
+
+    async def close(self):
+        """Close the client and stop pre-signing JWTs."""
+        if self._jwt_pool is not None:
+            await self._jwt_pool.close()
+        await super().close()
+
+    async def _get_request_auth_headers(
+        self, method: str, host: str, path: str, body: dict | None
+    ) -> dict[str, str]:
+        """Sign a request, in the signing executor if one is configured.
+
+        Args:
+            method (str): The HTTP method.
+            host (str): The request host.
+            path (str): The request path.
+            body (dict, optional): The request body.
+
+        Returns:
+            dict[str, str]: The authentication headers.
+
+        """
+        bearer_token = (
+            self._jwt_pool.take(method, host, path) if self._jwt_pool is not None else None
+        )
+
+        # With a pre-signed JWT and no Wallet Auth JWT to sign, there is nothing left to offload.
+        if self._signing_executor is None or (
+            bearer_token is not None and not _requires_wallet_auth(method, path)
+        ):
+            return _get_auth_headers(
+                self._jwt_signer,
+                self._wallet_jwt_signer,
+                method,
+                host,
+                path,
+                body,
+                self._correlation_context,
+                bearer_token=bearer_token,
+            )
+
+        loop = asyncio.get_running_loop()
+        if isinstance(self._signing_executor, ProcessPoolExecutor):
+            # Signers hold parsed keys that cannot be pickled, so worker processes keep their own.
+            return await loop.run_in_executor(
+                self._signing_executor,
+                partial(
+                    _get_auth_headers_with_credentials,
+                    self.api_key_id,
+                    self.api_key_secret,
+                    self.wallet_secret,
+                    self._jwt_cache_margin,
+                    method,
+                    host,
+                    path,
+                    body,
+                    self._correlation_context,
+                    bearer_token=bearer_token,
+                ),
+            )
+        return await loop.run_in_executor(
+            self._signing_executor,
+            partial(
+                _get_auth_headers,
+                self._jwt_signer,
+                self._wallet_jwt_signer,
+                method,
+                host,
+                path,
+                body,
+                self._correlation_context,
+                bearer_token=bearer_token,
+            ),
+        )
+
+    async def _sign_retry(self, method: str, url: str, body: dict | None) -> dict[str, str]:
+        """Sign a request again before it is retried.
+
+        Args:
+            method (str): The HTTP method.
+            url (str): The request URL.
+            body (dict, optional): The request body.
+
+        Returns:
+            dict[str, str]: The authentication headers.
+
+        """
+        parsed_url = urlparse(url)
+        return await self._get_request_auth_headers(
+            method, parsed_url.netloc, parsed_url.path, body
+        )
+
+    async def _mint_jwt(self, method: str, host: str, path: str) -> str:
+        """Sign a JWT for the JWT pool, in the signing executor if one is configured.
+
+        Args:
+            method (str): The HTTP method.
+            host (str): The request host.
+            path (str): The request path.
+
+        Returns:
+            str: The signed JWT.
+
+        """
+        # Every pooled JWT is handed out once, so each one is signed anew rather than reused
+        # from the cache of GET JWTs.
+        if self._signing_executor is None:
+            return self._jwt_signer.generate_jwt(method, host, path, use_cache=False)
+
+        loop = asyncio.get_running_loop()
+        if isinstance(self._signing_executor, ProcessPoolExecutor):
+            return await loop.run_in_executor(
+                self._signing_executor,
+                _generate_jwt_with_credentials,
+                self.api_key_id,
+                self.api_key_secret,
+                method,
+                host,
+                path,
+            )
+        return await loop.run_in_executor(
+            self._signing_executor,
+            partial(self._jwt_signer.generate_jwt, method, host, path, use_cache=False),
+        )
 
     def response_deserialize(
         self,
@@ -207,8 +616,18 @@ class CdpApiClient(ApiClient):
             ApiResponse[ApiResponseT]
 
         """
+        # Callers that share a coalesced response also share its deserialized result.
+        deserialized = getattr(response_data, "_cdp_deserialized", None)
+        if deserialized is not None and deserialized[0] == response_types_map:
+            return deserialized[1]
+
         try:
-            return super().response_deserialize(response_data, response_types_map)
+            result = self._deserialize_json(response_data, response_types_map)
+            if result is None:
+                result = super().response_deserialize(response_data, response_types_map)
+            if self._coalesce_requests:
+                response_data._cdp_deserialized = (response_types_map, result)
+            return result
         except ApiException as e:
             # Try to parse response body as JSON
             try:
@@ -233,19 +652,75 @@ class CdpApiClient(ApiClient):
                     error_link=f"{ERROR_DOCS_PAGE_URL}",
                 ) from None
 
-    def _get_retry_strategy(self, max_network_retries: int) -> Retry:
-        """Return the retry strategy for the CDP API Client.
+    def deserialize(self, response_text: str, response_type: str, content_type: str | None):
+        """Deserialize a response body, with the decoder of the response type.
 
         Args:
-            max_network_retries (int): The maximum number of network retries.
+            response_text: The response body.
+            response_type: The response type, e.g. "List[EvmAccount]".
+            content_type: The content type of the response.
 
         Returns:
-            Retry: The retry strategy.
+            The deserialized response.
 
         """
-        return Retry(
-            total=max_network_retries,  # Number of total retries
-            status_forcelist=[500, 502, 503, 504],  # Retry on HTTP status code 500
-            allowed_methods=["GET"],  # Retry only on GET requests
-            backoff_factor=1,  # Exponential backoff factor
+        if content_type is None:
+            try:
+                data = json.loads(response_text)
+            except ValueError:
+                data = response_text
+        elif _JSON_CONTENT_TYPE.match(content_type):
+            data = json.loads(response_text) if response_text != "" else ""
+        elif _TEXT_CONTENT_TYPE.match(content_type):
+            data = response_text
+        else:
+            raise ApiException(status=0, reason=f"Unsupported content type: {content_type}")
+        return get_decoder(response_type)(data)
+
+    def _deserialize_json(
+        self,
+        response_data: rest.RESTResponse,
+        response_types_map: dict[str, ApiResponseT] | None,
+    ) -> ApiResponse[ApiResponseT] | None:
+        """Deserialize a successful JSON response straight from its bytes.
+
+        Models that validate the same from JSON as from a dict are validated by pydantic from
+        the bytes, skipping the decoding to text, json.loads and the walk over the decoded
+        data. Other response types are decoded with the JSON codec, if one is configured.
+
+        Args:
+            response_data: REST response data.
+            response_types_map: Map of response types.
+
+        Returns:
+            The ApiResponse, or None if the generated client must deserialize the response.
+
+        """
+        status = response_data.status
+        if not 200 <= status <= 299 or not response_data.data or not response_types_map:
+            return None
+        response_type = response_types_map.get(str(status)) or response_types_map.get(
+            str(status)[0] + "XX"
+        )
+        content_type = response_data.getheader("content-type")
+        if (
+            not isinstance(response_type, str)
+            or content_type is None
+            or not _JSON_CONTENT_TYPE.match(content_type)
+            or _NON_UTF8_CHARSET.search(content_type)
+        ):
+            return None
+
+        model = getattr(cdp.openapi_client.models, response_type, None)
+        if isinstance(model, type) and issubclass(model, BaseModel) and can_validate_json(model):
+            data = model.model_validate_json(response_data.data)
+        elif self._json_codec is not None and response_type not in ("bytearray", "file"):
+            data = get_decoder(response_type)(self._json_codec.loads(response_data.data))
+        else:
+            return None
+        return ApiResponse(
+            status_code=status,
+            data=data,
+            headers=response_data.getheaders(),
+            raw_data=response_data.data,
         )
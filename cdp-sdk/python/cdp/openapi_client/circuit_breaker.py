@@ -0,0 +1,258 @@
+import logging
+import threading
+import time
+from collections.abc import Callable
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+from cdp.openapi_client.constants import ERROR_DOCS_PAGE_URL
+from cdp.openapi_client.errors import ApiError
+
+# Add logger
+logger = logging.getLogger(__name__)
+
+CircuitState = Literal["closed", "open", "half_open"]
+
+
+class CircuitBreakerConfig(BaseModel):
+    """Settings of a circuit breaker.
+
+    Attributes:
+        failure_threshold - The number of consecutive failed calls to an endpoint that open its
+            circuit (defaults to 5)
+        recovery_timeout - The number of seconds an open circuit rejects calls before it lets a
+            probe call through (defaults to 30)
+        half_open_max_calls - The number of probe calls let through at the same time while the
+            circuit is half-open (defaults to 1)
+        failure_statuses - The response statuses that count as failures, in addition to
+            network errors and timeouts (defaults to 500, 502, 503 and 504)
+
+    """
+
+    failure_threshold: int = Field(5, ge=1, description="Consecutive failures that open")
+    recovery_timeout: float = Field(30, ge=0, description="Seconds before a probe call")
+    half_open_max_calls: int = Field(1, ge=1, description="Concurrent probe calls")
+    failure_statuses: frozenset[int] = Field(
+        frozenset({500, 502, 503, 504}), description="Statuses that count as failures"
+    )
+
+
+class CircuitMetrics(BaseModel):
+    """A snapshot of the state and counters of one endpoint's circuit.
+
+    Attributes:
+        state - The state of the circuit: closed, open or half_open
+        successes - The number of successful calls
+        failures - The number of failed calls
+        rejections - The number of calls rejected while the circuit was open
+        times_opened - The number of times the circuit opened
+        consecutive_failures - The number of failed calls since the last successful one
+
+    """
+
+    state: CircuitState = Field(..., description="The state of the circuit")
+    successes: int = Field(0, description="Number of successful calls")
+    failures: int = Field(0, description="Number of failed calls")
+    rejections: int = Field(0, description="Number of rejected calls")
+    times_opened: int = Field(0, description="Number of times the circuit opened")
+    consecutive_failures: int = Field(0, description="Failed calls since the last success")
+
+
+class CircuitOpenError(ApiError):
+    """Raised instead of calling an endpoint whose circuit is open."""
+
+    def __init__(self, endpoint: str, retry_after: float) -> None:
+        self.endpoint = endpoint
+        self.retry_after = retry_after
+        super().__init__(
+            http_code=503,
+            error_type="circuit_open",
+            error_message=(
+                f"Circuit breaker is open for {endpoint} after repeated failures. "
+                f"Try again in {retry_after:.1f}s."
+            ),
+            error_link=ERROR_DOCS_PAGE_URL,
+        )
+
+
+class _Circuit:
+    """The state of one endpoint's circuit."""
+
+    def __init__(self) -> None:
+        self.state: CircuitState = "closed"
+        self.opened_at = 0.0
+        self.probes_in_flight = 0
+        self.metrics = CircuitMetrics(state="closed")
+
+
+class CircuitBreaker:
+    """Per-endpoint circuit breakers for the CDP API client.
+
+    Every endpoint, identified by its method and path template such as
+    ``POST /v2/evm/accounts/{address}/sign``, has its own circuit. After failure_threshold
+    consecutive failed calls the circuit opens and calls to the endpoint fail fast with a
+    CircuitOpenError, without waiting for timeouts and retries, so a degraded endpoint does not
+    tie up the event loop and connection pool used by calls to healthy endpoints. After
+    recovery_timeout the circuit turns half-open and lets probe calls through: a successful probe
+    closes the circuit, a failed one opens it again.
+
+    A breaker can be shared by several clients. Use ``get_metrics`` or the on_state_change hook
+    to export the state of the circuits to a metrics system.
+
+    Args:
+        config: The circuit breaker settings
+        on_state_change: Optional function that is called with the endpoint, the old state and
+            the new state whenever a circuit changes state
+
+    """
+
+    def __init__(
+        self,
+        config: CircuitBreakerConfig | None = None,
+        on_state_change: Callable[[str, CircuitState, CircuitState], None] | None = None,
+    ) -> None:
+        self.config = config or CircuitBreakerConfig()
+        self.on_state_change = on_state_change
+        self._circuits: dict[str, _Circuit] = {}
+        self._lock = threading.Lock()
+
+    def before_call(self, endpoint: str) -> None:
+        """Check that a call to an endpoint may be made.
+
+        Args:
+            endpoint: The method and path template of the endpoint
+
+        Raises:
+            CircuitOpenError: If the circuit of the endpoint is open, or half-open with the
+                maximum number of probe calls in flight
+
+        """
+        change = None
+        try:
+            with self._lock:
+                circuit = self._circuits.get(endpoint)
+                if circuit is None or circuit.state == "closed":
+                    return
+                if circuit.state == "open":
+                    remaining = circuit.opened_at + self.config.recovery_timeout - time.monotonic()
+                    if remaining > 0:
+                        circuit.metrics.rejections += 1
+                        raise CircuitOpenError(endpoint, remaining)
+                    change = self._transition(endpoint, circuit, "half_open")
+                if circuit.probes_in_flight >= self.config.half_open_max_calls:
+                    circuit.metrics.rejections += 1
+                    raise CircuitOpenError(endpoint, 0)
+                circuit.probes_in_flight += 1
+        finally:
+            self._report(change)
+
+    def record(self, endpoint: str, succeeded: bool | None) -> None:
+        """Record the outcome of a call that before_call allowed.
+
+        Args:
+            endpoint: The method and path template of the endpoint
+            succeeded: Whether the call succeeded, or None if it ended without an outcome, e.g.
+                because it was cancelled or the request was invalid
+
+        """
+        change = None
+        with self._lock:
+            circuit = self._circuits.get(endpoint)
+            if circuit is None:
+                circuit = self._circuits[endpoint] = _Circuit()
+            if circuit.state == "half_open":
+                circuit.probes_in_flight = max(0, circuit.probes_in_flight - 1)
+
+            if succeeded is None:
+                return
+            if succeeded:
+                circuit.metrics.successes += 1
+                circuit.metrics.consecutive_failures = 0
+                if circuit.state == "half_open":
+                    change = self._transition(endpoint, circuit, "closed")
+            else:
+                circuit.metrics.failures += 1
+                circuit.metrics.consecutive_failures += 1
+                if circuit.state == "half_open" or (
+                    circuit.state == "closed"
+                    and circuit.metrics.consecutive_failures >= self.config.failure_threshold
+                ):
+                    circuit.opened_at = time.monotonic()
+                    change = self._transition(endpoint, circuit, "open")
+        self._report(change)
+
+    def is_failure_status(self, status: int) -> bool:
+        """Check whether a response status counts as a failure.
+
+        Args:
+            status: The HTTP status of the response
+
+        Returns:
+            True if the status counts as a failure
+
+        """
+        return status in self.config.failure_statuses
+
+    def get_state(self, endpoint: str) -> CircuitState:
+        """Get the state of an endpoint's circuit.
+
+        Args:
+            endpoint: The method and path template of the endpoint
+
+        Returns:
+            The state of the circuit
+
+        """
+        circuit = self._circuits.get(endpoint)
+        return "closed" if circuit is None else circuit.state
+
+    def get_metrics(self) -> dict[str, CircuitMetrics]:
+        """Get a snapshot of the metrics of every endpoint that has been called.
+
+        Returns:
+            The metrics by endpoint
+
+        """
+        with self._lock:
+            return {
+                endpoint: circuit.metrics.model_copy()
+                for endpoint, circuit in self._circuits.items()
+            }
+
+    def reset(self) -> None:
+        """Close all circuits and clear their metrics."""
+        with self._lock:
+            self._circuits.clear()
+
+    def _transition(
+        self, endpoint: str, circuit: _Circuit, state: CircuitState
+    ) -> tuple[str, CircuitState, CircuitState]:
+        """Move a circuit to a new state, returning the change to report once unlocked."""
+        previous = circuit.state
+        circuit.state = state
+        circuit.metrics.state = state
+        circuit.probes_in_flight = 0
+        if state == "open":
+            circuit.metrics.times_opened += 1
+        return endpoint, previous, state
+
+    def _report(self, change: tuple[str, CircuitState, CircuitState] | None) -> None:
+        """Log a state change and call the hook, without holding the lock.
+
+        The hook may call back into the breaker, and a slow hook must not hold up calls to
+        other endpoints.
+        """
+        if change is None:
+            return
+        endpoint, previous, state = change
+        if state == "open":
+            logger.warning("Circuit breaker opened for %s", endpoint)
+        elif state == "closed":
+            logger.info("Circuit breaker closed for %s", endpoint)
+
+        if self.on_state_change is not None:
+            try:
+                self.on_state_change(endpoint, previous, state)
+            except Exception:
+                logger.exception("Circuit breaker state change hook failed")
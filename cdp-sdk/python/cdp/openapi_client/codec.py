@@ -0,0 +1,396 @@
+import datetime
+import decimal
+import json
+import re
+import typing
+from collections.abc import Callable
+from enum import Enum
+from typing import Annotated, Any, Literal
+
+from dateutil.parser import parse
+from pydantic import BaseModel, SecretStr
+from pydantic_core import PydanticUndefined
+
+import cdp.openapi_client.models
+from cdp.openapi_client.exceptions import ApiException
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+
+class JsonCodec:
+    """Encodes request bodies and decodes response bodies as JSON, with the json module.
+
+    Subclass it to plug in another JSON library.
+    """
+
+    def dumps(self, obj: Any) -> bytes:
+        """Encode a request body.
+
+        Args:
+            obj: The sanitized body, made of dicts, lists and primitive values
+
+        Returns:
+            The UTF-8 encoded JSON
+
+        """
+        return json.dumps(obj).encode()
+
+    def loads(self, data: bytes) -> Any:
+        """Decode a response body.
+
+        Args:
+            data: The UTF-8 encoded JSON
+
+        Returns:
+            The decoded dicts, lists and primitive values
+
+        """
+        return json.loads(data)
+
+
+class OrjsonCodec(JsonCodec):
+    """A JsonCodec that uses orjson, which must be installed.
+
+    Values orjson does not support, such as integers beyond 64 bits, fall back to the json
+    module.
+    """
+
+    def __init__(self) -> None:
+        if orjson is None:
+            raise ImportError(
+                "OrjsonCodec requires orjson, install it with `pip install cdp-sdk[orjson]`"
+            )
+
+    def dumps(self, obj: Any) -> bytes:
+        """Encode a request body."""
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            return super().dumps(obj)
+
+    def loads(self, data: bytes) -> Any:
+        """Decode a response body."""
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            return super().loads(data)
+
+
+def get_default_json_codec() -> JsonCodec:
+    """Get the fastest JsonCodec available.
+
+    Returns:
+        An OrjsonCodec if orjson is installed, otherwise a JsonCodec
+
+    """
+    return OrjsonCodec() if orjson is not None else JsonCodec()
+
+
+# Whether each model can be validated from JSON directly, by model class
+_json_validated_models: dict[type[BaseModel], bool] = {}
+
+# Whether each model can be serialized by model_dump alone, by model class
+_dumped_models: dict[type[BaseModel], bool] = {}
+
+# The field types that sanitize_for_serialization returns unchanged
+_JSON_TYPES = (str, int, float, bool, type(None), list, dict, object)
+
+_PRIMITIVE_TYPES = (float, bool, bytes, str, int)
+
+
+def can_validate_json(model: type[BaseModel]) -> bool:
+    """Check whether a generated model gives the same result from model_validate_json as from_dict.
+
+    That holds unless the model or a model nested in it is a oneOf or anyOf wrapper, keeps
+    additional properties, or has fields with a default other than None, which from_dict also
+    applies to explicit nulls. Such models are deserialized with from_dict.
+
+    Args:
+        model: The model class
+
+    Returns:
+        True if the model can be validated from the JSON bytes directly
+
+    """
+    return _check_model(model, _json_validated_models, _validates_json)
+
+
+def _can_dump(model: type[BaseModel]) -> bool:
+    """Check whether sanitizing a generated model gives the same result as model_dump.
+
+    That holds unless the model or a model nested in it is a oneOf or anyOf wrapper, keeps
+    additional properties, sends explicit nulls for nullable fields, or has fields of other
+    types than JSON types and models, such as datetimes, which sanitize_for_serialization
+    formats differently.
+    """
+    return _check_model(model, _dumped_models, _dumps)
+
+
+# The compiled serializer of each model, by model class
+_serializers: dict[type[BaseModel], Callable[[BaseModel], Any] | None] = {}
+
+
+def serialize(obj: Any) -> Any:
+    """Serialize a request body to JSON types, like ApiClient.sanitize_for_serialization.
+
+    Models are serialized by a serializer compiled once per model class. Models made only of
+    JSON types and such models are serialized by pydantic's model_dump in one pass. oneOf
+    wrappers serialize their actual instance, and other models serialize their fields one by
+    one, so only the parts of a body that model_dump cannot handle are walked in Python.
+
+    Args:
+        obj: The body, usually a generated model
+
+    Returns:
+        The body made of dicts, lists and primitive values
+
+    """
+    obj_type = type(obj)
+    if obj_type in _PRIMITIVE_TYPES or obj is None:
+        return obj
+    if isinstance(obj, BaseModel):
+        if obj_type not in _serializers:
+            try:
+                _serializers[obj_type] = _compile(obj_type)
+            except Exception:
+                # Models that cannot be inspected are serialized with to_dict.
+                _serializers[obj_type] = None
+        serializer = _serializers[obj_type]
+        if serializer is not None:
+            return serializer(obj)
+    if isinstance(obj, list):
+        return [serialize(item) for item in obj]
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, SecretStr):
+        return obj.get_secret_value()
+    if isinstance(obj, _PRIMITIVE_TYPES):
+        return obj
+    if isinstance(obj, tuple):
+        return tuple(serialize(item) for item in obj)
+    if isinstance(obj, datetime.datetime | datetime.date):
+        return obj.isoformat()
+    if isinstance(obj, decimal.Decimal):
+        return str(obj)
+    if isinstance(obj, dict):
+        obj_dict = obj
+    elif callable(getattr(obj, "to_dict", None)):
+        obj_dict = obj.to_dict()
+    else:
+        obj_dict = obj.__dict__
+    return {key: serialize(value) for key, value in obj_dict.items()}
+
+
+def _compile(model: type[BaseModel]) -> Callable[[BaseModel], Any] | None:
+    """Compile the serializer of a model, or return None if to_dict must be used."""
+    if _can_dump(model):
+
+        def dump(obj: BaseModel) -> Any:
+            return obj.model_dump(mode="json", by_alias=True, exclude_none=True)
+
+        return dump
+
+    fields = model.model_fields
+    if "actual_instance" in fields:
+
+        def dump_instance(obj: BaseModel) -> Any:
+            return serialize(obj.actual_instance)
+
+        return dump_instance
+
+    if "additional_properties" in fields or _sends_nulls(model):
+        return None
+    keys = [(name, field.alias or name) for name, field in fields.items()]
+
+    def dump_fields(obj: BaseModel) -> Any:
+        result = {}
+        for name, key in keys:
+            value = getattr(obj, name)
+            if value is not None:
+                result[key] = serialize(value)
+        return result
+
+    return dump_fields
+
+
+def _check_model(
+    model: type[BaseModel],
+    results: dict[type[BaseModel], bool],
+    check_field: Callable[[Any], bool],
+) -> bool:
+    """Check a model and the models nested in it, caching the result."""
+    result = results.get(model)
+    if result is not None:
+        return result
+    # Recursive models are assumed to pass while they are being checked.
+    results[model] = True
+    fields = model.model_fields
+    try:
+        result = (
+            "actual_instance" not in fields
+            and "additional_properties" not in fields
+            and all(check_field(field) for field in fields.values())
+            and all(
+                _check_model(nested, results, check_field)
+                for field in fields.values()
+                for nested in _get_types(field.annotation)
+                if issubclass(nested, BaseModel)
+            )
+        )
+        if result and check_field is _dumps:
+            # to_dict adds explicit nulls of nullable fields, which model_dump leaves out.
+            result = not _sends_nulls(model)
+    except Exception:
+        # Models that cannot be inspected take the generated code path.
+        result = False
+    results[model] = result
+    return result
+
+
+def _sends_nulls(model: type[BaseModel]) -> bool:
+    """Check whether to_dict sends explicit nulls, as it does for nullable fields that are set.
+
+    Nullable fields cannot be told apart from other optional fields by their annotations, so
+    to_dict is called on an instance whose fields are all set to None.
+    """
+    fields = model.model_fields
+    instance = model.model_construct(_fields_set=set(fields), **dict.fromkeys(fields))
+    return None in instance.to_dict().values()
+
+
+def _validates_json(field: Any) -> bool:
+    """Check whether a field validates the same from JSON as from a decoded dict."""
+    if field.default not in (None, PydanticUndefined):
+        return False
+    return bytes not in _get_types(field.annotation)
+
+
+def _dumps(field: Any) -> bool:
+    """Check whether model_dump serializes a field like sanitize_for_serialization."""
+    return all(
+        field_type in _JSON_TYPES or issubclass(field_type, BaseModel)
+        for field_type in _get_types(field.annotation)
+    )
+
+
+def _get_types(annotation: Any) -> set[type]:
+    """Get the classes in a field annotation, with object for Any."""
+    if annotation is Any:
+        return {object}
+    if isinstance(annotation, type):
+        return {annotation}
+    origin = typing.get_origin(annotation)
+    if origin is Literal:
+        return set()
+    args = typing.get_args(annotation)
+    if origin is Annotated:
+        return _get_types(args[0])
+    types = {origin} if isinstance(origin, type) else set()
+    for arg in args:
+        types |= _get_types(arg)
+    return types
+
+
+# The decoder of each response type, by response type string
+_decoders: dict[str, Callable[[Any], Any]] = {}
+
+_LIST_TYPE = re.compile(r"List\[(.*)]")
+_DICT_TYPE = re.compile(r"Dict\[([^,]*), (.*)]")
+
+
+def get_decoder(response_type: str) -> Callable[[Any], Any]:
+    """Get the decoder of a response type, like ApiClient.deserialize does for decoded JSON.
+
+    The response type string, such as ``List[EvmAccount]``, is parsed and its classes are
+    looked up once. Later responses of the same type are decoded without parsing strings or
+    looking up module attributes.
+
+    Args:
+        response_type: The response type of an operation, as in its _response_types_map
+
+    Returns:
+        A function that turns the decoded JSON of a response into the response type
+
+    """
+    decoder = _decoders.get(response_type)
+    if decoder is None:
+        decoder = _decoders[response_type] = _compile_decoder(response_type)
+    return decoder
+
+
+def _compile_decoder(response_type: str) -> Callable[[Any], Any]:
+    """Build the decoder of a response type."""
+    if response_type.startswith("List["):
+        item_decoder = get_decoder(_LIST_TYPE.match(response_type).group(1))
+        return _none_safe(lambda data: [item_decoder(item) for item in data])
+    if response_type.startswith("Dict["):
+        value_decoder = get_decoder(_DICT_TYPE.match(response_type).group(2))
+        return _none_safe(lambda data: {k: value_decoder(v) for k, v in data.items()})
+
+    klass = _NATIVE_TYPES.get(response_type)
+    if klass is None:
+        klass = getattr(cdp.openapi_client.models, response_type)
+    if klass in _PRIMITIVE_TYPES:
+        return _none_safe(lambda data: _decode_primitive(data, klass))
+    if klass is object:
+        return lambda data: data
+    if klass is datetime.date:
+        return _none_safe(lambda data: _decode_datetime(data, "date").date())
+    if klass is datetime.datetime:
+        return _none_safe(lambda data: _decode_datetime(data, "datetime"))
+    if klass is decimal.Decimal:
+        return _none_safe(decimal.Decimal)
+    if issubclass(klass, Enum):
+        return _none_safe(lambda data: _decode_enum(data, klass))
+    return _none_safe(klass.from_dict)
+
+
+_NATIVE_TYPES = {
+    "int": int,
+    "long": int,
+    "float": float,
+    "str": str,
+    "bool": bool,
+    "date": datetime.date,
+    "datetime": datetime.datetime,
+    "decimal": decimal.Decimal,
+    "object": object,
+}
+
+
+def _none_safe(decoder: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    """Make a decoder return None for null values."""
+
+    def decode(data: Any) -> Any:
+        return None if data is None else decoder(data)
+
+    return decode
+
+
+def _decode_primitive(data: Any, klass: type) -> Any:
+    """Decode a primitive value."""
+    try:
+        return klass(data)
+    except UnicodeEncodeError:
+        return str(data)
+    except TypeError:
+        return data
+
+
+def _decode_datetime(data: str, kind: str) -> datetime.datetime:
+    """Parse an ISO 8601 date or datetime."""
+    try:
+        return parse(data)
+    except ValueError:
+        raise ApiException(status=0, reason=f"Failed to parse `{data}` as {kind} object") from None
+
+
+def _decode_enum(data: Any, klass: type[Enum]) -> Enum:
+    """Decode an enum value."""
+    try:
+        return klass(data)
+    except ValueError:
+        raise ApiException(status=0, reason=f"Failed to parse `{data}` as `{klass}`") from None
@@ -0,0 +1,193 @@
+import logging
+import threading
+from collections import deque
+from fnmatch import fnmatchcase
+
+from pydantic import BaseModel, Field
+
+# Add logger
+logger = logging.getLogger(__name__)
+
+
+class HedgingConfig(BaseModel):
+    """Settings of request hedging.
+
+    Attributes:
+        paths - Glob patterns of the request paths to hedge, relative to the base path of the
+            client, e.g. /v2/evm/smart-accounts/*/user-operations/*. Every pattern learns its
+            own latency.
+        methods - The HTTP methods to hedge. Only methods without side effects may be hedged
+            (defaults to GET)
+        delay - The number of seconds after which a hedge is sent, or None to use the learned
+            latency percentile of the path (defaults to None)
+        percentile - The latency percentile after which a hedge is sent when no delay is set
+            (defaults to 0.95)
+        initial_delay - The delay used until min_samples latencies were observed (defaults to
+            0.5)
+        min_delay - The lowest learned delay (defaults to 0.05)
+        max_delay - The highest learned delay (defaults to 5)
+        min_samples - The number of observed latencies needed to use the learned delay
+            (defaults to 20)
+        window - The number of most recent latencies the percentile is computed from (defaults
+            to 200)
+        max_hedges - The maximum number of hedges sent per request (defaults to 1)
+
+    """
+
+    paths: list[str] = Field(..., description="Path patterns to hedge")
+    methods: frozenset[str] = Field(frozenset({"GET"}), description="HTTP methods to hedge")
+    delay: float | None = Field(None, gt=0, description="Fixed delay before a hedge")
+    percentile: float = Field(0.95, gt=0, lt=1, description="Latency percentile to hedge at")
+    initial_delay: float = Field(0.5, gt=0, description="Delay before enough samples")
+    min_delay: float = Field(0.05, ge=0, description="Lowest learned delay")
+    max_delay: float = Field(5, gt=0, description="Highest learned delay")
+    min_samples: int = Field(20, ge=1, description="Samples needed for the learned delay")
+    window: int = Field(200, ge=1, description="Number of latencies kept")
+    max_hedges: int = Field(1, ge=1, description="Maximum hedges per request")
+
+
+class HedgingMetrics(BaseModel):
+    """A snapshot of the hedging counters of one path pattern.
+
+    Attributes:
+        requests - The number of requests that could be hedged
+        hedges - The number of hedges sent
+        hedges_won - The number of requests answered by a hedge before the original request
+        hedges_skipped - The number of hedges not sent because the rate limiter or the retry
+            budget had no capacity for them
+        delay - The current delay before a hedge, in seconds
+
+    """
+
+    requests: int = Field(0, description="Number of requests that could be hedged")
+    hedges: int = Field(0, description="Number of hedges sent")
+    hedges_won: int = Field(0, description="Number of requests answered by a hedge")
+    hedges_skipped: int = Field(0, description="Number of hedges not sent")
+    delay: float = Field(0, description="Current delay before a hedge")
+
+
+class _PathStats:
+    """The latencies and counters of one path pattern."""
+
+    def __init__(self, window: int) -> None:
+        self.latencies: deque[float] = deque(maxlen=window)
+        self.metrics = HedgingMetrics()
+
+
+class Hedger:
+    """Hedges slow reads to cut the tail latency of the CDP API client.
+
+    When a matching request has not been answered after a delay, the client sends the same
+    request again and uses whichever response arrives first; the other request is cancelled.
+    The delay is either fixed or the learned latency percentile of the path pattern, so only
+    the slowest few percent of requests are hedged.
+
+    Hedges wait for no one: a hedge is only sent if the rate limiter of the client has a permit
+    available right away and the retry budget allows an extra request, so hedging does not add
+    load while the API is rate limiting or failing.
+
+    A hedger can be shared by several clients. Use ``get_metrics`` to export its counters to a
+    metrics system.
+
+    Args:
+        config: The hedging settings
+
+    """
+
+    def __init__(self, config: HedgingConfig) -> None:
+        self.config = config
+        self._stats: dict[str, _PathStats] = {}
+        self._lock = threading.Lock()
+
+    def get_pattern(self, method: str, path: str) -> str | None:
+        """Get the path pattern of a request.
+
+        Args:
+            method: The HTTP method in uppercase
+            path: The request path, relative to the base path of the client
+
+        Returns:
+            The matching path pattern, or None if the request is not hedged
+
+        """
+        if method not in self.config.methods:
+            return None
+        for pattern in self.config.paths:
+            if fnmatchcase(path, pattern):
+                return pattern
+        return None
+
+    def get_delay(self, pattern: str) -> float:
+        """Get the number of seconds to wait for a response before sending a hedge.
+
+        Args:
+            pattern: The path pattern of the request
+
+        Returns:
+            The delay
+
+        """
+        config = self.config
+        if config.delay is not None:
+            return config.delay
+        with self._lock:
+            stats = self._get_stats(pattern)
+            if len(stats.latencies) < config.min_samples:
+                return config.initial_delay
+            latencies = sorted(stats.latencies)
+        latency = latencies[int(config.percentile * (len(latencies) - 1))]
+        return min(config.max_delay, max(config.min_delay, latency))
+
+    def record_request(self, pattern: str) -> None:
+        """Count a request that may be hedged."""
+        with self._lock:
+            self._get_stats(pattern).metrics.requests += 1
+
+    def record_hedge(self, pattern: str, sent: bool) -> None:
+        """Count a hedge that was sent, or skipped for lack of capacity."""
+        with self._lock:
+            metrics = self._get_stats(pattern).metrics
+            if sent:
+                metrics.hedges += 1
+            else:
+                metrics.hedges_skipped += 1
+
+    def record_response(self, pattern: str, latency: float, hedge_won: bool) -> None:
+        """Record the latency of the first response to a request.
+
+        Args:
+            pattern: The path pattern of the request
+            latency: The number of seconds the first response took, from when it was sent
+            hedge_won: Whether the first response answered a hedge
+
+        """
+        with self._lock:
+            stats = self._get_stats(pattern)
+            stats.latencies.append(latency)
+            if hedge_won:
+                stats.metrics.hedges_won += 1
+        if hedge_won:
+            logger.debug("Hedge won for %s after %.3fs", pattern, latency)
+
+    def get_metrics(self) -> dict[str, HedgingMetrics]:
+        """Get a snapshot of the counters of every path pattern.
+
+        Returns:
+            The metrics by path pattern
+
+        """
+        with self._lock:
+            patterns = list(self._stats)
+        return {
+            pattern: self._stats[pattern].metrics.model_copy(
+                update={"delay": self.get_delay(pattern)}
+            )
+            for pattern in patterns
+        }
+
+    def _get_stats(self, pattern: str) -> _PathStats:
+        """Get the stats of a path pattern, creating them if needed."""
+        stats = self._stats.get(pattern)
+        if stats is None:
+            stats = self._stats[pattern] = _PathStats(self.config.window)
+        return stats
@@ -0,0 +1,274 @@
+import asyncio
+import time
+from collections.abc import Mapping
+from fnmatch import fnmatchcase
+
+from pydantic import BaseModel, Field
+
+from cdp.openapi_client.retry import parse_retry_after
+
+# Values of a rate limit reset header above this are Unix timestamps rather than seconds.
+_EPOCH_THRESHOLD = 1_000_000_000
+
+
+class RateLimitGroup(BaseModel):
+    """The rate limit of a group of endpoints.
+
+    Attributes:
+        name - The name of the group
+        paths - Glob patterns of the request paths in the group, relative to the base path of
+            the client, e.g. /v2/evm/faucet or /v2/evm/accounts/*/sign
+        methods - The HTTP methods in the group, or None for all methods
+        rate - The maximum number of requests per second
+        burst - The number of requests that can be sent at once after a quiet period, or None
+            for one second's worth of requests
+        min_rate - The lowest rate the limiter slows down to after 429 responses, or None for
+            a tenth of the rate
+
+    """
+
+    name: str = Field(..., description="The name of the group")
+    paths: list[str] = Field(default_factory=lambda: ["*"], description="Path patterns")
+    methods: frozenset[str] | None = Field(None, description="HTTP methods in the group")
+    rate: float = Field(..., gt=0, description="Maximum number of requests per second")
+    burst: int | None = Field(None, ge=1, description="Maximum number of requests at once")
+    min_rate: float | None = Field(None, gt=0, description="Lowest adapted rate")
+
+    def matches(self, method: str, path: str) -> bool:
+        """Check whether a request belongs to the group.
+
+        Args:
+            method: The HTTP method in uppercase
+            path: The request path, relative to the base path of the client
+
+        Returns:
+            True if the request belongs to the group
+
+        """
+        if self.methods is not None and method not in self.methods:
+            return False
+        return any(fnmatchcase(path, pattern) for pattern in self.paths)
+
+
+class _TokenBucket:
+    """A token bucket that hands out permits in the order they were requested.
+
+    A permit that is not available yet is reserved by taking the balance below zero, and the
+    caller sleeps until the bucket has refilled to cover it, so concurrent callers are spaced
+    evenly instead of polling.
+    """
+
+    def __init__(self, group: RateLimitGroup) -> None:
+        self.max_rate = group.rate
+        self.min_rate = min(group.min_rate or group.rate / 10, group.rate)
+        self.rate = group.rate
+        self.capacity = float(group.burst or max(1, int(group.rate)))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        # The rate announced by rate limit headers, and the monotonic time it applies until.
+        self.quota_rate = group.rate
+        self.quota_until = 0.0
+
+    def reserve(self) -> float:
+        """Take a permit.
+
+        Returns:
+            The number of seconds to wait before the permit may be used
+
+        """
+        self._refill()
+        self.tokens -= 1
+        return -self.tokens / self.rate if self.tokens < 0 else 0.0
+
+    def try_reserve(self) -> bool:
+        """Take a permit if one is available right away.
+
+        Returns:
+            True if a permit was taken
+
+        """
+        self._refill()
+        if self.tokens < 1:
+            return False
+        self.tokens -= 1
+        return True
+
+    def set_rate(self, rate: float) -> None:
+        """Change the refill rate, keeping the tokens accumulated at the old rate.
+
+        The rate stays between the minimum and maximum rates, and below the quota rate until
+        the quota resets.
+        """
+        self._refill()
+        rate = min(self.max_rate, max(self.min_rate, rate))
+        if self.updated < self.quota_until:
+            rate = min(self.quota_rate, rate)
+        self.rate = rate
+
+    def set_quota(self, rate: float, seconds: float) -> None:
+        """Keep the rate at or below a rate for a number of seconds, even below the minimum."""
+        self._refill()
+        self.quota_rate = rate
+        self.quota_until = self.updated + seconds
+        self.rate = min(self.rate, rate)
+
+    def pause(self, seconds: float) -> None:
+        """Hand out no permits for a number of seconds, then continue at the rate."""
+        self._refill()
+        # Permits requested during the pause queue up behind it instead of all firing at its end.
+        self.tokens = min(self.tokens, 1 - seconds * self.rate)
+
+    def _refill(self) -> None:
+        """Add the tokens that accumulated since the last update."""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+
+class RateLimiter:
+    """A client-side rate limiter that paces requests to the CDP API quotas.
+
+    Every group of endpoints has its own token bucket, and requests that match no group use the
+    default bucket. Requests over the limit wait for a permit instead of failing, so a burst of
+    calls is sent at the highest rate the quota allows.
+
+    The limiter adapts to the API: a 429 response halves the rate of its group, down to the
+    group's min_rate, and pauses the group for the Retry-After of the response. Every other
+    response raises the rate again by a small step, up to the configured rate. Rate limit
+    headers (X-RateLimit-Remaining and X-RateLimit-Reset, or their RateLimit-* equivalents)
+    pause the group until the reset when no requests are left, and otherwise cap its rate until
+    the reset to spread the remaining requests over it.
+
+    A limiter can be shared by clients that use the same quota.
+
+    Args:
+        rate: The maximum number of requests per second of requests that match no group, or
+            None to not limit them
+        burst: The number of such requests that can be sent at once, or None for one second's
+            worth of requests
+        groups: The rate limits of groups of endpoints. A request belongs to the first group
+            that matches it.
+        backoff_factor: The factor the rate of a group is multiplied with after a 429 response
+        recovery_step: The fraction of the configured rate that is added back to the rate of a
+            group after every other response
+
+    """
+
+    def __init__(
+        self,
+        rate: float | None = None,
+        burst: int | None = None,
+        groups: list[RateLimitGroup] | None = None,
+        backoff_factor: float = 0.5,
+        recovery_step: float = 0.02,
+    ) -> None:
+        if not 0 < backoff_factor < 1:
+            raise ValueError("backoff_factor must be between 0 and 1")
+        self.groups = list(groups or [])
+        if rate is not None:
+            self.groups.append(RateLimitGroup(name="default", rate=rate, burst=burst))
+        self.backoff_factor = backoff_factor
+        self.recovery_step = recovery_step
+        self._buckets = {group.name: _TokenBucket(group) for group in self.groups}
+
+    def get_group(self, method: str, path: str) -> str | None:
+        """Get the group of a request.
+
+        Args:
+            method: The HTTP method in uppercase
+            path: The request path, relative to the base path of the client
+
+        Returns:
+            The name of the group, or None if requests like this are not limited
+
+        """
+        for group in self.groups:
+            if group.matches(method, path):
+                return group.name
+        return None
+
+    def get_rate(self, group: str) -> float:
+        """Get the current, adapted rate of a group.
+
+        Args:
+            group: The name of the group
+
+        Returns:
+            The number of requests per second
+
+        """
+        return self._buckets[group].rate
+
+    async def acquire(self, group: str | None) -> None:
+        """Wait for a permit to send a request.
+
+        Args:
+            group: The group of the request, as returned by get_group
+
+        """
+        if group is None:
+            return
+        wait = self._buckets[group].reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def try_acquire(self, group: str | None) -> bool:
+        """Take a permit to send a request if one is available, without waiting.
+
+        Args:
+            group: The group of the request, as returned by get_group
+
+        Returns:
+            True if the request may be sent now
+
+        """
+        if group is None:
+            return True
+        return self._buckets[group].try_reserve()
+
+    def update(self, group: str | None, status: int, headers: Mapping[str, str]) -> None:
+        """Adapt the rate of a group to a response.
+
+        Args:
+            group: The group of the request, as returned by get_group
+            status: The status of the response
+            headers: The headers of the response
+
+        """
+        if group is None:
+            return
+        bucket = self._buckets[group]
+
+        if status == 429:
+            bucket.set_rate(bucket.rate * self.backoff_factor)
+            retry_after = parse_retry_after(headers.get("Retry-After"))
+            if retry_after:
+                bucket.pause(retry_after)
+        elif bucket.rate < bucket.max_rate:
+            bucket.set_rate(bucket.rate + bucket.max_rate * self.recovery_step)
+
+        remaining = _get_number(headers, "X-RateLimit-Remaining", "RateLimit-Remaining")
+        reset = _get_number(headers, "X-RateLimit-Reset", "RateLimit-Reset")
+        if remaining is None or reset is None:
+            return
+        if reset > _EPOCH_THRESHOLD:
+            reset -= time.time()
+        if reset <= 0:
+            return
+        if remaining < 1:
+            bucket.pause(reset)
+        else:
+            # The quota announced by the API overrides the min_rate of the group until it resets.
+            bucket.set_quota(remaining / reset, reset)
+
+
+def _get_number(headers: Mapping[str, str], *names: str) -> float | None:
+    """Get the first of several headers that is present, as a number."""
+    for name in names:
+        value = headers.get(name)
+        if value is not None:
+            try:
+                return float(value)
+            except ValueError:
+                return None
+    return None
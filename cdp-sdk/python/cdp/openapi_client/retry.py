@@ -0,0 +1,200 @@
+import random
+import threading
+import time
+from contextvars import ContextVar
+from email.utils import parsedate_to_datetime
+
+from pydantic import BaseModel, Field
+
+IDEMPOTENCY_KEY_HEADER = "X-Idempotency-Key"
+
+# The operations that accept an X-Idempotency-Key header, by method and path template. Only
+# their generated methods take an x_idempotency_key argument; the API does not deduplicate
+# other writes, such as transfers, user operation sends or faucet requests, by key. Update this
+# set when the client is regenerated; test_idempotent_operations_match_generated_methods fails
+# until it matches the generated *_serialize methods that take an x_idempotency_key.
+IDEMPOTENT_OPERATIONS = frozenset(
+    {
+        ("POST", "/v2/evm/accounts"),
+        ("POST", "/v2/evm/accounts/export/by-name/{name}"),
+        ("POST", "/v2/evm/accounts/import"),
+        ("PUT", "/v2/evm/accounts/{address}"),
+        ("POST", "/v2/evm/accounts/{address}/export"),
+        ("POST", "/v2/evm/accounts/{address}/send/transaction"),
+        ("POST", "/v2/evm/accounts/{address}/sign"),
+        ("POST", "/v2/evm/accounts/{address}/sign/message"),
+        ("POST", "/v2/evm/accounts/{address}/sign/transaction"),
+        ("POST", "/v2/evm/accounts/{address}/sign/typed-data"),
+        ("POST", "/v2/evm/swaps"),
+        ("POST", "/v2/policy-engine/policies"),
+        ("DELETE", "/v2/policy-engine/policies/{policyId}"),
+        ("PUT", "/v2/policy-engine/policies/{policyId}"),
+        ("POST", "/v2/solana/accounts"),
+        ("POST", "/v2/solana/accounts/export/by-name/{name}"),
+        ("POST", "/v2/solana/accounts/import"),
+        ("PUT", "/v2/solana/accounts/{address}"),
+        ("POST", "/v2/solana/accounts/{address}/export"),
+        ("POST", "/v2/solana/accounts/{address}/sign/message"),
+        ("POST", "/v2/solana/accounts/{address}/sign/transaction"),
+    }
+)
+
+# Whether the request the running task is sending is to one of the IDEMPOTENT_OPERATIONS
+accepts_idempotency_key: ContextVar[bool] = ContextVar("accepts_idempotency_key", default=False)
+
+
+class RetryPolicy(BaseModel):
+    """When and how often the CDP API client retries a request.
+
+    Retries wait with decorrelated jitter: each delay is drawn at random between base_delay and
+    three times the previous delay, capped at max_delay, so clients that failed together do not
+    retry together. A Retry-After header on a retried response sets the minimum delay.
+
+    Attributes:
+        max_retries - The maximum number of retries of a request (defaults to 3)
+        statuses - The response statuses that are retried (defaults to 429, 500, 502, 503 and 504)
+        methods - The HTTP methods that are retried (defaults to GET, HEAD and OPTIONS)
+        idempotent_methods - The HTTP methods that are retried when the request has an
+            X-Idempotency-Key header and its operation accepts one, since the API answers a
+            repeated request with the same key with the response to the first one (defaults
+            to POST, PUT, PATCH and DELETE)
+        retry_connection_errors - Whether to retry requests that fail to connect or time out
+            (defaults to True)
+        base_delay - The minimum delay in seconds between attempts (defaults to 0.5)
+        max_delay - The maximum delay in seconds between attempts (defaults to 20)
+        respect_retry_after - Whether to wait at least as long as the Retry-After header of a
+            response asks (defaults to True)
+        max_retry_after - The longest Retry-After in seconds to wait for. Responses that ask
+            for a longer wait are returned without retrying (defaults to 60)
+
+    """
+
+    max_retries: int = Field(3, ge=0, description="Maximum number of retries of a request")
+    statuses: frozenset[int] = Field(
+        frozenset({429, 500, 502, 503, 504}), description="Response statuses that are retried"
+    )
+    methods: frozenset[str] = Field(
+        frozenset({"GET", "HEAD", "OPTIONS"}), description="HTTP methods that are retried"
+    )
+    idempotent_methods: frozenset[str] = Field(
+        frozenset({"POST", "PUT", "PATCH", "DELETE"}),
+        description="HTTP methods that are retried with an idempotency key",
+    )
+    retry_connection_errors: bool = Field(True, description="Whether to retry network errors")
+    base_delay: float = Field(0.5, ge=0, description="Minimum delay between attempts")
+    max_delay: float = Field(20, ge=0, description="Maximum delay between attempts")
+    respect_retry_after: bool = Field(True, description="Whether to honor Retry-After")
+    max_retry_after: float = Field(60, ge=0, description="Longest Retry-After to wait for")
+
+    def allows(
+        self, method: str, headers: dict[str, str] | None = None, idempotent: bool = False
+    ) -> bool:
+        """Check whether a request may be retried.
+
+        Args:
+            method: The HTTP method in uppercase
+            headers: The request headers
+            idempotent: Whether the operation of the request accepts an X-Idempotency-Key
+                header, one of the IDEMPOTENT_OPERATIONS
+
+        Returns:
+            True if the request may be retried
+
+        """
+        if self.max_retries == 0:
+            return False
+        if method in self.methods:
+            return True
+        return (
+            idempotent
+            and method in self.idempotent_methods
+            and headers is not None
+            and IDEMPOTENCY_KEY_HEADER in headers
+        )
+
+    def next_delay(self, previous_delay: float | None) -> float:
+        """Draw the delay before the next attempt.
+
+        Args:
+            previous_delay: The delay before the previous retry, or None for the first retry
+
+        Returns:
+            The delay in seconds
+
+        """
+        upper = max(self.base_delay, (previous_delay or self.base_delay) * 3)
+        return min(self.max_delay, random.uniform(self.base_delay, upper))
+
+
+class RetryBudget:
+    """A budget that limits retries to a fraction of the requests that succeed.
+
+    Follows the retry throttling of gRPC: the budget starts full with max_tokens tokens, every
+    failed attempt takes one token, every successful attempt returns token_ratio tokens, and
+    retries are only made while more than half of the tokens are left. During an outage the
+    budget runs out after a few failures, so clients stop multiplying the load on the API and
+    send each request only once until requests succeed again.
+
+    A budget can be shared by several clients to throttle their retries together.
+
+    Args:
+        max_tokens: The size of the budget
+        token_ratio: The tokens returned by every successful attempt. With the default of 0.1,
+            retries add at most about 10% to the load once the budget is used up.
+
+    """
+
+    def __init__(self, max_tokens: float = 10, token_ratio: float = 0.1) -> None:
+        if max_tokens <= 0 or token_ratio <= 0:
+            raise ValueError("max_tokens and token_ratio must be positive")
+        self.max_tokens = max_tokens
+        self.token_ratio = token_ratio
+        self._tokens = max_tokens
+        self._lock = threading.Lock()
+
+    @property
+    def tokens(self) -> float:
+        """Get the tokens left in the budget."""
+        return self._tokens
+
+    def record_success(self) -> None:
+        """Return tokens to the budget after a successful attempt."""
+        with self._lock:
+            self._tokens = min(self.max_tokens, self._tokens + self.token_ratio)
+
+    def record_failure(self) -> None:
+        """Take a token from the budget after a failed attempt."""
+        with self._lock:
+            self._tokens = max(0.0, self._tokens - 1)
+
+    def can_retry(self) -> bool:
+        """Check whether the budget allows a retry.
+
+        Returns:
+            True if more than half of the tokens are left
+
+        """
+        return self._tokens > self.max_tokens / 2
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header.
+
+    Args:
+        value: The header value, either a number of seconds or an HTTP date
+
+    Returns:
+        The number of seconds to wait, or None if the header is missing or invalid
+
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
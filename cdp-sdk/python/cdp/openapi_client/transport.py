@@ -0,0 +1,577 @@
+import asyncio
+import contextlib
+import ssl
+import sys
+import weakref
+from collections.abc import AsyncGenerator, Awaitable, Callable
+from urllib.parse import urlparse
+
+import aiohttp
+from aiohttp.tcp_helpers import tcp_nodelay
+from pydantic import BaseModel, Field
+
+from cdp.openapi_client import rest
+from cdp.openapi_client.codec import JsonCodec
+from cdp.openapi_client.hedging import Hedger
+from cdp.openapi_client.rate_limit import RateLimiter
+from cdp.openapi_client.retry import (
+    RetryBudget,
+    RetryPolicy,
+    accepts_idempotency_key,
+    parse_retry_after,
+)
+
+# Requests with these methods use the read timeouts, all others use the write timeouts.
+READ_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+# Requests with these methods carry a body.
+BODY_METHODS = frozenset({"POST", "PUT", "PATCH", "OPTIONS", "DELETE"})
+
+
+class TimeoutConfig(BaseModel):
+    """Timeouts in seconds for one class of requests. Each retry attempt gets its own timeouts.
+
+    Attributes:
+        total - The maximum duration of a request, from acquiring a connection to reading the
+            response, or None for no limit (defaults to 300)
+        connect - The maximum time to acquire a connection, including waiting for a free
+            connection from the pool, or None for no limit
+        sock_connect - The maximum time to connect to the host, or None for no limit
+        sock_read - The maximum time between two reads from the host, or None for no limit
+
+    """
+
+    total: float | None = Field(300, description="Maximum duration of a request")
+    connect: float | None = Field(None, description="Maximum time to acquire a connection")
+    sock_connect: float | None = Field(None, description="Maximum time to connect to the host")
+    sock_read: float | None = Field(None, description="Maximum time between two reads")
+
+    def to_client_timeout(self) -> aiohttp.ClientTimeout:
+        """Convert the timeouts to an aiohttp ClientTimeout.
+
+        Returns:
+            The aiohttp ClientTimeout
+
+        """
+        return aiohttp.ClientTimeout(
+            total=self.total,
+            connect=self.connect,
+            sock_connect=self.sock_connect,
+            sock_read=self.sock_read,
+        )
+
+
+class TransportConfig(BaseModel):
+    """Connection and timeout settings for the HTTP transport of a CdpClient.
+
+    The defaults match the settings the generated client uses.
+
+    Attributes:
+        limit - The maximum number of simultaneous connections (defaults to 100)
+        limit_per_host - The maximum number of simultaneous connections to one host, or 0 for
+            no per-host limit (defaults to 0)
+        keepalive_timeout - The number of seconds an idle connection is kept open for reuse
+            (defaults to 15)
+        dns_cache_ttl - The number of seconds resolved addresses are cached, or None to cache
+            them forever (defaults to 10)
+        tcp_nodelay - Whether to disable Nagle's algorithm on new connections (defaults to True)
+        happy_eyeballs_delay - The number of seconds to wait for a connection attempt before
+            trying the next address in parallel (RFC 8305), or None to try addresses one after
+            the other (defaults to 0.25)
+        interleave - The number of addresses of the first address family to try before
+            switching to the other family, or None for the default of the event loop
+        read_timeout - The timeouts of GET, HEAD and OPTIONS requests
+        write_timeout - The timeouts of all other requests
+
+    """
+
+    limit: int = Field(100, description="Maximum number of simultaneous connections")
+    limit_per_host: int = Field(0, description="Maximum number of connections to one host")
+    keepalive_timeout: float = Field(15, description="Idle time before a connection is closed")
+    dns_cache_ttl: int | None = Field(10, description="Lifetime of resolved addresses")
+    tcp_nodelay: bool = Field(True, description="Whether to disable Nagle's algorithm")
+    happy_eyeballs_delay: float | None = Field(0.25, description="Happy eyeballs delay")
+    interleave: int | None = Field(None, description="Happy eyeballs address interleaving")
+    read_timeout: TimeoutConfig = Field(
+        default_factory=TimeoutConfig, description="Timeouts of read requests"
+    )
+    write_timeout: TimeoutConfig = Field(
+        default_factory=TimeoutConfig, description="Timeouts of write requests"
+    )
+
+    def get_timeout(self, method: str) -> aiohttp.ClientTimeout:
+        """Get the timeouts for a request.
+
+        Args:
+            method: The HTTP method of the request in uppercase
+
+        Returns:
+            The aiohttp ClientTimeout for the request
+
+        """
+        timeout = self.read_timeout if method in READ_METHODS else self.write_timeout
+        return timeout.to_client_timeout()
+
+    def create_connector(self, ssl_context: ssl.SSLContext) -> aiohttp.TCPConnector:
+        """Create a connector with these settings.
+
+        Args:
+            ssl_context: The SSL context of the connections
+
+        Returns:
+            The aiohttp connector
+
+        """
+        return _TCPConnector(
+            tcp_nodelay=self.tcp_nodelay,
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            keepalive_timeout=self.keepalive_timeout,
+            ttl_dns_cache=self.dns_cache_ttl,
+            happy_eyeballs_delay=self.happy_eyeballs_delay,
+            interleave=self.interleave,
+            ssl=ssl_context,
+        )
+
+
+class _TCPConnector(aiohttp.TCPConnector):
+    """A TCPConnector that can leave Nagle's algorithm enabled on its connections.
+
+    aiohttp 3.11 has no public hook to change the options of a connection's socket: the
+    socket_factory argument only arrives in 3.12, and connection trace signals do not carry
+    the connection. This overrides the private _create_connection instead, which is safe
+    because aiohttp is pinned to the version the test suite checks this override against.
+    Switch to socket_factory when the pin moves to 3.12 or later.
+    """
+
+    def __init__(self, tcp_nodelay: bool = True, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self._tcp_nodelay = tcp_nodelay
+
+    async def _create_connection(self, *args, **kwargs):
+        protocol = await super()._create_connection(*args, **kwargs)
+        # aiohttp always enables TCP_NODELAY when a connection is made.
+        if not self._tcp_nodelay:
+            tcp_nodelay(protocol.transport, False)
+        return protocol
+
+
+class TransportRegistry:
+    """A pool of aiohttp sessions that CdpClient instances can share.
+
+    By default every CdpClient creates its own aiohttp session, so a service that creates one
+    client per API key opens a separate connection pool, and separate TLS handshakes, per
+    client. Clients created with the same registry instead share one session per host and
+    event loop and reuse each other's keep-alive connections. Credentials stay per client,
+    since authentication headers are added to every request.
+
+    The registry owns the sessions and keeps track of the clients that use them on each event
+    loop. Closing the last of those clients closes the sessions on that loop, and ``close``
+    closes them right away. Sessions that are still open when their event loop shuts down,
+    e.g. at the end of asyncio.run(), are closed then.
+
+    Args:
+        config: The connection settings of the shared sessions. The connection limits apply to
+            each host, shared by all clients on an event loop. Timeouts are set per client.
+
+    """
+
+    def __init__(self, config: TransportConfig | None = None) -> None:
+        self.config = config or TransportConfig()
+        # Sessions are bound to the event loop they were created on, and keep it alive, so they
+        # are keyed by the id of the loop and dropped once it is closed.
+        self._sessions: dict[int, _LoopSessions] = {}
+
+    def get_session(
+        self, host: str, ssl_context: ssl.SSLContext, client: object | None = None
+    ) -> aiohttp.ClientSession:
+        """Get the session for a host on the running event loop, creating it if needed.
+
+        Args:
+            host: The scheme and network location of the host, e.g. https://api.cdp.coinbase.com
+            ssl_context: The SSL context for a new session. A session that already exists for
+                the host keeps the SSL context it was created with.
+            client: Optional client that uses the session, until it calls ``release``
+
+        Returns:
+            The shared session
+
+        """
+        loop = asyncio.get_running_loop()
+        loop_sessions = self._sessions.get(id(loop))
+        if loop_sessions is None:
+            self._drop_closed_loops()
+            loop_sessions = self._sessions[id(loop)] = _LoopSessions(loop)
+        if client is not None:
+            loop_sessions.clients.add(client)
+        sessions = loop_sessions.sessions
+        session = sessions.get(host)
+        if session is None or session.closed:
+            session = aiohttp.ClientSession(
+                connector=self.config.create_connector(ssl_context), trust_env=True
+            )
+            sessions[host] = session
+        return session
+
+    async def release(self, client: object) -> None:
+        """Stop tracking a client on the running event loop.
+
+        Closes the sessions on the loop once no other client uses them.
+
+        Args:
+            client: A client that was passed to get_session
+
+        """
+        loop_sessions = self._sessions.get(id(asyncio.get_running_loop()))
+        if loop_sessions is None:
+            return
+        loop_sessions.clients.discard(client)
+        if not loop_sessions.clients:
+            await self.close()
+
+    async def close(self) -> None:
+        """Close the sessions that were created on the running event loop."""
+        loop_sessions = self._sessions.pop(id(asyncio.get_running_loop()), None)
+        if loop_sessions is not None:
+            await loop_sessions.close()
+
+    def _drop_closed_loops(self) -> None:
+        for key, loop_sessions in list(self._sessions.items()):
+            if loop_sessions.loop.is_closed():
+                del self._sessions[key]
+
+
+class _LoopSessions:
+    """The sessions of a TransportRegistry on one event loop.
+
+    The sessions are closed when the loop shuts down its asynchronous generators, which
+    asyncio.run() does before it closes the loop, so sessions are not left open on a loop that
+    can no longer close them.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        self.loop = loop
+        self.sessions: dict[str, aiohttp.ClientSession] = {}
+        # The clients that use the sessions, held weakly so that clients that are never closed
+        # do not keep the sessions open until the loop shuts down.
+        self.clients: weakref.WeakSet = weakref.WeakSet()
+        # Starting the generator on the running loop registers it with the loop, unless the loop
+        # does not keep track of asynchronous generators, e.g. when patched by nest_asyncio.
+        # The first asend() runs the generator up to its yield without awaiting anything, so
+        # driving that coroutine by hand finishes it in one send(), which raises StopIteration
+        # with the yielded value. That lets __init__ start the generator without being async.
+        self._closer = None
+        if sys.get_asyncgen_hooks().firstiter is not None:
+            self._closer = self._close_on_shutdown()
+            with contextlib.suppress(StopIteration):
+                self._closer.asend(None).send(None)
+
+    async def _close_on_shutdown(self) -> AsyncGenerator[None, None]:
+        try:
+            yield
+        finally:
+            await self.close()
+
+    async def close(self) -> None:
+        """Close the sessions."""
+        for session in self.sessions.values():
+            await session.close()
+
+
+_default_registry: TransportRegistry | None = None
+
+
+def get_default_transport_registry() -> TransportRegistry:
+    """Get the process-wide transport registry, creating it on first use.
+
+    Returns:
+        The process-wide TransportRegistry
+
+    """
+    global _default_registry
+    if _default_registry is None:
+        _default_registry = TransportRegistry()
+    return _default_registry
+
+
+class CdpRESTClientObject:
+    """Wraps a generated REST client to make its connections, timeouts and retries configurable.
+
+    Sends requests through the wrapped client's own session, or through a session owned by a
+    TransportRegistry if one is given. Requests without an explicit timeout get the read or
+    write timeouts of the transport config, requests wait for a permit from the rate limiter if
+    one is given, slow reads are hedged if a hedger is given, and failed requests are retried
+    according to the retry policy, within the limits of the retry budget. Wrapping reuses the
+    SSL context of the generated client, which is expensive to create.
+    """
+
+    def __init__(
+        self,
+        rest_client: rest.RESTClientObject,
+        configuration,
+        transport_config: TransportConfig | None = None,
+        registry: TransportRegistry | None = None,
+        retry_policy: RetryPolicy | None = None,
+        retry_budget: RetryBudget | None = None,
+        sign_headers: Callable[[str, str, dict | None], Awaitable[dict[str, str]]] | None = None,
+        rate_limiter: RateLimiter | None = None,
+        hedger: Hedger | None = None,
+        json_codec: JsonCodec | None = None,
+    ) -> None:
+        """Initialize the REST client.
+
+        Args:
+            rest_client: The generated REST client to send requests with
+            configuration: The client configuration
+            transport_config: The connection and timeout settings. Connection settings are
+                ignored when a registry is given.
+            registry: Optional registry to take shared sessions from
+            retry_policy: When and how often to retry requests. Defaults to RetryPolicy().
+            retry_budget: The budget that limits retries. Defaults to a budget of this client.
+            sign_headers: Optional coroutine function that signs the method, URL and body of
+                a request again before it is retried, so retries do not reuse single-use or
+                expired tokens. Returns the authentication headers.
+            rate_limiter: Optional rate limiter to pace requests with. Every attempt of a
+                request waits for its own permit.
+            hedger: Optional hedger that sends a second copy of slow reads. Every attempt of
+                a request is hedged separately.
+            json_codec: Optional codec to encode JSON request bodies with, instead of the
+                json module of the generated client.
+
+        """
+        self.rest_client = rest_client
+        # Retries are made here, so the generated client must not add its own.
+        self.rest_client.retries = None
+        self.transport_config = transport_config or TransportConfig(
+            limit=configuration.connection_pool_maxsize
+        )
+        self.registry = registry
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.retry_budget = retry_budget or RetryBudget()
+        self.sign_headers = sign_headers
+        self.rate_limiter = rate_limiter
+        self.hedger = hedger
+        self.json_codec = json_codec
+        parsed_host = urlparse(configuration.host)
+        self._origin = f"{parsed_host.scheme}://{parsed_host.netloc}"
+        self._base_path = parsed_host.path.rstrip("/")
+
+    async def request(
+        self, method, url, headers=None, body=None, post_params=None, _request_timeout=None
+    ) -> rest.RESTResponse:
+        """Execute a request with the configured session, timeouts and retries."""
+        method = method.upper()
+        if _request_timeout is None:
+            _request_timeout = self.transport_config.get_timeout(method)
+
+        policy = self.retry_policy
+        budget = self.retry_budget
+        retryable = policy.allows(method, headers, accepts_idempotency_key.get())
+        rate_limit_group = None
+        hedge_pattern = None
+        if self.rate_limiter is not None or self.hedger is not None:
+            path = urlparse(url).path
+            if path.startswith(self._base_path):
+                path = path[len(self._base_path) :]
+            if self.rate_limiter is not None:
+                rate_limit_group = self.rate_limiter.get_group(method, path)
+            if self.hedger is not None:
+                hedge_pattern = self.hedger.get_pattern(method, path)
+        retries = 0
+        delay = None
+        while True:
+            retry_after = None
+            try:
+                if hedge_pattern is None:
+                    response = await self._send(
+                        method, url, headers, body, post_params, _request_timeout, rate_limit_group
+                    )
+                else:
+                    response = await self._send_hedged(
+                        hedge_pattern,
+                        method,
+                        url,
+                        headers,
+                        body,
+                        post_params,
+                        _request_timeout,
+                        rate_limit_group,
+                    )
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                budget.record_failure()
+                if not (
+                    retryable
+                    and policy.retry_connection_errors
+                    and retries < policy.max_retries
+                    and budget.can_retry()
+                ):
+                    raise
+            else:
+                if response.status not in policy.statuses:
+                    budget.record_success()
+                    return response
+                budget.record_failure()
+                if not (retryable and retries < policy.max_retries and budget.can_retry()):
+                    return response
+                if policy.respect_retry_after:
+                    retry_after = parse_retry_after(response.getheader("Retry-After"))
+                    if retry_after is not None and retry_after > policy.max_retry_after:
+                        return response
+                # Reading the body returns the connection to the pool for the next attempt.
+                try:
+                    await response.read()
+                except aiohttp.ClientError:
+                    pass
+
+            retries += 1
+            delay = policy.next_delay(delay)
+            await asyncio.sleep(max(delay, retry_after or 0))
+            if self.sign_headers is not None:
+                headers = {**(headers or {}), **await self.sign_headers(method, url, body)}
+
+    async def _send_hedged(
+        self, pattern, method, url, headers, body, post_params, _request_timeout, rate_limit_group
+    ) -> rest.RESTResponse:
+        """Send one attempt of a request, and hedges of it while it is not answered."""
+        hedger = self.hedger
+        hedger.record_request(pattern)
+        loop = asyncio.get_running_loop()
+        # The start time of every attempt in flight, and whether it is a hedge
+        attempts = {
+            asyncio.ensure_future(
+                self._send(
+                    method, url, headers, body, post_params, _request_timeout, rate_limit_group
+                )
+            ): (loop.time(), False)
+        }
+        hedges = 0
+        try:
+            while True:
+                delay = hedger.get_delay(pattern) if hedges < hedger.config.max_hedges else None
+                done, _ = await asyncio.wait(
+                    attempts, timeout=delay, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    hedges += 1
+                    # Hedges only use spare capacity, they never wait for it.
+                    sent = self.retry_budget.can_retry() and (
+                        rate_limit_group is None or self.rate_limiter.try_acquire(rate_limit_group)
+                    )
+                    hedger.record_hedge(pattern, sent)
+                    if sent:
+                        hedge = asyncio.ensure_future(
+                            self._send_hedge(
+                                method,
+                                url,
+                                headers,
+                                body,
+                                post_params,
+                                _request_timeout,
+                                rate_limit_group,
+                            )
+                        )
+                        attempts[hedge] = (loop.time(), True)
+                    continue
+
+                winner = next((task for task in done if task.exception() is None), None)
+                if winner is not None:
+                    started, is_hedge = attempts.pop(winner)
+                    hedger.record_response(pattern, loop.time() - started, is_hedge)
+                    return winner.result()
+                for task in done:
+                    error = task.exception()
+                    del attempts[task]
+                # Wait for the other attempts before giving up.
+                if not attempts:
+                    raise error
+        finally:
+            for task in attempts:
+                task.cancel()
+                task.add_done_callback(_release_response)
+
+    async def _send_hedge(
+        self, method, url, headers, body, post_params, _request_timeout, rate_limit_group
+    ) -> rest.RESTResponse:
+        """Send a hedge of a request, whose rate limit permit has been taken."""
+        if self.sign_headers is not None:
+            headers = {**(headers or {}), **await self.sign_headers(method, url, body)}
+        return await self._send(
+            method, url, headers, body, post_params, _request_timeout, rate_limit_group, False
+        )
+
+    async def _send(
+        self,
+        method,
+        url,
+        headers,
+        body,
+        post_params,
+        _request_timeout,
+        rate_limit_group=None,
+        acquire=True,
+    ) -> rest.RESTResponse:
+        """Send one attempt of a request through the configured session."""
+        if rate_limit_group is not None and acquire:
+            await self.rate_limiter.acquire(rate_limit_group)
+
+        rest_client = self.rest_client
+        if self.registry is not None:
+            session = self.registry.get_session(self._origin, rest_client.ssl_context, self)
+            if session is not rest_client.pool_manager:
+                rest_client.pool_manager = session
+                rest_client.retry_client = None
+        elif rest_client.pool_manager is None:
+            rest_client.pool_manager = aiohttp.ClientSession(
+                connector=self.transport_config.create_connector(rest_client.ssl_context),
+                trust_env=True,
+            )
+        if self.json_codec is not None and body is not None and _is_json_body(method, headers):
+            response = await self._send_json(method, url, headers, body, _request_timeout)
+        else:
+            response = await rest_client.request(
+                method, url, headers, body, post_params, _request_timeout
+            )
+        if rate_limit_group is not None:
+            self.rate_limiter.update(rate_limit_group, response.status, response.getheaders())
+        return response
+
+    async def _send_json(self, method, url, headers, body, _request_timeout) -> rest.RESTResponse:
+        """Send a request with a JSON body encoded by the codec, like the generated client."""
+        rest_client = self.rest_client
+        args = {
+            "method": method,
+            "url": url,
+            "timeout": _request_timeout or 5 * 60,
+            "headers": {"Content-Type": "application/json", **(headers or {})},
+            "data": self.json_codec.dumps(body),
+        }
+        if rest_client.proxy:
+            args["proxy"] = rest_client.proxy
+        if rest_client.proxy_headers:
+            args["proxy_headers"] = rest_client.proxy_headers
+        return rest.RESTResponse(await rest_client.pool_manager.request(**args))
+
+    async def close(self) -> None:
+        """Close the session, or release it if it is shared through a registry."""
+        if self.registry is None:
+            await self.rest_client.close()
+        else:
+            await self.registry.release(self)
+        self.rest_client.pool_manager = None
+        self.rest_client.retry_client = None
+
+
+def _is_json_body(method: str, headers: dict | None) -> bool:
+    """Check whether the generated client would send the body of a request as JSON."""
+    if method not in BODY_METHODS:
+        return False
+    content_type = (headers or {}).get("Content-Type", "application/json")
+    return "json" in content_type.lower()
+
+
+def _release_response(task: asyncio.Future) -> None:
+    """Return the connection of an attempt whose response is not used to the pool."""
+    if task.cancelled():
+        return
+    if task.exception() is None:
+        task.result().response.release()
@@ -1,4 +1,5 @@
 from cdp.api_clients import ApiClients
+from cdp.cache import POLICY, ReadCache
 from cdp.openapi_client.models.create_policy_request import CreatePolicyRequest
 from cdp.openapi_client.models.update_policy_request import UpdatePolicyRequest
 from cdp.policies.request_transformer import map_request_rules_to_openapi_format
@@ -15,8 +16,9 @@ from cdp.policies.types import (
 class PoliciesClient:
     """Client for managing policies."""
 
-    def __init__(self, api_clients: ApiClients):
+    def __init__(self, api_clients: ApiClients, read_cache: ReadCache | None = None):
         self.api_clients = api_clients
+        self.read_cache = read_cache or ReadCache(enabled=False)
 
     async def create_policy(
         self,
@@ -69,14 +71,18 @@ class PoliciesClient:
             Policy: The updated policy.
 
         """
-        openapi_policy = await self.api_clients.policies.update_policy(
-            policy_id=id,
-            update_policy_request=UpdatePolicyRequest(
-                description=policy.description,
-                rules=map_request_rules_to_openapi_format(policy.rules),
-            ),
-            x_idempotency_key=idempotency_key,
-        )
+        try:
+            openapi_policy = await self.api_clients.policies.update_policy(
+                policy_id=id,
+                update_policy_request=UpdatePolicyRequest(
+                    description=policy.description,
+                    rules=map_request_rules_to_openapi_format(policy.rules),
+                ),
+                x_idempotency_key=idempotency_key,
+            )
+        finally:
+            # The update may have been applied even if the response was lost.
+            self.read_cache.invalidate(POLICY, id)
         return Policy(
             id=openapi_policy.id,
             description=openapi_policy.description,
@@ -100,10 +106,13 @@ class PoliciesClient:
             idempotency_key (str | None, optional): The idempotency key. Defaults to None.
 
         """
-        return await self.api_clients.policies.delete_policy(
-            policy_id=id,
-            x_idempotency_key=idempotency_key,
-        )
+        try:
+            return await self.api_clients.policies.delete_policy(
+                policy_id=id,
+                x_idempotency_key=idempotency_key,
+            )
+        finally:
+            self.read_cache.invalidate(POLICY, id)
 
     async def get_policy_by_id(self, id: str) -> Policy:
         """Retrieve a policy by its unique identifier.
@@ -115,8 +124,10 @@ class PoliciesClient:
             Policy: The requested policy.
 
         """
-        openapi_policy = await self.api_clients.policies.get_policy_by_id(
-            policy_id=id,
+        openapi_policy = await self.read_cache.fetch(
+            POLICY,
+            id,
+            lambda: self.api_clients.policies.get_policy_by_id(policy_id=id),
         )
         return Policy(
             id=openapi_policy.id,
@@ -10,6 +10,7 @@ from cdp.actions.solana.sign_message import sign_message
 from cdp.actions.solana.sign_transaction import sign_transaction
 from cdp.analytics import wrap_class_with_error_tracking
 from cdp.api_clients import ApiClients
+from cdp.cache import SOLANA_ACCOUNT, ReadCache
 from cdp.constants import ImportAccountPublicRSAKey
 from cdp.export import (
     decrypt_with_private_key,
@@ -39,8 +40,9 @@ from cdp.update_account_types import UpdateAccountOptions
 class SolanaClient:
     """The SolanaClient class is responsible for CDP API calls for Solana."""
 
-    def __init__(self, api_clients: ApiClients):
+    def __init__(self, api_clients: ApiClients, read_cache: ReadCache | None = None):
         self.api_clients = api_clients
+        self.read_cache = read_cache or ReadCache(enabled=False)
         wrap_class_with_error_tracking(SolanaAccount)
 
     async def create_account(
@@ -67,6 +69,7 @@ class SolanaClient:
                 account_policy=account_policy,
             ),
         )
+        self.read_cache.invalidate(SOLANA_ACCOUNT, name=name)
 
         return SolanaAccount(
             solana_account_model=response,
@@ -127,6 +130,7 @@ class SolanaClient:
                 ),
                 x_idempotency_key=idempotency_key,
             )
+            self.read_cache.invalidate(SOLANA_ACCOUNT, name=name)
             return SolanaAccount(solana_account, self.api_clients)
         except ApiError as e:
             raise e
@@ -197,9 +201,18 @@ class SolanaClient:
 
         """
         if address:
-            response = await self.api_clients.solana_accounts.get_solana_account(address)
+            response = await self.read_cache.fetch(
+                SOLANA_ACCOUNT,
+                address,
+                lambda: self.api_clients.solana_accounts.get_solana_account(address),
+            )
         elif name:
-            response = await self.api_clients.solana_accounts.get_solana_account_by_name(name)
+            response = await self.read_cache.fetch_by_name(
+                SOLANA_ACCOUNT,
+                name,
+                lambda: self.api_clients.solana_accounts.get_solana_account_by_name(name),
+                lambda account: account.address,
+            )
         else:
             raise ValueError("Either address or name must be provided")
 
@@ -345,13 +358,17 @@ class SolanaClient:
             SolanaAccount: The updated Solana account.
 
         """
-        response = await self.api_clients.solana_accounts.update_solana_account(
-            address=address,
-            update_solana_account_request=UpdateSolanaAccountRequest(
-                name=update.name, account_policy=update.account_policy
-            ),
-            x_idempotency_key=idempotency_key,
-        )
+        try:
+            response = await self.api_clients.solana_accounts.update_solana_account(
+                address=address,
+                update_solana_account_request=UpdateSolanaAccountRequest(
+                    name=update.name, account_policy=update.account_policy
+                ),
+                x_idempotency_key=idempotency_key,
+            )
+        finally:
+            # The update may have been applied even if the response was lost.
+            self.read_cache.invalidate(SOLANA_ACCOUNT, address, update.name)
 
         return SolanaAccount(
             solana_account_model=response,
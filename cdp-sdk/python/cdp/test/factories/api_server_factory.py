@@ -0,0 +1,63 @@
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from cdp.openapi_client.cdp_api_client import CdpApiClient
+
+
+@pytest_asyncio.fixture
+async def api_server_factory():
+    """Create and return a factory for local API servers, closed after the test.
+
+    Returns:
+        callable: An async factory that starts a server for a list of (method, path, handler)
+            routes. The server records every request it receives in its requests list, with
+            the transport of the connection it arrived on under request["transport"].
+
+    """
+    servers = []
+
+    async def _create_server(routes):
+        requests = []
+
+        @web.middleware
+        async def record(request, handler):
+            request["transport"] = request.transport
+            requests.append(request)
+            return await handler(request)
+
+        app = web.Application(middlewares=[record])
+        for method, path, handler in routes:
+            app.router.add_route(method, path, handler)
+        server = TestServer(app)
+        await server.start_server()
+        server.requests = requests
+        servers.append(server)
+        return server
+
+    yield _create_server
+
+    for server in servers:
+        await server.close()
+
+
+@pytest.fixture
+def cdp_api_client_factory(ec_private_key_factory):
+    """Create and return a factory for CdpApiClient fixtures that call a local API server.
+
+    Returns:
+        callable: A factory that creates a client for a server started by api_server_factory,
+            passing any other keyword arguments to CdpApiClient
+
+    """
+
+    def _create_client(server, api_key_id="test-key-id", **kwargs):
+        return CdpApiClient(
+            api_key_id,
+            ec_private_key_factory(),
+            base_path=str(server.make_url("/platform")),
+            **kwargs,
+        )
+
+    return _create_client
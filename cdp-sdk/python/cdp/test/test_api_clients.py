@@ -0,0 +1,33 @@
+import pytest
+from pydantic import ValidationError
+
+from cdp.api_clients import ApiClients
+from cdp.openapi_client.api.evm_accounts_api import EVMAccountsApi
+from cdp.openapi_client.cdp_api_client import CdpApiClient
+
+
+@pytest.mark.asyncio
+async def test_api_methods_validate_arguments_by_default(ec_private_key_factory):
+    """Test that API methods reject invalid arguments before sending a request."""
+    api_clients = ApiClients(CdpApiClient("test-key-id", ec_private_key_factory()))
+
+    with pytest.raises(ValidationError):
+        await api_clients.evm_accounts.get_evm_account(address=123)
+    await api_clients.close()
+
+
+@pytest.mark.asyncio
+async def test_skip_call_validation(ec_private_key_factory):
+    """Test that API methods call the undecorated functions when validation is disabled."""
+    api_clients = ApiClients(
+        CdpApiClient("test-key-id", ec_private_key_factory()), validate_calls=False
+    )
+    api = api_clients.evm_accounts
+
+    assert api.get_evm_account.__func__ is EVMAccountsApi.get_evm_account.raw_function
+    assert (
+        api.create_evm_account_with_http_info.__func__
+        is EVMAccountsApi.create_evm_account_with_http_info.raw_function
+    )
+    assert api.get_evm_account.__self__ is api
+    await api_clients.close()
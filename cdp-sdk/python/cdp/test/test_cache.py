@@ -0,0 +1,155 @@
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from cdp.cache import (
+    EVM_ACCOUNT,
+    DiskCacheBackend,
+    MemoryCacheBackend,
+    ReadCache,
+)
+from cdp.evm_client import EvmClient
+from cdp.policies.types import UpdatePolicyOptions
+from cdp.policies_client import PoliciesClient
+from cdp.solana_client import SolanaClient
+from cdp.update_account_types import UpdateAccountOptions
+
+ADDRESS = "0x1234567890123456789012345678901234567890"
+
+
+def test_memory_backend_evicts_least_recently_used():
+    """Test that a full memory backend drops the least recently used entry."""
+    backend = MemoryCacheBackend(max_entries=2)
+    backend.set("a", "1", 60)
+    backend.set("b", "2", 60)
+    backend.get("a")
+    backend.set("c", "3", 60)
+
+    assert backend.get("a") == "1"
+    assert backend.get("b") is None
+    assert backend.get("c") == "3"
+
+
+def test_memory_backend_expires_entries():
+    """Test that entries are gone once their TTL has passed."""
+    backend = MemoryCacheBackend()
+    with patch("cdp.cache.time.monotonic", return_value=100):
+        backend.set("a", "1", 10)
+    with patch("cdp.cache.time.monotonic", return_value=109):
+        assert backend.get("a") == "1"
+    with patch("cdp.cache.time.monotonic", return_value=110):
+        assert backend.get("a") is None
+
+
+def test_disk_backend_round_trip(tmp_path, openapi_policy_model_factory):
+    """Test that the disk backend keeps API models across instances."""
+    policy = openapi_policy_model_factory()
+    backend = DiskCacheBackend(tmp_path / "cache.db")
+    backend.set("policy", policy, 60)
+    backend.set("pointer", ADDRESS, 60)
+    backend.set("expired", ADDRESS, -1)
+    backend.close()
+
+    backend = DiskCacheBackend(tmp_path / "cache.db")
+    assert backend.get("policy") == policy
+    assert backend.get("pointer") == ADDRESS
+    assert backend.get("expired") is None
+    with pytest.raises(TypeError):
+        backend.set("other", {"address": ADDRESS}, 60)
+    backend.clear()
+    assert backend.get("policy") is None
+    backend.close()
+
+
+@pytest.mark.asyncio
+async def test_fetch_caches_by_id_and_name(server_account_model_factory):
+    """Test that lookups by ID and by name share the cached resource."""
+    cache = ReadCache()
+    account = server_account_model_factory()
+    load = AsyncMock(return_value=account)
+
+    assert (
+        await cache.fetch_by_name(EVM_ACCOUNT, account.name, load, lambda a: a.address) is account
+    )
+    assert await cache.fetch(EVM_ACCOUNT, account.address, load) is account
+    assert (
+        await cache.fetch_by_name(EVM_ACCOUNT, account.name, load, lambda a: a.address) is account
+    )
+    assert load.await_count == 1
+
+    # Invalidating the ID also invalidates the name.
+    cache.invalidate(EVM_ACCOUNT, account.address)
+    await cache.fetch_by_name(EVM_ACCOUNT, account.name, load, lambda a: a.address)
+    assert load.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_ttl_and_enabled_settings(server_account_model_factory):
+    """Test that a TTL of 0 or a disabled cache passes lookups through."""
+    load = AsyncMock(return_value=server_account_model_factory())
+
+    for cache in [ReadCache(ttls={EVM_ACCOUNT: 0}), ReadCache(enabled=False)]:
+        await cache.fetch(EVM_ACCOUNT, ADDRESS, load)
+        await cache.fetch(EVM_ACCOUNT, ADDRESS, load)
+    assert load.await_count == 4
+
+
+@pytest.mark.asyncio
+async def test_evm_client_invalidates_on_update(server_account_model_factory):
+    """Test that EVM account lookups are cached until the account is updated."""
+    mock_api_clients = AsyncMock()
+    account = server_account_model_factory(address=ADDRESS, name="old")
+    renamed = server_account_model_factory(address=ADDRESS, name="new")
+    mock_api_clients.evm_accounts.get_evm_account = AsyncMock(return_value=account)
+    mock_api_clients.evm_accounts.get_evm_account_by_name = AsyncMock(return_value=account)
+    mock_api_clients.evm_accounts.update_evm_account = AsyncMock(return_value=renamed)
+    client = EvmClient(api_clients=mock_api_clients, read_cache=ReadCache())
+
+    await client.get_account(name="old")
+    await client.get_account(address=ADDRESS.upper().replace("0X", "0x"))
+    mock_api_clients.evm_accounts.get_evm_account.assert_not_awaited()
+
+    await client.update_account(ADDRESS, UpdateAccountOptions(name="new"))
+    mock_api_clients.evm_accounts.get_evm_account.return_value = renamed
+    result = await client.get_account(address=ADDRESS)
+    assert result.name == "new"
+    # The old name no longer resolves to the renamed account from the cache.
+    await client.get_account(name="old")
+    assert mock_api_clients.evm_accounts.get_evm_account_by_name.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_solana_client_invalidates_on_create():
+    """Test that creating a Solana account invalidates lookups by its name."""
+    mock_api_clients = AsyncMock()
+    cache = ReadCache()
+    client = SolanaClient(api_clients=mock_api_clients, read_cache=cache)
+    cache.backend.set("solana_account:name:test", "address", 60)
+
+    await client.create_account(name="test")
+
+    assert cache.backend.get("solana_account:name:test") is None
+
+
+@pytest.mark.asyncio
+async def test_policies_client_invalidates_on_update_and_delete(openapi_policy_model_factory):
+    """Test that policy lookups are cached until the policy is updated or deleted."""
+    mock_api_clients = AsyncMock()
+    policy = openapi_policy_model_factory()
+    mock_api_clients.policies.get_policy_by_id = AsyncMock(return_value=policy)
+    mock_api_clients.policies.update_policy = AsyncMock(side_effect=TimeoutError())
+    client = PoliciesClient(api_clients=mock_api_clients, read_cache=ReadCache())
+
+    await client.get_policy_by_id(policy.id)
+    await client.get_policy_by_id(policy.id)
+    assert mock_api_clients.policies.get_policy_by_id.await_count == 1
+
+    # A failed update may still have been applied.
+    with pytest.raises(TimeoutError):
+        await client.update_policy(policy.id, UpdatePolicyOptions(rules=[]))
+    await client.get_policy_by_id(policy.id)
+    assert mock_api_clients.policies.get_policy_by_id.await_count == 2
+
+    await client.delete_policy(policy.id)
+    await client.get_policy_by_id(policy.id)
+    assert mock_api_clients.policies.get_policy_by_id.await_count == 3
@@ -0,0 +1,161 @@
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from unittest.mock import patch
+
+import jwt as jwt_lib
+import pytest
+
+from cdp.openapi_client.cdp_api_client import CdpApiClient
+
+
+@pytest.mark.asyncio
+async def test_get_request_auth_headers_on_event_loop(
+    ec_private_key_factory, wallet_secret_factory
+):
+    """Test that requests are signed on the event loop without a signing executor."""
+    client = CdpApiClient("test-key-id", ec_private_key_factory(), wallet_secret_factory())
+
+    headers = await client._get_request_auth_headers(
+        "POST", "api.cdp.coinbase.com", "/platform/v2/evm/accounts", {"name": "test"}
+    )
+
+    decoded = jwt_lib.decode(
+        headers["Authorization"].removeprefix("Bearer "), options={"verify_signature": False}
+    )
+    assert decoded["uris"] == ["POST api.cdp.coinbase.com/platform/v2/evm/accounts"]
+    assert "X-Wallet-Auth" in headers
+    assert "source=sdk" in headers["Correlation-Context"]
+
+
+@pytest.mark.asyncio
+async def test_get_request_auth_headers_in_thread_pool(ec_private_key_factory):
+    """Test that requests are signed in the configured thread pool."""
+    signing_threads = []
+
+    def _record_thread(*args, **kwargs):
+        signing_threads.append(threading.current_thread())
+        return {"Authorization": "Bearer test.token"}
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        client = CdpApiClient("test-key-id", ec_private_key_factory(), signing_executor=executor)
+        with patch(
+            "cdp.openapi_client.cdp_api_client._get_auth_headers", side_effect=_record_thread
+        ) as mock_get_auth_headers:
+            headers = await client._get_request_auth_headers(
+                "GET", "api.cdp.coinbase.com", "/platform/v2/evm/accounts", None
+            )
+
+    assert headers == {"Authorization": "Bearer test.token"}
+    assert mock_get_auth_headers.call_args[0][0] is client._jwt_signer
+    assert signing_threads[0] is not threading.main_thread()
+
+
+@pytest.mark.asyncio
+async def test_get_request_auth_headers_in_process_pool(
+    ec_private_key_factory, wallet_secret_factory
+):
+    """Test that requests are signed in the configured process pool."""
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        client = CdpApiClient(
+            "test-key-id",
+            ec_private_key_factory(),
+            wallet_secret_factory(),
+            signing_executor=executor,
+        )
+        headers = await client._get_request_auth_headers(
+            "DELETE", "api.cdp.coinbase.com", "/platform/v2/evm/accounts/0x123", None
+        )
+
+    decoded = jwt_lib.decode(
+        headers["Authorization"].removeprefix("Bearer "), options={"verify_signature": False}
+    )
+    assert decoded["sub"] == "test-key-id"
+    assert "X-Wallet-Auth" in headers
+
+
+@pytest.mark.asyncio
+async def test_get_request_auth_headers_executor_propagates_errors():
+    """Test that signing errors raised in the signing executor reach the caller."""
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        client = CdpApiClient("test-key-id", "invalid-key", signing_executor=executor)
+        with pytest.raises(ValueError, match="Failed to generate JWT"):
+            await client._get_request_auth_headers(
+                "GET", "api.cdp.coinbase.com", "/platform/v2/evm/accounts", None
+            )
+
+
+@pytest.mark.asyncio
+async def test_get_request_auth_headers_uses_pre_signed_jwt(ec_private_key_factory):
+    """Test that requests to hot endpoints use the JWTs signed ahead of time."""
+    client = CdpApiClient(
+        "test-key-id",
+        ec_private_key_factory(),
+        hot_endpoints=[("post", "/v2/evm/faucet")],
+        jwt_pool_size=1,
+    )
+    await client._jwt_pool.refill()
+
+    with patch.object(
+        client._jwt_signer, "generate_jwt", wraps=client._jwt_signer.generate_jwt
+    ) as mock_generate_jwt:
+        headers = await client._get_request_auth_headers(
+            "POST", "api.cdp.coinbase.com", "/platform/v2/evm/faucet", None
+        )
+        mock_generate_jwt.assert_not_called()
+    await client.close()
+
+    decoded = jwt_lib.decode(
+        headers["Authorization"].removeprefix("Bearer "), options={"verify_signature": False}
+    )
+    assert decoded["uris"] == ["POST api.cdp.coinbase.com/platform/v2/evm/faucet"]
+    assert client._jwt_pool._task is None
+
+
+@pytest.mark.asyncio
+async def test_pre_signed_jwts_bypass_the_jwt_cache(ec_private_key_factory):
+    """Test that the pool of a GET endpoint holds distinct JWTs when GET JWTs are cached."""
+    client = CdpApiClient(
+        "test-key-id",
+        ec_private_key_factory(),
+        jwt_cache_margin=30,
+        hot_endpoints=[("get", "/v2/evm/accounts")],
+        jwt_pool_size=3,
+    )
+    await client._jwt_pool.refill()
+
+    tokens = [token for token, _ in next(iter(client._jwt_pool._tokens.values()))]
+    await client.close()
+
+    assert len(tokens) == 3
+    assert len(set(tokens)) == 3
+
+
+@pytest.mark.asyncio
+async def test_correlation_context_is_resolved_once(ec_private_key_factory):
+    """Test that the Correlation-Context header is computed when the client is created."""
+    with patch(
+        "cdp.openapi_client.cdp_api_client._get_correlation_data", return_value="source=test"
+    ) as mock_get_correlation_data:
+        client = CdpApiClient("test-key-id", ec_private_key_factory(), source="test")
+        for _ in range(2):
+            headers = await client._get_request_auth_headers(
+                "GET", "api.cdp.coinbase.com", "/platform/v2/evm/accounts", None
+            )
+
+    mock_get_correlation_data.assert_called_once()
+    assert headers["Correlation-Context"] == "source=test"
+
+
+@pytest.mark.asyncio
+async def test_correlation_context_follows_source(ec_private_key_factory):
+    """Test that changing the source or source version updates the Correlation-Context header."""
+    client = CdpApiClient("test-key-id", ec_private_key_factory())
+
+    client.source = "agentkit"
+    client.source_version = "1.2.3"
+    headers = await client._get_request_auth_headers(
+        "GET", "api.cdp.coinbase.com", "/platform/v2/evm/accounts", None
+    )
+
+    assert "source=agentkit" in headers["Correlation-Context"]
+    assert "source_version=1.2.3" in headers["Correlation-Context"]
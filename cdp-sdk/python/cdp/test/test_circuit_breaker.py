@@ -0,0 +1,250 @@
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from cdp.openapi_client.api.evm_accounts_api import EVMAccountsApi
+from cdp.openapi_client.cdp_api_client import CdpApiClient
+from cdp.openapi_client.circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerConfig,
+    CircuitOpenError,
+)
+from cdp.openapi_client.errors import ApiError
+from cdp.openapi_client.retry import RetryPolicy
+
+ENDPOINT = "GET /v2/evm/accounts/{address}"
+
+
+@pytest_asyncio.fixture
+async def server(api_server_factory):
+    """Start a local server whose get account endpoint is down until it is repaired."""
+
+    async def get_account(request):
+        if server.down:
+            return web.json_response(
+                {"errorType": "service_unavailable", "errorMessage": "Down."}, status=503
+            )
+        return web.json_response(
+            {"address": request.match_info["address"], "createdAt": "2025-01-01T00:00:00Z"}
+        )
+
+    async def list_accounts(request):
+        return web.json_response({"accounts": []})
+
+    server = await api_server_factory(
+        [
+            ("GET", "/platform/v2/evm/accounts", list_accounts),
+            ("GET", "/platform/v2/evm/accounts/{address}", get_account),
+        ]
+    )
+    server.down = True
+    return server
+
+
+@pytest.fixture
+def breaker():
+    """Create a circuit breaker that opens after two failures."""
+    return CircuitBreaker(
+        CircuitBreakerConfig(failure_threshold=2, recovery_timeout=10),
+        on_state_change=MagicMock(),
+    )
+
+
+def test_circuit_opens_and_recovers(breaker):
+    """Test the transitions from closed to open, half-open and back to closed."""
+    with patch("cdp.openapi_client.circuit_breaker.time.monotonic", return_value=100):
+        breaker.before_call(ENDPOINT)
+        breaker.record(ENDPOINT, False)
+        breaker.record(ENDPOINT, False)
+        assert breaker.get_state(ENDPOINT) == "open"
+
+        with pytest.raises(CircuitOpenError) as exc_info:
+            breaker.before_call(ENDPOINT)
+        assert exc_info.value.retry_after == 10
+        assert exc_info.value.error_type == "circuit_open"
+        assert isinstance(exc_info.value, ApiError)
+
+    with patch("cdp.openapi_client.circuit_breaker.time.monotonic", return_value=110):
+        breaker.before_call(ENDPOINT)
+        assert breaker.get_state(ENDPOINT) == "half_open"
+        # Only one probe at a time
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call(ENDPOINT)
+        breaker.record(ENDPOINT, True)
+
+    assert breaker.get_state(ENDPOINT) == "closed"
+    assert [call.args for call in breaker.on_state_change.call_args_list] == [
+        (ENDPOINT, "closed", "open"),
+        (ENDPOINT, "open", "half_open"),
+        (ENDPOINT, "half_open", "closed"),
+    ]
+    metrics = breaker.get_metrics()[ENDPOINT]
+    assert metrics.state == "closed"
+    assert (metrics.successes, metrics.failures, metrics.rejections) == (1, 2, 2)
+    assert metrics.times_opened == 1
+
+
+def test_failed_probe_reopens_circuit(breaker):
+    """Test that a failed probe opens the circuit again, and a cancelled one frees its slot."""
+    with patch("cdp.openapi_client.circuit_breaker.time.monotonic", return_value=100):
+        breaker.record(ENDPOINT, False)
+        breaker.record(ENDPOINT, False)
+
+    with patch("cdp.openapi_client.circuit_breaker.time.monotonic", return_value=110):
+        breaker.before_call(ENDPOINT)
+        breaker.record(ENDPOINT, None)
+        breaker.before_call(ENDPOINT)
+        breaker.record(ENDPOINT, False)
+        assert breaker.get_state(ENDPOINT) == "open"
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call(ENDPOINT)
+
+    assert breaker.get_metrics()[ENDPOINT].times_opened == 2
+
+
+def test_successes_reset_consecutive_failures(breaker):
+    """Test that only consecutive failures open the circuit."""
+    for succeeded in [False, True, False, True]:
+        breaker.record(ENDPOINT, succeeded)
+
+    assert breaker.get_state(ENDPOINT) == "closed"
+    breaker.reset()
+    assert breaker.get_metrics() == {}
+
+
+def test_state_change_hook_errors_are_ignored():
+    """Test that a failing on_state_change hook does not break the breaker."""
+    breaker = CircuitBreaker(
+        CircuitBreakerConfig(failure_threshold=1),
+        on_state_change=MagicMock(side_effect=RuntimeError("boom")),
+    )
+
+    breaker.record(ENDPOINT, False)
+
+    assert breaker.get_state(ENDPOINT) == "open"
+
+
+def test_state_change_hook_can_use_the_breaker():
+    """Test that the on_state_change hook runs without the lock, so it can read the metrics."""
+    seen = []
+
+    def hook(endpoint, previous, state):
+        seen.append((previous, state, breaker.get_metrics()[endpoint].state))
+
+    breaker = CircuitBreaker(CircuitBreakerConfig(failure_threshold=1), on_state_change=hook)
+    # A hook called with the lock held would deadlock, so record from a thread that can be
+    # abandoned.
+    thread = threading.Thread(target=breaker.record, args=(ENDPOINT, False), daemon=True)
+    thread.start()
+    thread.join(timeout=5)
+
+    assert not thread.is_alive()
+    assert seen == [("closed", "open", "open")]
+
+
+@pytest.mark.asyncio
+async def test_client_isolates_failing_endpoint(server, breaker, cdp_api_client_factory):
+    """Test that calls to a failing endpoint fail fast, keyed by its path template."""
+    client = cdp_api_client_factory(
+        server, retry_policy=RetryPolicy(max_retries=0), circuit_breaker=breaker
+    )
+    api = EVMAccountsApi(client)
+
+    for address in ["0x" + "1" * 40, "0x" + "2" * 40]:
+        with pytest.raises(ApiError) as exc_info:
+            await api.get_evm_account(address)
+        assert exc_info.value.http_code == 503
+    with pytest.raises(CircuitOpenError):
+        await api.get_evm_account("0x" + "3" * 40)
+    accounts = await api.list_evm_accounts()
+
+    calls = [request for request in server.requests if "address" in request.match_info]
+    assert len(calls) == 2
+    assert accounts.accounts == []
+    assert breaker.get_state(ENDPOINT) == "open"
+    assert breaker.get_state("GET /v2/evm/accounts") == "closed"
+
+    # The endpoint recovers once a probe succeeds
+    server.down = False
+    with patch("cdp.openapi_client.circuit_breaker.time.monotonic", return_value=1e12):
+        account = await api.get_evm_account("0x" + "4" * 40)
+    await client.close()
+
+    assert account.address == "0x" + "4" * 40
+    assert breaker.get_state(ENDPOINT) == "closed"
+
+
+@pytest.mark.asyncio
+async def test_client_counts_network_errors(breaker, ec_private_key_factory):
+    """Test that calls that cannot reach the API count as failures."""
+    client = CdpApiClient(
+        "test-key-id",
+        ec_private_key_factory(),
+        base_path="http://127.0.0.1:1/platform",
+        retry_policy=RetryPolicy(max_retries=0),
+        circuit_breaker=breaker,
+    )
+    url = f"{client.configuration.host}/v2/evm/accounts"
+
+    for _ in range(2):
+        with pytest.raises(ApiError):
+            await client.call_api("GET", url)
+    with pytest.raises(CircuitOpenError):
+        await client.call_api("GET", url)
+    await client.close()
+
+    assert breaker.get_metrics()["GET /platform/v2/evm/accounts"].failures == 2
+
+
+@pytest.mark.asyncio
+async def test_open_circuit_rejects_calls_before_signing(breaker, ec_private_key_factory):
+    """Test that calls to an open circuit sign no JWT and take none from the JWT pool."""
+    client = CdpApiClient(
+        "test-key-id",
+        ec_private_key_factory(),
+        base_path="http://127.0.0.1:1/platform",
+        retry_policy=RetryPolicy(max_retries=0),
+        circuit_breaker=breaker,
+        hot_endpoints=[("get", "/v2/evm/accounts")],
+        jwt_pool_size=1,
+    )
+    url = f"{client.configuration.host}/v2/evm/accounts"
+    for _ in range(2):
+        with pytest.raises(ApiError):
+            await client.call_api("GET", url)
+
+    with (
+        patch.object(client._jwt_signer, "generate_jwt") as mock_generate_jwt,
+        patch.object(client._jwt_pool, "take") as mock_take,
+        pytest.raises(CircuitOpenError),
+    ):
+        await client.call_api("GET", url)
+    await client.close()
+
+    mock_generate_jwt.assert_not_called()
+    mock_take.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_signing_errors_release_the_probe(breaker):
+    """Test that a probe call that fails to sign lets the next probe through."""
+    client = CdpApiClient(
+        "test-key-id",
+        "invalid-key",
+        base_path="http://127.0.0.1:1/platform",
+        circuit_breaker=breaker,
+    )
+    url = f"{client.configuration.host}/v2/evm/accounts"
+    for _ in range(2):
+        breaker.record("GET /platform/v2/evm/accounts", False)
+
+    with patch("cdp.openapi_client.circuit_breaker.time.monotonic", return_value=1e12):
+        for _ in range(2):
+            with pytest.raises(ValueError, match="Failed to generate JWT"):
+                await client.call_api("GET", url)
+    await client.close()
+
+    assert breaker.get_state("GET /platform/v2/evm/accounts") == "half_open"
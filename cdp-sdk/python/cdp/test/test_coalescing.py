@@ -0,0 +1,115 @@
+import asyncio
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from cdp.openapi_client.api.evm_accounts_api import EVMAccountsApi
+from cdp.openapi_client.errors import ApiError
+from cdp.openapi_client.retry import RetryPolicy
+
+ADDRESS = "0x" + "1" * 40
+OTHER_ADDRESS = "0x" + "2" * 40
+MISSING_ADDRESS = "0x" + "3" * 40
+
+
+@pytest_asyncio.fixture
+async def server(api_server_factory):
+    """Start a local server that holds get account requests until it is released."""
+    release = asyncio.Event()
+
+    async def get_account(request):
+        await release.wait()
+        if request.match_info["address"] == MISSING_ADDRESS:
+            return web.json_response(
+                {"errorType": "not_found", "errorMessage": "Account not found."}, status=404
+            )
+        return web.json_response({"address": request.match_info["address"]})
+
+    server = await api_server_factory([("GET", "/platform/v2/evm/accounts/{address}", get_account)])
+    server.release = release
+    return server
+
+
+@pytest_asyncio.fixture
+async def api(server, cdp_api_client_factory):
+    """Create an accounts API whose client coalesces requests."""
+    client = cdp_api_client_factory(
+        server, retry_policy=RetryPolicy(max_retries=0), coalesce_requests=True
+    )
+    yield EVMAccountsApi(client)
+    await client.close()
+
+
+def _calls(server):
+    """Get the addresses of the accounts the server was asked for."""
+    return [request.match_info["address"] for request in server.requests]
+
+
+async def _wait_for_calls(server, count):
+    """Wait until the server has received a number of requests."""
+    while len(server.requests) < count:
+        await asyncio.sleep(0.01)
+
+
+@pytest.mark.asyncio
+async def test_identical_requests_share_one_call(server, api):
+    """Test that concurrent identical GETs share one request and one result."""
+    tasks = [asyncio.create_task(api.get_evm_account(ADDRESS)) for _ in range(5)]
+    other = asyncio.create_task(api.get_evm_account(OTHER_ADDRESS))
+    await _wait_for_calls(server, 2)
+    server.release.set()
+    accounts = await asyncio.gather(*tasks)
+    await other
+
+    assert sorted(_calls(server)) == [ADDRESS, OTHER_ADDRESS]
+    assert all(account is accounts[0] for account in accounts)
+    assert accounts[0].address == ADDRESS
+    assert api.api_client._in_flight == {}
+
+    # Requests made after the shared one finished go to the API again.
+    await api.get_evm_account(ADDRESS)
+    assert _calls(server).count(ADDRESS) == 2
+
+
+@pytest.mark.asyncio
+async def test_errors_are_shared(server, api):
+    """Test that every caller of a failed shared request gets the error."""
+    tasks = [asyncio.create_task(api.get_evm_account(MISSING_ADDRESS)) for _ in range(3)]
+    await _wait_for_calls(server, 1)
+    server.release.set()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    assert len(server.requests) == 1
+    assert all(isinstance(result, ApiError) for result in results)
+    assert all(result.http_code == 404 for result in results)
+
+
+@pytest.mark.asyncio
+async def test_cancelling_one_caller_keeps_the_request(server, api):
+    """Test that a cancelled caller does not cancel the request of the other callers."""
+    first = asyncio.create_task(api.get_evm_account(ADDRESS))
+    second = asyncio.create_task(api.get_evm_account(ADDRESS))
+    await _wait_for_calls(server, 1)
+    first.cancel()
+    server.release.set()
+    account = await second
+
+    assert first.cancelled()
+    assert account.address == ADDRESS
+    assert len(server.requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_requests_are_not_coalesced_by_default(server, cdp_api_client_factory):
+    """Test that clients only coalesce requests when asked to."""
+    client = cdp_api_client_factory(server)
+    api = EVMAccountsApi(client)
+
+    tasks = [asyncio.create_task(api.get_evm_account(ADDRESS)) for _ in range(2)]
+    await _wait_for_calls(server, 2)
+    server.release.set()
+    accounts = await asyncio.gather(*tasks)
+    await client.close()
+
+    assert accounts[0] is not accounts[1]
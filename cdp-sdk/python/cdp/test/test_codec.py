@@ -0,0 +1,184 @@
+import datetime
+import json
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from cdp.openapi_client.api.evm_accounts_api import EVMAccountsApi
+from cdp.openapi_client.api_client import ApiClient
+from cdp.openapi_client.codec import (
+    JsonCodec,
+    OrjsonCodec,
+    can_validate_json,
+    get_decoder,
+    serialize,
+)
+from cdp.openapi_client.models.common_swap_response_fees import CommonSwapResponseFees
+from cdp.openapi_client.models.create_evm_swap_quote_request import CreateEvmSwapQuoteRequest
+from cdp.openapi_client.models.create_policy_request import CreatePolicyRequest
+from cdp.openapi_client.models.eip712_domain import EIP712Domain
+from cdp.openapi_client.models.eip712_message import EIP712Message
+from cdp.openapi_client.models.evm_account import EvmAccount
+from cdp.openapi_client.models.evm_call import EvmCall
+from cdp.openapi_client.models.list_evm_accounts200_response import (
+    ListEvmAccounts200Response,
+)
+from cdp.openapi_client.models.policy import Policy
+from cdp.openapi_client.models.prepare_user_operation_request import (
+    PrepareUserOperationRequest,
+)
+from cdp.openapi_client.models.token_fee import TokenFee
+
+ACCOUNTS = {
+    "accounts": [
+        {
+            "address": "0x" + str(i) * 40,
+            "name": f"account-{i}",
+            "policies": [],
+            "createdAt": "2025-01-01T00:00:00Z",
+            "extra": True,
+        }
+        for i in range(1, 4)
+    ],
+    "nextPageToken": "next",
+}
+
+
+def test_can_validate_json():
+    """Test that models whose from_dict differs from JSON validation are excluded."""
+    assert can_validate_json(EvmAccount)
+    assert can_validate_json(ListEvmAccounts200Response)
+    # oneOf rules
+    assert not can_validate_json(Policy)
+    # from_dict replaces null with the default slippage
+    assert not can_validate_json(CreateEvmSwapQuoteRequest)
+
+
+def test_orjson_codec_falls_back_to_json():
+    """Test that values orjson does not support are encoded and decoded by the json module."""
+    pytest.importorskip("orjson")
+    codec = OrjsonCodec()
+    body = {"value": 2**70, "name": "test"}
+
+    assert json.loads(codec.dumps(body)) == body
+    assert codec.loads(json.dumps(body).encode()) == body
+
+
+@pytest_asyncio.fixture
+async def server(api_server_factory):
+    """Start a local server that lists accounts and reads the faucet request bodies."""
+
+    async def list_accounts(request):
+        return web.json_response(ACCOUNTS)
+
+    async def faucet(request):
+        await request.read()
+        return web.json_response({})
+
+    return await api_server_factory(
+        [
+            ("GET", "/platform/v2/evm/accounts", list_accounts),
+            ("POST", "/platform/v2/evm/faucet", faucet),
+        ]
+    )
+
+
+class _CountingCodec(JsonCodec):
+    """A codec that counts its calls."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def dumps(self, obj):
+        self.calls += 1
+        return super().dumps(obj)
+
+
+@pytest.mark.asyncio
+async def test_client_uses_codec(server, cdp_api_client_factory):
+    """Test that responses validated from bytes equal from_dict, and bodies use the codec."""
+    codec = _CountingCodec()
+    client = cdp_api_client_factory(server, json_codec=codec)
+    api = EVMAccountsApi(client)
+
+    response = await api.list_evm_accounts()
+    assert response == ListEvmAccounts200Response.from_dict(ACCOUNTS)
+
+    url = f"{client.configuration.host}/v2/evm/faucet"
+    await client.call_api("POST", url, body={"network": "base-sepolia"})
+    await client.close()
+
+    assert codec.calls == 1
+    assert json.loads(await server.requests[1].read()) == {"network": "base-sepolia"}
+
+
+def test_serialize_matches_sanitize_for_serialization(openapi_policy_model_factory):
+    """Test that compiled serializers give the same bodies as the generated sanitizer."""
+    policy = openapi_policy_model_factory()
+    criterion = policy.rules[0].actual_instance.criteria[0].actual_instance
+    criterion.addresses = ["0x" + f"{i:040x}" for i in range(100)]
+    bodies = [
+        CreatePolicyRequest(scope="account", description="Allowlist", rules=policy.rules),
+        PrepareUserOperationRequest(
+            network="base-sepolia",
+            calls=[EvmCall(to="0x" + "1" * 40, value=str(i), data="0x") for i in range(50)],
+        ),
+        EIP712Message(
+            domain=EIP712Domain(name="Test", chain_id=1),
+            types={"Mail": [{"name": "contents", "type": "string"}]},
+            primary_type="Mail",
+            message={"contents": "hello", "at": datetime.datetime(2025, 1, 1), "n": None},
+        ),
+        EvmAccount(
+            address="0x" + "1" * 40, created_at=datetime.datetime.now(datetime.timezone.utc)
+        ),
+        CommonSwapResponseFees(
+            gas_fee=None, protocol_fee=TokenFee(amount="1", token="0x" + "2" * 40)
+        ),
+        {"calls": [EvmCall(to="0x" + "1" * 40, value="1", data="0x")], "amount": Decimal("1.5")},
+        ("a", 1, None),
+    ]
+    sanitizer = ApiClient()
+
+    for body in bodies:
+        assert serialize(body) == sanitizer.sanitize_for_serialization(body)
+
+
+def test_serialize_falls_back_to_to_dict():
+    """Test that models whose serializer fails to compile are serialized with to_dict."""
+    body = CommonSwapResponseFees(
+        gas_fee=None, protocol_fee=TokenFee(amount="1", token="0x" + "2" * 40)
+    )
+    expected = ApiClient().sanitize_for_serialization(body)
+
+    with (
+        patch("cdp.openapi_client.codec._compile", side_effect=RuntimeError()),
+        patch.dict("cdp.openapi_client.codec._serializers", clear=True),
+    ):
+        assert serialize(body) == expected
+        call = EvmCall(to="0x" + "1" * 40, value="1", data="0x")
+        assert serialize(call) == {"to": "0x" + "1" * 40, "value": "1", "data": "0x"}
+
+
+def test_decoders_match_generated_deserializer(openapi_policy_model_factory):
+    """Test that cached decoders give the same results as the generated deserializer."""
+    cases = [
+        ("List[EvmAccount]", ACCOUNTS["accounts"]),
+        ("Dict[str, List[int]]", {"a": [1, 2], "b": None}),
+        ("Policy", openapi_policy_model_factory().to_dict()),
+        ("datetime", "2025-01-01T00:00:00Z"),
+        ("date", "2025-01-01"),
+        ("decimal", "1.5"),
+        ("object", {"a": 1}),
+        ("str", None),
+    ]
+    deserializer = ApiClient()
+
+    for response_type, data in cases:
+        expected = deserializer.deserialize(json.dumps(data), response_type, "application/json")
+        assert get_decoder(response_type)(data) == expected
+        # Decoders are built once per response type.
+        assert get_decoder(response_type) is get_decoder(response_type)
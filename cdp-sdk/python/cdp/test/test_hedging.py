@@ -0,0 +1,96 @@
+import asyncio
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from cdp.openapi_client.hedging import Hedger, HedgingConfig
+from cdp.openapi_client.rate_limit import RateLimiter
+from cdp.openapi_client.retry import RetryPolicy
+
+PATTERN = "/v2/evm/smart-accounts/*/user-operations/*"
+
+
+def test_patterns_match_method_and_path():
+    """Test that only reads of the configured paths are hedged."""
+    hedger = Hedger(HedgingConfig(paths=[PATTERN]))
+
+    assert hedger.get_pattern("GET", "/v2/evm/smart-accounts/0x1/user-operations/0x2") == PATTERN
+    assert hedger.get_pattern("POST", "/v2/evm/smart-accounts/0x1/user-operations/0x2") is None
+    assert hedger.get_pattern("GET", "/v2/evm/accounts") is None
+
+
+def test_delay_follows_learned_percentile():
+    """Test that the delay is the initial delay until enough latencies are observed."""
+    hedger = Hedger(HedgingConfig(paths=[PATTERN], min_samples=10, min_delay=0.01))
+
+    for i in range(9):
+        hedger.record_response(PATTERN, (i + 1) / 100, False)
+    assert hedger.get_delay(PATTERN) == 0.5
+
+    for i in range(9, 100):
+        hedger.record_response(PATTERN, (i + 1) / 100, i == 99)
+    assert hedger.get_delay(PATTERN) == pytest.approx(0.95)
+    assert hedger.get_metrics()[PATTERN].hedges_won == 1
+    assert Hedger(HedgingConfig(paths=[PATTERN], delay=0.2)).get_delay(PATTERN) == 0.2
+
+
+@pytest_asyncio.fixture
+async def server(api_server_factory):
+    """Start a local server whose first user operation request hangs."""
+
+    async def get_user_operation(request):
+        if len(server.requests) == 1:
+            await asyncio.sleep(10)
+        return web.json_response({"userOpHash": request.match_info["hash"]})
+
+    server = await api_server_factory(
+        [
+            (
+                "GET",
+                "/platform/v2/evm/smart-accounts/{address}/user-operations/{hash}",
+                get_user_operation,
+            )
+        ]
+    )
+    return server
+
+
+@pytest.mark.asyncio
+async def test_hedge_answers_slow_request(server, cdp_api_client_factory):
+    """Test that a slow request is answered by its hedge, which is signed again."""
+    hedger = Hedger(HedgingConfig(paths=[PATTERN], delay=0.05))
+    client = cdp_api_client_factory(server, retry_policy=RetryPolicy(max_retries=0), hedger=hedger)
+    url = f"{client.configuration.host}/v2/evm/smart-accounts/0x1/user-operations/0x2"
+
+    response = await asyncio.wait_for(client.call_api("GET", url), timeout=5)
+    body = await response.read()
+    await client.close()
+
+    assert b"0x2" in body
+    tokens = [request.headers["Authorization"] for request in server.requests]
+    assert len(tokens) == 2
+    assert tokens[0] != tokens[1]
+    metrics = hedger.get_metrics()[PATTERN]
+    assert (metrics.requests, metrics.hedges, metrics.hedges_won) == (1, 1, 1)
+
+
+@pytest.mark.asyncio
+async def test_hedges_respect_rate_limiter(server, cdp_api_client_factory):
+    """Test that no hedge is sent while the rate limiter has no permit available."""
+    hedger = Hedger(HedgingConfig(paths=[PATTERN], delay=0.05))
+    client = cdp_api_client_factory(
+        server,
+        retry_policy=RetryPolicy(max_retries=0),
+        rate_limiter=RateLimiter(rate=0.1, burst=1),
+        hedger=hedger,
+    )
+    url = f"{client.configuration.host}/v2/evm/smart-accounts/0x1/user-operations/0x2"
+
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(client.call_api("GET", url), timeout=0.3)
+    await client.close()
+
+    assert len(server.requests) == 1
+    metrics = hedger.get_metrics()[PATTERN]
+    assert (metrics.hedges, metrics.hedges_skipped) == (0, 1)
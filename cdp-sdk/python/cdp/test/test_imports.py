@@ -0,0 +1,44 @@
+import subprocess
+import sys
+
+import cdp
+import cdp.openapi_client
+import cdp.openapi_client.api
+import cdp.openapi_client.models
+
+
+def test_import_cdp_loads_no_heavy_dependencies():
+    """Test that importing the package leaves web3, eth_account, solana and the API client."""
+    code = (
+        "import sys, cdp; "
+        "print(sorted(m for m in ('web3', 'eth_account', 'solana', 'solders', "
+        "'nest_asyncio', 'cdp.openapi_client') if m in sys.modules))"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True
+    ).stdout
+
+    assert output.strip() == "[]"
+
+
+def test_exports_load_on_first_access():
+    """Test that every exported name of the lazy packages can be imported."""
+    for package in (cdp, cdp.openapi_client, cdp.openapi_client.api, cdp.openapi_client.models):
+        for name in package.__all__:
+            assert getattr(package, name) is not None
+        assert set(package.__all__) <= set(dir(package))
+
+    assert cdp.openapi_client.EvmAccount is cdp.openapi_client.models.EvmAccount
+
+
+def test_submodules_load_on_first_access():
+    """Test that submodules can be reached as attributes of the package without importing them."""
+    code = (
+        "import cdp; "
+        "print(cdp.auth.get_auth_headers.__module__, cdp.cdp_client.CdpClient is cdp.CdpClient)"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True
+    ).stdout
+
+    assert output.split() == ["cdp.auth.utils.http", "True"]
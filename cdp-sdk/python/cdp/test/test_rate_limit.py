@@ -0,0 +1,155 @@
+import time
+from unittest.mock import AsyncMock, patch
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from cdp.openapi_client.rate_limit import RateLimiter, RateLimitGroup
+from cdp.openapi_client.retry import RetryPolicy
+
+
+@pytest.fixture
+def clock():
+    """Replace the monotonic clock of the rate limiter with one that tests advance."""
+    now = [1000.0]
+    with patch("cdp.openapi_client.rate_limit.time.monotonic", side_effect=lambda: now[0]):
+        yield now
+
+
+@pytest.fixture
+def mock_sleep():
+    """Record the waits for permits instead of sleeping."""
+    with patch("cdp.openapi_client.rate_limit.asyncio.sleep", new_callable=AsyncMock) as sleep:
+        yield sleep
+
+
+def test_groups_match_method_and_path():
+    """Test that requests belong to the first matching group, or the default one."""
+    limiter = RateLimiter(
+        rate=50,
+        groups=[
+            RateLimitGroup(name="faucet", paths=["/v2/*/faucet"], rate=1),
+            RateLimitGroup(
+                name="signing", paths=["/v2/evm/accounts/*/sign*"], methods={"POST"}, rate=5
+            ),
+        ],
+    )
+
+    assert limiter.get_group("POST", "/v2/evm/faucet") == "faucet"
+    assert limiter.get_group("POST", "/v2/solana/faucet") == "faucet"
+    assert limiter.get_group("POST", "/v2/evm/accounts/0x1/sign/transaction") == "signing"
+    assert limiter.get_group("GET", "/v2/evm/accounts/0x1/sign") == "default"
+    assert RateLimiter(groups=limiter.groups[:1]).get_group("GET", "/v2/evm/accounts") is None
+
+
+@pytest.mark.asyncio
+async def test_acquire_paces_requests(clock, mock_sleep):
+    """Test that permits beyond the burst are spaced at the rate, in order."""
+    limiter = RateLimiter(rate=10, burst=2)
+
+    for _ in range(5):
+        await limiter.acquire("default")
+    clock[0] += 1
+    await limiter.acquire("default")
+    await limiter.acquire(None)
+
+    waits = [call.args[0] for call in mock_sleep.await_args_list]
+    assert waits == pytest.approx([0.1, 0.2, 0.3])
+
+
+@pytest.mark.asyncio
+async def test_429_slows_down_and_pauses(clock, mock_sleep):
+    """Test that a 429 halves the rate, pauses the group, and other responses recover it."""
+    limiter = RateLimiter(rate=10, burst=10, recovery_step=0.25)
+
+    limiter.update("default", 429, {"Retry-After": "3"})
+    assert limiter.get_rate("default") == 5
+    await limiter.acquire("default")
+    mock_sleep.assert_awaited_once_with(3)
+
+    for _ in range(5):
+        limiter.update("default", 200, {})
+    assert limiter.get_rate("default") == 10
+
+    for _ in range(10):
+        limiter.update("default", 429, {})
+    assert limiter.get_rate("default") == 1
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_headers(clock, mock_sleep):
+    """Test that rate limit headers cap the rate and pause exhausted groups."""
+    limiter = RateLimiter(rate=100)
+
+    limiter.update("default", 200, {"X-RateLimit-Remaining": "40", "X-RateLimit-Reset": "10"})
+    assert limiter.get_rate("default") == 4
+
+    limiter.update(
+        "default",
+        200,
+        {"RateLimit-Remaining": "0", "RateLimit-Reset": str(int(time.time()) + 30)},
+    )
+    await limiter.acquire("default")
+    wait = mock_sleep.await_args.args[0]
+    assert 28 < wait <= 31
+
+    limiter.update("default", 200, {"X-RateLimit-Remaining": "x", "X-RateLimit-Reset": "1"})
+
+
+def test_rate_limit_headers_cap_the_rate_until_the_reset(clock):
+    """Test that a rate from headers is kept by later responses without headers until the reset."""
+    limiter = RateLimiter(rate=100, recovery_step=0.5)
+
+    limiter.update("default", 200, {"X-RateLimit-Remaining": "5", "X-RateLimit-Reset": "10"})
+    limiter.update("default", 200, {})
+    assert limiter.get_rate("default") == 0.5
+
+    clock[0] += 5
+    limiter.update("default", 429, {})
+    assert limiter.get_rate("default") == 0.5
+
+    clock[0] += 5
+    limiter.update("default", 200, {})
+    assert limiter.get_rate("default") == 50.5
+
+
+def test_invalid_backoff_factor():
+    """Test that the backoff factor must slow the rate down."""
+    with pytest.raises(ValueError):
+        RateLimiter(rate=1, backoff_factor=1)
+
+
+@pytest_asyncio.fixture
+async def server(api_server_factory):
+    """Start a local server that rate limits the faucet after two requests."""
+
+    async def faucet(request):
+        if len(server.requests) == 3:
+            return web.json_response({}, status=429, headers={"Retry-After": "2"})
+        return web.json_response({}, headers={"X-RateLimit-Remaining": "100"})
+
+    server = await api_server_factory([("POST", "/platform/v2/evm/faucet", faucet)])
+    return server
+
+
+@pytest.mark.asyncio
+async def test_client_waits_for_permits(server, cdp_api_client_factory, clock, mock_sleep):
+    """Test that client requests wait for permits and adapt to 429 responses."""
+    limiter = RateLimiter(groups=[RateLimitGroup(name="faucet", paths=["/v2/evm/faucet"], rate=4)])
+    client = cdp_api_client_factory(
+        server, retry_policy=RetryPolicy(max_retries=0), rate_limiter=limiter
+    )
+    url = f"{client.configuration.host}/v2/evm/faucet"
+
+    statuses = []
+    for _ in range(6):
+        response = await client.call_api("POST", url, body={})
+        statuses.append(response.status)
+    await client.close()
+
+    assert statuses == [200, 200, 429, 200, 200, 200]
+    assert limiter.get_rate("faucet") < 4
+    # The first four requests use the burst, the rest wait for the pause after the 429.
+    waits = [call.args[0] for call in mock_sleep.await_args_list]
+    assert waits[0] == 2
@@ -0,0 +1,300 @@
+import asyncio
+import inspect
+import time
+import uuid
+from email.utils import formatdate
+from functools import partial
+from unittest.mock import AsyncMock, patch
+
+import aiohttp
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+import cdp.openapi_client.api
+from cdp.openapi_client.api.policy_engine_api import PolicyEngineApi
+from cdp.openapi_client.api_client import ApiClient
+from cdp.openapi_client.errors import ApiError
+from cdp.openapi_client.retry import (
+    IDEMPOTENCY_KEY_HEADER,
+    IDEMPOTENT_OPERATIONS,
+    RetryBudget,
+    RetryPolicy,
+    parse_retry_after,
+)
+
+
+@pytest_asyncio.fixture
+async def server(api_server_factory):
+    """Start a local server that answers with the queued statuses, then with 200."""
+    statuses = []
+
+    async def handler(request):
+        if statuses:
+            status, headers = statuses.pop(0)
+            return web.json_response({}, status=status, headers=headers)
+        return web.json_response({})
+
+    server = await api_server_factory(
+        [
+            ("*", "/platform/v2/evm/faucet", handler),
+            ("*", "/platform/v2/policy-engine/policies/{policy_id}", handler),
+        ]
+    )
+    server.statuses = statuses
+    return server
+
+
+@pytest.fixture
+def client_factory(server, cdp_api_client_factory):
+    """Create clients that send requests to the local server."""
+    return partial(cdp_api_client_factory, server)
+
+
+@pytest.fixture
+def mock_sleep():
+    """Skip the delays between attempts."""
+    with patch("cdp.openapi_client.transport.asyncio.sleep", new_callable=AsyncMock) as sleep:
+        yield sleep
+
+
+def test_next_delay_uses_decorrelated_jitter():
+    """Test that delays grow from the previous delay and stay within the limits."""
+    policy = RetryPolicy(base_delay=1, max_delay=5)
+
+    delays = [policy.next_delay(None)]
+    for _ in range(50):
+        delays.append(policy.next_delay(delays[-1]))
+
+    assert all(1 <= delay <= 5 for delay in delays)
+    with patch("cdp.openapi_client.retry.random.uniform", side_effect=lambda a, b: b):
+        assert policy.next_delay(None) == 3
+        assert policy.next_delay(1.5) == 4.5
+        assert policy.next_delay(4.5) == 5
+
+
+def test_parse_retry_after():
+    """Test that Retry-After headers in seconds and as dates are parsed."""
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("2") == 2
+    assert parse_retry_after("-1") == 0
+    assert parse_retry_after("soon") is None
+    in_a_minute = parse_retry_after(formatdate(time.time() + 60, usegmt=True))
+    assert 55 < in_a_minute <= 60
+
+
+def test_retry_budget():
+    """Test that failures use up the budget and successes refill it."""
+    budget = RetryBudget(max_tokens=4, token_ratio=0.5)
+
+    budget.record_failure()
+    assert budget.can_retry()
+    budget.record_failure()
+    assert not budget.can_retry()
+    budget.record_success()
+    assert budget.can_retry()
+    for _ in range(10):
+        budget.record_success()
+    assert budget.tokens == 4
+
+    with pytest.raises(ValueError):
+        RetryBudget(max_tokens=0)
+
+
+@pytest.mark.asyncio
+async def test_retries_server_errors(server, client_factory, mock_sleep):
+    """Test that GET requests are retried on 5xx responses over the same connection."""
+    server.statuses.extend([(503, None), (500, None)])
+    client = client_factory()
+
+    response = await client.call_api("GET", f"{client.configuration.host}/v2/evm/faucet")
+    await client.close()
+
+    assert response.status == 200
+    assert len(server.requests) == 3
+    assert len({request["transport"] for request in server.requests}) == 1
+    assert mock_sleep.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_honors_retry_after(server, client_factory, mock_sleep):
+    """Test that 429 responses are retried no sooner than their Retry-After."""
+    server.statuses.append((429, {"Retry-After": "7"}))
+    client = client_factory(retry_policy=RetryPolicy(base_delay=0.1, max_delay=1))
+
+    response = await client.call_api("GET", f"{client.configuration.host}/v2/evm/faucet")
+    await client.close()
+
+    assert response.status == 200
+    mock_sleep.assert_awaited_once_with(7)
+
+
+@pytest.mark.asyncio
+async def test_does_not_wait_for_long_retry_after(server, client_factory, mock_sleep):
+    """Test that responses asking for a wait longer than max_retry_after are not retried."""
+    server.statuses.append((503, {"Retry-After": "3600"}))
+    client = client_factory()
+
+    response = await client.call_api("GET", f"{client.configuration.host}/v2/evm/faucet")
+    await client.close()
+
+    assert response.status == 503
+    assert len(server.requests) == 1
+    mock_sleep.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_gives_up_after_max_retries(server, client_factory, mock_sleep):
+    """Test that requests are retried at most max_network_retries times."""
+    server.statuses.extend([(502, None)] * 5)
+    client = client_factory(max_network_retries=2)
+
+    response = await client.call_api("GET", f"{client.configuration.host}/v2/evm/faucet")
+    await client.close()
+
+    assert response.status == 502
+    assert len(server.requests) == 3
+
+
+@pytest.mark.asyncio
+async def test_retries_only_allowed_methods_and_statuses(server, client_factory, mock_sleep):
+    """Test that the policy's method and status allowlists are applied."""
+    client = client_factory(retry_policy=RetryPolicy(methods={"GET", "POST"}, statuses={409}))
+    url = f"{client.configuration.host}/v2/evm/faucet"
+
+    server.statuses.extend([(503, None), (409, None)])
+    first = await client.call_api("GET", url)
+    second = await client.call_api("POST", url, body={})
+    await client.close()
+
+    assert first.status == 503
+    assert second.status == 200
+    assert [request.method for request in server.requests] == ["GET", "POST", "POST"]
+
+
+@pytest.mark.asyncio
+async def test_does_not_retry_writes_by_default(server, client_factory, mock_sleep):
+    """Test that POST requests are sent once."""
+    server.statuses.append((503, None))
+    client = client_factory()
+
+    response = await client.call_api("POST", f"{client.configuration.host}/v2/evm/faucet", body={})
+    await client.close()
+
+    assert response.status == 503
+    assert len(server.requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_retry_budget_is_shared(server, client_factory, mock_sleep):
+    """Test that clients stop retrying once their shared budget is used up."""
+    server.statuses.extend([(503, None)] * 10)
+    budget = RetryBudget(max_tokens=4)
+    clients = [client_factory(retry_budget=budget) for _ in range(2)]
+
+    for client in clients:
+        await client.call_api("GET", f"{client.configuration.host}/v2/evm/faucet")
+        await client.close()
+
+    # The first client fails twice before the budget runs low, the second only once.
+    assert len(server.requests) == 3
+    assert not budget.can_retry()
+
+
+@pytest.mark.asyncio
+async def test_retries_connection_errors(client_factory, mock_sleep):
+    """Test that connection errors are retried and raised once the retries are used up."""
+    client = client_factory(max_network_retries=2)
+    rest_client = client.rest_client.rest_client
+    rest_client.request = AsyncMock(
+        side_effect=[
+            aiohttp.ClientConnectionError(),
+            asyncio.TimeoutError(),
+            aiohttp.ServerDisconnectedError(),
+        ]
+    )
+
+    with pytest.raises(ApiError):
+        await client.call_api("GET", f"{client.configuration.host}/v2/evm/faucet")
+
+    assert rest_client.request.await_count == 3
+    assert mock_sleep.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_idempotent_writes_are_retried_with_the_same_key(server, client_factory, mock_sleep):
+    """Test that writes get one idempotency key, kept across retries, and are signed again."""
+    server.statuses.extend([(503, None), (502, None)])
+    client = client_factory(idempotent_writes=True)
+
+    await PolicyEngineApi(client).delete_policy("policy-id")
+    await client.call_api("GET", f"{client.configuration.host}/v2/evm/faucet")
+    await client.close()
+
+    delete_headers = [request.headers for request in server.requests[:3]]
+    keys = {headers["X-Idempotency-Key"] for headers in delete_headers}
+    assert len(keys) == 1
+    assert uuid.UUID(keys.pop()).version == 4
+    assert len({headers["Authorization"] for headers in delete_headers}) == 3
+    assert "X-Idempotency-Key" not in server.requests[3].headers
+
+
+@pytest.mark.asyncio
+async def test_writes_keep_their_own_idempotency_key(server, client_factory, mock_sleep):
+    """Test that a passed idempotency key is kept and makes the write retryable."""
+    server.statuses.append((500, None))
+    client = client_factory()
+    key = str(uuid.uuid4())
+
+    await PolicyEngineApi(client).delete_policy("policy-id", x_idempotency_key=key)
+    await client.close()
+
+    keys = [request.headers["X-Idempotency-Key"] for request in server.requests]
+    assert keys == [key, key]
+
+
+@pytest.mark.asyncio
+async def test_writes_without_idempotency_keys_are_not_retried(server, client_factory, mock_sleep):
+    """Test that writes to operations that do not accept an idempotency key are sent once."""
+    server.statuses.extend([(503, None), (503, None)])
+    client = client_factory(idempotent_writes=True)
+    url = f"{client.configuration.host}/v2/evm/faucet"
+
+    first = await client.call_api("POST", url, body={})
+    # A key the API ignores does not make the write safe to retry either.
+    second = await client.call_api(
+        "POST", url, header_params={"X-Idempotency-Key": str(uuid.uuid4())}, body={}
+    )
+    await client.close()
+
+    assert (first.status, second.status) == (503, 503)
+    assert len(server.requests) == 2
+    assert "X-Idempotency-Key" not in server.requests[0].headers
+
+
+def test_idempotent_operations_match_generated_methods():
+    """Test that IDEMPOTENT_OPERATIONS match the serializers that send an idempotency key."""
+
+    class _CapturingApiClient(ApiClient):
+        def param_serialize(
+            self, method, resource_path, path_params, query_params, header_params, *args, **kwargs
+        ):
+            self.operation = (method, resource_path)
+            self.header_params = header_params
+
+    api_client = _CapturingApiClient()
+    operations = set()
+    for name in cdp.openapi_client.api.__all__:
+        api = getattr(cdp.openapi_client.api, name)(api_client)
+        for attr in vars(type(api)):
+            if not (attr.startswith("_") and attr.endswith("_serialize")):
+                continue
+            serialize = getattr(api, attr)
+            args = dict.fromkeys(inspect.signature(serialize).parameters)
+            if "x_idempotency_key" not in args:
+                continue
+            serialize(**{**args, "x_idempotency_key": "key", "_host_index": 0})
+            assert api_client.header_params[IDEMPOTENCY_KEY_HEADER] == "key", attr
+            operations.add(api_client.operation)
+
+    assert operations == IDEMPOTENT_OPERATIONS
@@ -0,0 +1,204 @@
+import socket
+import subprocess
+import sys
+from unittest.mock import AsyncMock, patch
+
+import aiohttp
+import jwt as jwt_lib
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from cdp.openapi_client.cdp_api_client import CdpApiClient
+from cdp.openapi_client.transport import (
+    TimeoutConfig,
+    TransportConfig,
+    TransportRegistry,
+    _TCPConnector,
+    get_default_transport_registry,
+)
+
+
+@pytest_asyncio.fixture
+async def server(api_server_factory):
+    """Start a local server that answers account list requests."""
+
+    async def list_accounts(request):
+        return web.json_response({})
+
+    return await api_server_factory([("GET", "/platform/v2/evm/accounts", list_accounts)])
+
+
+def _api_key_id(request):
+    """Get the API key ID of the JWT that signed a request."""
+    token = request.headers["Authorization"].removeprefix("Bearer ")
+    return jwt_lib.decode(token, options={"verify_signature": False})["sub"]
+
+
+@pytest.mark.asyncio
+async def test_clients_share_connections(server, cdp_api_client_factory):
+    """Test that clients with the same registry share one session until the last one closes."""
+    # Setup
+    registry = TransportRegistry(TransportConfig(limit=1))
+    clients = [
+        cdp_api_client_factory(server, f"key-{i}", transport_registry=registry) for i in range(2)
+    ]
+
+    # Execute
+    for client in clients:
+        response = await client.call_api("GET", f"{client.configuration.host}/v2/evm/accounts")
+        await response.read()
+    sessions = [client.rest_client.rest_client.pool_manager for client in clients]
+
+    # Verify
+    assert sessions[0] is sessions[1]
+    assert [_api_key_id(request) for request in server.requests] == ["key-0", "key-1"]
+    assert server.requests[0]["transport"] is server.requests[1]["transport"]
+
+    # Closing the last client that uses the registry closes the shared session.
+    await clients[0].close()
+    assert not sessions[0].closed
+    await clients[1].close()
+    assert sessions[0].closed
+
+
+@pytest.mark.asyncio
+async def test_registry_sessions_per_host(ec_private_key_factory):
+    """Test that the registry keeps one session per host and replaces closed sessions."""
+    # Setup
+    registry = TransportRegistry()
+    client = CdpApiClient("test-key-id", ec_private_key_factory(), transport_registry=registry)
+    ssl_context = client.rest_client.rest_client.ssl_context
+
+    # Execute
+    first = registry.get_session("https://api.cdp.coinbase.com", ssl_context)
+    same = registry.get_session("https://api.cdp.coinbase.com", ssl_context)
+    other = registry.get_session("https://other.example.com", ssl_context)
+    await first.close()
+    replaced = registry.get_session("https://api.cdp.coinbase.com", ssl_context)
+    await registry.close()
+
+    # Verify
+    assert same is first
+    assert other is not first
+    assert replaced is not first
+    assert other.closed and replaced.closed
+
+
+def test_registry_closes_sessions_with_their_event_loop():
+    """Test that sessions are closed when their event loop shuts down and then dropped."""
+    # A new interpreter, since importing cdp.evm_local_account replaces asyncio.run().
+    code = """
+import asyncio, ssl
+from cdp.openapi_client.transport import TransportRegistry
+
+registry = TransportRegistry()
+ssl_context = ssl.create_default_context()
+
+async def get_session():
+    return registry.get_session("https://api.cdp.coinbase.com", ssl_context)
+
+first = asyncio.run(get_session())
+second = asyncio.run(get_session())
+print(first.closed, second.closed, second is first, len(registry._sessions))
+"""
+    result = subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True
+    )
+
+    assert result.stdout.split() == ["True", "True", "False", "1"]
+    assert "Unclosed client session" not in result.stderr
+
+
+def test_default_transport_registry():
+    """Test that the process-wide registry is created once."""
+    assert get_default_transport_registry() is get_default_transport_registry()
+
+
+@pytest.mark.asyncio
+async def test_client_without_registry_owns_its_session(server, cdp_api_client_factory):
+    """Test that clients without a registry create and close a session with their settings."""
+    # Setup
+    client = cdp_api_client_factory(
+        server,
+        transport_config=TransportConfig(
+            limit=5, limit_per_host=2, keepalive_timeout=30, tcp_nodelay=False
+        ),
+    )
+
+    # Execute
+    response = await client.call_api("GET", f"{client.configuration.host}/v2/evm/accounts")
+    await response.read()
+    session = client.rest_client.rest_client.pool_manager
+    connector = session.connector
+    connection = next(iter(connector._conns.values()))[0][0]
+    sock = connection.transport.get_extra_info("socket")
+    nodelay = sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY)
+    await client.close()
+
+    # Verify
+    assert connector.limit == 5
+    assert connector.limit_per_host == 2
+    assert connector._keepalive_timeout == 30
+    assert nodelay == 0
+    assert session.closed
+
+
+@pytest.mark.asyncio
+async def test_connector_override_is_called_for_new_connections(server, cdp_api_client_factory):
+    """Test that aiohttp still creates connections through the method the connector overrides."""
+    # Setup
+    client = cdp_api_client_factory(server, transport_config=TransportConfig(tcp_nodelay=False))
+
+    # Execute
+    with patch.object(
+        _TCPConnector,
+        "_create_connection",
+        autospec=True,
+        side_effect=_TCPConnector._create_connection,
+    ) as create_connection:
+        response = await client.call_api("GET", f"{client.configuration.host}/v2/evm/accounts")
+        await response.read()
+    await client.close()
+
+    # Verify: an aiohttp upgrade that stops calling the private method fails here.
+    assert "_create_connection" in vars(aiohttp.TCPConnector)
+    assert create_connection.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_request_timeouts_per_call_class(ec_private_key_factory):
+    """Test that reads and writes get their own timeouts unless a timeout is passed."""
+    # Setup
+    client = CdpApiClient(
+        "test-key-id",
+        ec_private_key_factory(),
+        transport_config=TransportConfig(
+            read_timeout=TimeoutConfig(total=5, sock_read=2),
+            write_timeout=TimeoutConfig(total=30, connect=1),
+        ),
+    )
+    rest_client = client.rest_client.rest_client
+    rest_client.request = AsyncMock()
+    url = "https://api.cdp.coinbase.com/platform/v2/evm/accounts"
+
+    # Execute
+    await client.rest_client.request("GET", url)
+    await client.rest_client.request("POST", url, body={})
+    await client.rest_client.request("GET", url, _request_timeout=60)
+    await client.close()
+
+    # Verify
+    timeouts = [call.args[5] for call in rest_client.request.call_args_list]
+    assert timeouts[0] == aiohttp.ClientTimeout(total=5, sock_read=2)
+    assert timeouts[1] == aiohttp.ClientTimeout(total=30, connect=1)
+    assert timeouts[2] == 60
+
+
+def test_default_transport_config_matches_generated_client(ec_private_key_factory):
+    """Test that the default settings keep the pool size and timeout of the generated client."""
+    client = CdpApiClient("test-key-id", ec_private_key_factory())
+
+    config = client.rest_client.transport_config
+    assert config.limit == client.configuration.connection_pool_maxsize
+    assert config.get_timeout("POST") == aiohttp.ClientTimeout(total=5 * 60)
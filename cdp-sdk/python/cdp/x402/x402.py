@@ -2,7 +2,7 @@ import os
 from collections.abc import Callable
 from typing import TypedDict
 
-from cdp.auth.utils.http import GetAuthHeadersOptions, get_auth_headers
+from cdp.auth.utils.http import _get_auth_headers_with_credentials, _get_correlation_data
 
 COINBASE_FACILITATOR_BASE_URL = "https://api.cdp.coinbase.com"
 COINBASE_FACILITATOR_V2_ROUTE = "/platform/v2/x402"
@@ -37,6 +37,7 @@ def create_cdp_auth_headers(
 
     """
     request_host = COINBASE_FACILITATOR_BASE_URL.replace("https://", "")
+    correlation_context = _get_correlation_data("x402", X402_VERSION)
 
     async def _create_headers() -> dict[str, dict[str, str]]:
         # Use provided values or fall back to environment variables
@@ -48,28 +49,26 @@ def create_cdp_auth_headers(
                 "Missing API credentials: CDP_API_KEY_ID and CDP_API_KEY_SECRET must be provided or set as environment variables"
             )
 
-        verify_auth_headers = get_auth_headers(
-            GetAuthHeadersOptions(
-                api_key_id=final_api_key_id,
-                api_key_secret=final_api_key_secret,
-                request_host=request_host,
-                request_path=f"{COINBASE_FACILITATOR_V2_ROUTE}/verify",
-                request_method="POST",
-                source="x402",
-                source_version=X402_VERSION,
-            )
+        verify_auth_headers = _get_auth_headers_with_credentials(
+            final_api_key_id,
+            final_api_key_secret,
+            None,
+            None,
+            "POST",
+            request_host,
+            f"{COINBASE_FACILITATOR_V2_ROUTE}/verify",
+            correlation_context=correlation_context,
         )
 
-        settle_auth_headers = get_auth_headers(
-            GetAuthHeadersOptions(
-                api_key_id=final_api_key_id,
-                api_key_secret=final_api_key_secret,
-                request_host=request_host,
-                request_path=f"{COINBASE_FACILITATOR_V2_ROUTE}/settle",
-                request_method="POST",
-                source="x402",
-                source_version=X402_VERSION,
-            )
+        settle_auth_headers = _get_auth_headers_with_credentials(
+            final_api_key_id,
+            final_api_key_secret,
+            None,
+            None,
+            "POST",
+            request_host,
+            f"{COINBASE_FACILITATOR_V2_ROUTE}/settle",
+            correlation_context=correlation_context,
         )
 
         return {